@@ -15,10 +15,17 @@ Usage:
 """
 
 import argparse
+import hashlib
+import io
+import json
+import re
 import sys
+import urllib.error
 import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 # Source URLs for word lists
@@ -29,6 +36,124 @@ GUESSES_URL = "https://gist.githubusercontent.com/cfreshman/cdcdf777450c5b5301e4
 SOLUTIONS_BACKUP_URL = "https://raw.githubusercontent.com/tabatkins/wordle-list/main/words"
 GUESSES_BACKUP_URL = "https://raw.githubusercontent.com/tabatkins/wordle-list/main/more-words"
 
+# Local copies of downloaded lists, revalidated with conditional GETs
+HTTP_CACHE_DIR = Path(__file__).parent.parent / "data" / ".cache"
+
+# A valid Wordle word: exactly five lowercase ASCII letters
+VALID_WORD = re.compile(r'[a-z]{5}')
+
+# Write buffer for saved lists (large enough to hold a full list in one flush)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def read_words(response) -> List[str]:
+    """
+    Stream words from an HTTP response one line at a time.
+
+    Args:
+        response: Open response object from urllib.request.urlopen
+
+    Returns:
+        List of words (lowercase, stripped)
+    """
+    words = []
+    for line in io.TextIOWrapper(response, encoding='utf-8'):
+        word = line.strip().lower()
+        if word:
+            words.append(word)
+    return words
+
+
+def get_cache_paths(url: str) -> Tuple[Path, Path]:
+    """Get the (words, metadata) cache file paths for a URL."""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    return HTTP_CACHE_DIR / f"{key}.txt", HTTP_CACHE_DIR / f"{key}.json"
+
+
+def load_cached_response(url: str) -> Tuple[Optional[List[str]], Dict[str, str]]:
+    """
+    Load the cached copy of a URL and its validators.
+
+    Args:
+        url: URL the list was downloaded from
+
+    Returns:
+        Tuple of (cached_words or None, validators dict with 'etag'/'last_modified')
+    """
+    words_path, meta_path = get_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            validators = json.load(f)
+        with open(words_path, 'r', encoding='utf-8') as f:
+            words = f.read().split()
+        return words, validators
+    except Exception:
+        return None, {}
+
+
+def save_cached_response(url: str, words: List[str], headers) -> None:
+    """
+    Save a downloaded list with its ETag/Last-Modified validators.
+
+    Args:
+        url: URL the list was downloaded from
+        words: Downloaded words
+        headers: Response headers
+    """
+    validators = {}
+    if headers.get('ETag'):
+        validators['etag'] = headers['ETag']
+    if headers.get('Last-Modified'):
+        validators['last_modified'] = headers['Last-Modified']
+    if not validators:
+        return
+
+    words_path, meta_path = get_cache_paths(url)
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(words_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(words))
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(validators, f)
+    except Exception as e:
+        print(f"Warning: Could not cache {url}: {e}")
+
+
+def fetch_url(url: str) -> List[str]:
+    """
+    Fetch a word list, skipping the download if the cached copy is current.
+
+    Sends If-None-Match / If-Modified-Since from the previous response and
+    returns the cached words when the server answers 304 Not Modified.
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        List of words (lowercase, stripped)
+    """
+    cached_words, validators = load_cached_response(url)
+
+    request = urllib.request.Request(url)
+    if cached_words is not None:
+        if 'etag' in validators:
+            request.add_header('If-None-Match', validators['etag'])
+        if 'last_modified' in validators:
+            request.add_header('If-Modified-Since', validators['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            words = read_words(response)
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_words is not None:
+            print(f"Not modified, using cached copy of: {url}")
+            return cached_words
+        raise
+
+    save_cached_response(url, words, headers)
+    return words
+
 
 def fetch_word_list(url: str, backup_url: str = None) -> List[str]:
     """
@@ -43,19 +168,13 @@ def fetch_word_list(url: str, backup_url: str = None) -> List[str]:
     """
     try:
         print(f"Fetching from: {url}")
-        with urllib.request.urlopen(url, timeout=30) as response:
-            content = response.read().decode('utf-8')
-            words = [w.strip().lower() for w in content.splitlines() if w.strip()]
-            return words
+        return fetch_url(url)
     except Exception as e:
         print(f"Primary source failed: {e}")
         if backup_url:
             print(f"Trying backup: {backup_url}")
             try:
-                with urllib.request.urlopen(backup_url, timeout=30) as response:
-                    content = response.read().decode('utf-8')
-                    words = [w.strip().lower() for w in content.splitlines() if w.strip()]
-                    return words
+                return fetch_url(backup_url)
             except Exception as e2:
                 print(f"Backup source also failed: {e2}")
         return []
@@ -72,21 +191,17 @@ def validate_words(words: List[str], list_name: str) -> Tuple[List[str], List[st
     Returns:
         Tuple of (valid_words, invalid_words)
     """
-    valid = []
-    invalid = []
+    fullmatch = VALID_WORD.fullmatch
+    valid = [word for word in words if fullmatch(word)]
 
-    for word in words:
-        # Must be exactly 5 letters
-        if len(word) != 5:
-            invalid.append(f"{word} (length={len(word)})")
-            continue
-
-        # Must be alphabetic
-        if not word.isalpha():
-            invalid.append(f"{word} (non-alpha)")
-            continue
-
-        valid.append(word.lower())
+    # Only describe rejected words when there are any
+    invalid = []
+    if len(valid) != len(words):
+        for word in words:
+            if len(word) != 5:
+                invalid.append(f"{word} (length={len(word)})")
+            elif not fullmatch(word):
+                invalid.append(f"{word} (non-alpha)")
 
     print(f"{list_name}: {len(valid)} valid, {len(invalid)} invalid")
     if invalid and len(invalid) <= 10:
@@ -101,31 +216,36 @@ def remove_duplicates(solutions: List[str], guesses: List[str]) -> Tuple[List[st
     """
     Ensure no overlap between solution and guess-only lists.
 
-    Solutions should not appear in guess-only list.
+    Solutions should not appear in guess-only list. Both lists are
+    returned deduplicated and sorted, ready to be saved.
 
     Args:
         solutions: Solution word list
         guesses: Guess-only word list
 
     Returns:
-        Tuple of (solutions, filtered_guesses)
+        Tuple of (sorted_solutions, sorted_filtered_guesses)
     """
     solution_set = set(solutions)
-    filtered_guesses = [w for w in guesses if w not in solution_set]
+    guess_set = set(guesses) - solution_set
 
-    removed = len(guesses) - len(filtered_guesses)
+    removed = sum(1 for word in guesses if word in solution_set)
     if removed > 0:
         print(f"Removed {removed} duplicates from guess list")
 
-    return solutions, filtered_guesses
+    repeated = len(guesses) - removed - len(guess_set)
+    if repeated > 0:
+        print(f"Removed {repeated} repeated words within guess list")
+
+    return sorted(solution_set), sorted(guess_set)
 
 
 def save_word_list(words: List[str], filepath: Path) -> bool:
     """
-    Save word list to file (one word per line, sorted).
+    Save word list to file (one word per line).
 
     Args:
-        words: List of words to save
+        words: Sorted, deduplicated list of words to save
         filepath: Output file path
 
     Returns:
@@ -133,11 +253,10 @@ def save_word_list(words: List[str], filepath: Path) -> bool:
     """
     try:
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        sorted_words = sorted(set(words))
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(sorted_words))
+        with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write('\n'.join(words))
             f.write('\n')  # Trailing newline
-        print(f"Saved {len(sorted_words)} words to {filepath}")
+        print(f"Saved {len(words)} words to {filepath}")
         return True
     except Exception as e:
         print(f"Error saving to {filepath}: {e}")
@@ -155,21 +274,19 @@ def print_statistics(solutions: List[str], guesses: List[str]) -> None:
     print(f"Total valid words: {len(solutions) + len(guesses)}")
 
     # Letter frequency analysis for solutions
-    letter_freq = {}
-    pos_freq = {i: {} for i in range(5)}
-
-    for word in solutions:
-        for i, letter in enumerate(word):
-            letter_freq[letter] = letter_freq.get(letter, 0) + 1
-            pos_freq[i][letter] = pos_freq[i].get(letter, 0) + 1
+    # Words are validated to 5 letters, so position i of every word is the
+    # stride-5 slice of the concatenation starting at i
+    letters = ''.join(solutions)
+    letter_freq = Counter(letters)
+    pos_freq = [Counter(letters[i::5]) for i in range(5)]
 
     print("\nTop letters in solutions:")
-    top_letters = sorted(letter_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_letters = letter_freq.most_common(10)
     print("  " + ", ".join(f"{letter}:{cnt}" for letter, cnt in top_letters))
 
     print("\nTop letters by position:")
     for pos in range(5):
-        top = sorted(pos_freq[pos].items(), key=lambda x: x[1], reverse=True)[:5]
+        top = pos_freq[pos].most_common(5)
         print(f"  Position {pos+1}: " + ", ".join(f"{letter}:{cnt}" for letter, cnt in top))
 
 
@@ -209,12 +326,13 @@ def main():
     print("Fetching Wordle Word Lists")
     print("=" * 50)
 
-    # Fetch word lists
-    print("\n1. Fetching solution words...")
-    raw_solutions = fetch_word_list(SOLUTIONS_URL, SOLUTIONS_BACKUP_URL)
-
-    print("\n2. Fetching guess words...")
-    raw_guesses = fetch_word_list(GUESSES_URL, GUESSES_BACKUP_URL)
+    # Fetch both word lists concurrently (each fetch is network-bound)
+    print("\n1-2. Fetching solution and guess words...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        solutions_future = executor.submit(fetch_word_list, SOLUTIONS_URL, SOLUTIONS_BACKUP_URL)
+        guesses_future = executor.submit(fetch_word_list, GUESSES_URL, GUESSES_BACKUP_URL)
+        raw_solutions = solutions_future.result()
+        raw_guesses = guesses_future.result()
 
     if not raw_solutions:
         print("ERROR: Could not fetch solution words!")
@@ -11,42 +11,79 @@ V2.0 Index Schema:
 - word: the 5-letter word
 - p0-p4: letter at each position (for green letter matching)
 - letters: sorted unique letters in the word (for contains/excludes queries)
-- letter_counts: object with count of each letter (for min/max count constraints)
+- letters_mask: the same letter set as a 26-bit integer (a = bit 0)
+- lc_a-lc_z: count of each letter a-z, 0 if absent (for min/max count constraints)
 - freq: COCA frequency score (for ranking)
-- is_solution: boolean indicating if word can be a Wordle answer
+
+Whether a word can be a Wordle answer is carried by the index it lives in
+(wordlebot-solutions-v3 vs wordlebot-guesses-v3), not by a per-document field.
 
 Indices:
-- wordlebot-solutions: ~2,315 answer words
-- wordlebot-guesses: ~10,657 guess-only words
-- wordlebot-words-v2: Legacy combined index (optional)
+- wordlebot-solutions-v3: ~2,315 answer words
+- wordlebot-guesses-v3: ~10,657 guess-only words
+- wordlebot-words-v3: Legacy combined index (optional)
 """
 
 import argparse
 import csv
+import functools
+import json
+import os
+import pickle
+import re
+import string
 import subprocess
 import sys
-from collections import Counter
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
 
+# Required to migrate; main() exits without it. Document building does not
+# need the client, so the module can still be imported (e.g. by tests).
 try:
     from elasticsearch import Elasticsearch
-    from elasticsearch.helpers import bulk
+    from elasticsearch.helpers import parallel_bulk, streaming_bulk
+except ImportError:
+    Elasticsearch = None
+    parallel_bulk = None
+    streaming_bulk = None
+
+# Optional Vault API client (falls back to the vault CLI)
+try:
+    import hvac
 except ImportError:
-    print("Error: elasticsearch package not installed.")
-    print("Install with: pip install elasticsearch")
-    sys.exit(1)
+    hvac = None
 
 
 # Configuration
 ES_HOST = "https://elasticsearch.bwortman.us"
+VAULT_ADDR = os.environ.get("VAULT_ADDR", "https://vault.bwortman.us")
 VAULT_PATH = "secret/homelab/elasticsearch/api-keys"
 VAULT_KEY = "lab_es_api_key"
 
-# V2.0 Index names
-SOLUTIONS_INDEX = "wordlebot-solutions"
-GUESSES_INDEX = "wordlebot-guesses"
-LEGACY_INDEX = "wordlebot-words-v2"
+# Index names, versioned with the document schema (v3: lc_* letter count
+# fields and letters_mask) so older indices are not queried as if current
+SOLUTIONS_INDEX = "wordlebot-solutions-v3"
+GUESSES_INDEX = "wordlebot-guesses-v3"
+LEGACY_INDEX = "wordlebot-words-v3"
+
+# Index refresh interval once loading is finished (writes are rare)
+REFRESH_INTERVAL = "30s"
+
+# Bulk loading settings (docs are ~200 bytes, so batches can be large)
+BULK_CHUNK_SIZE = 5000
+BULK_MAX_BYTES = 10 * 1024 * 1024
+BULK_REQUEST_TIMEOUT = 120
+BULK_THREAD_COUNT = 4
+BULK_QUEUE_SIZE = 8
+
+# Pooled connections: one per bulk thread for each of the two migrations
+# that run concurrently by default
+ES_CONNECTIONS_PER_NODE = BULK_THREAD_COUNT * 2
+
+# Bulk action line for hand-built NDJSON bodies (index comes from the URL)
+BULK_ACTION_LINE = b'{"index":{}}\n'
 
 # Data file paths (relative to repo root)
 REPO_ROOT = Path(__file__).parent.parent
@@ -54,10 +91,58 @@ SOLUTIONS_FILE = REPO_ROOT / "data" / "wordle_solutions.txt"
 GUESSES_FILE = REPO_ROOT / "data" / "wordle_guesses.txt"
 LEGACY_WORDLIST_FILE = REPO_ROOT / "data" / "wordlist_fives.txt"
 COCA_FILE = REPO_ROOT / "data" / "coca_frequency.csv"
+COCA_CACHE_FILE = COCA_FILE.with_suffix(".pkl")
+
+# A valid Wordle word: exactly five lowercase ASCII letters
+VALID_WORD = re.compile(r'[a-z]{5}')
+
+# Bit for each letter in a 26-bit letter-set mask (a = bit 0)
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_lowercase)}
+
+# Per-letter count fields (lc_a..lc_z) and their all-zero defaults
+LETTER_COUNT_FIELDS = {letter: f"lc_{letter}" for letter in string.ascii_lowercase}
+ZERO_LETTER_COUNTS = dict.fromkeys(LETTER_COUNT_FIELDS.values(), 0)
+
+# Word-derived document fields, shared across all indices in a run
+WORD_FIELDS_CACHE: Dict[str, dict] = {}
 
+# Compact JSON encoder for pre-serializing bulk documents
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
+# Serializes output when the v2 and legacy migrations run concurrently
+PRINT_LOCK = threading.Lock()
+
+# Read buffer for data files (the COCA CSV fits in a single read)
+READ_BUFFER_SIZE = 1 << 20
+
+
+def log(*args, **kwargs) -> None:
+    """Print without interleaving lines from concurrent migrations."""
+    with PRINT_LOCK:
+        print(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key_from_vault() -> str:
-    """Retrieve Elasticsearch API key from Vault."""
+    """
+    Retrieve Elasticsearch API key from Vault (once per process).
+
+    Reads the secret over Vault's HTTP API with hvac when it is installed,
+    avoiding a vault CLI subprocess; falls back to the CLI otherwise.
+    """
+    if hvac is not None:
+        try:
+            client = hvac.Client(url=VAULT_ADDR, token=os.environ.get("VAULT_TOKEN"))
+            mount_point, _, path = VAULT_PATH.partition("/")
+            secret = client.secrets.kv.v2.read_secret_version(
+                path=path,
+                mount_point=mount_point,
+                raise_on_deleted_version=True
+            )
+            return secret["data"]["data"][VAULT_KEY]
+        except Exception as e:
+            print(f"Vault API lookup failed ({e}), trying vault CLI")
+
     try:
         result = subprocess.run(
             ["vault", "kv", "get", "-field", VAULT_KEY, VAULT_PATH],
@@ -72,124 +157,285 @@ def get_api_key_from_vault() -> str:
 
 
 def create_es_client(api_key: str) -> Elasticsearch:
-    """Create Elasticsearch client with API key authentication."""
+    """
+    Create Elasticsearch client with API key authentication.
+
+    The connection pool holds one keep-alive connection per bulk thread of
+    both concurrent migrations, so TLS handshakes happen once per
+    connection rather than per request. Request bodies are gzip-compressed.
+    """
     return Elasticsearch(
         ES_HOST,
         api_key=api_key,
         verify_certs=True,
         request_timeout=60,
         retry_on_timeout=True,
-        max_retries=3
+        max_retries=3,
+        http_compress=True,
+        connections_per_node=ES_CONNECTIONS_PER_NODE
     )
 
 
+def load_coca_cache() -> Optional[Dict[str, int]]:
+    """Load parsed COCA frequencies from the pickle sidecar if it is fresh."""
+    try:
+        if COCA_CACHE_FILE.stat().st_mtime < COCA_FILE.stat().st_mtime:
+            return None
+        with open(COCA_CACHE_FILE, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_coca_cache(frequencies: Dict[str, int]) -> None:
+    """Save parsed COCA frequencies to the pickle sidecar."""
+    try:
+        with open(COCA_CACHE_FILE, "wb") as f:
+            pickle.dump(frequencies, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Warning: Could not cache COCA data: {e}")
+
+
 def load_coca_frequencies() -> Dict[str, int]:
-    """Load COCA frequency data into a dictionary."""
+    """Load COCA frequency data into a dictionary (cached alongside the CSV)."""
+    cached = load_coca_cache()
+    if cached is not None:
+        return cached
+
     frequencies = {}
     try:
-        with open(COCA_FILE, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(COCA_FILE, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            word_index = header.index("lemma")
+            freq_index = header.index("freq")
             for row in reader:
-                word = row["lemma"].strip().lower()
+                word = row[word_index].strip().lower()
                 if len(word) == 5:
                     try:
-                        frequencies[word] = int(row["freq"])
-                    except (ValueError, KeyError):
+                        frequencies[word] = int(row[freq_index])
+                    except (ValueError, IndexError):
                         continue
     except Exception as e:
         print(f"Warning: Could not load COCA data: {e}")
+        return frequencies
+
+    save_coca_cache(frequencies)
     return frequencies
 
 
-def get_index_mapping(include_is_solution: bool = True) -> dict:
+def get_index_mapping() -> dict:
     """Get the optimized Elasticsearch mapping for Wordle queries."""
+    # Single-letter fields only need term matching: skip term frequencies,
+    # positions and norms, and build global ordinals up front
+    letter_field = {
+        "type": "keyword",
+        "index_options": "docs",
+        "norms": False,
+        "eager_global_ordinals": True
+    }
+
     properties = {
         # The word itself
         "word": {"type": "keyword"},
 
         # Individual letter positions (for green letter matching)
-        "p0": {"type": "keyword"},
-        "p1": {"type": "keyword"},
-        "p2": {"type": "keyword"},
-        "p3": {"type": "keyword"},
-        "p4": {"type": "keyword"},
+        "p0": dict(letter_field),
+        "p1": dict(letter_field),
+        "p2": dict(letter_field),
+        "p3": dict(letter_field),
+        "p4": dict(letter_field),
 
         # Sorted unique letters (for contains/must_not queries)
-        "letters": {"type": "keyword"},
+        "letters": dict(letter_field),
 
-        # Letter counts for each letter present (for min/max constraints)
-        "letter_counts": {
-            "type": "object",
-            "enabled": True
-        },
+        # Same letter set as a 26-bit mask (a = bit 0) for script filters
+        "letters_mask": {"type": "long", "index": False},
 
-        # COCA frequency for scoring/sorting
-        "freq": {"type": "long"}
-    }
+        # Letter counts as one fixed byte field per letter (for min/max
+        # range constraints); 26 fields regardless of the vocabulary
+        **{field: {"type": "byte"} for field in LETTER_COUNT_FIELDS.values()},
 
-    # V2.0: Add is_solution field
-    if include_is_solution:
-        properties["is_solution"] = {"type": "boolean"}
+        # COCA frequency for sorting only (doc values, no inverted index)
+        "freq": {"type": "long", "doc_values": True, "index": False}
+    }
 
     return {
-        "mappings": {"properties": properties},
+        "mappings": {
+            # Letter counts are only queried, never read back from hits
+            "_source": {"excludes": ["lc_*"]},
+            "properties": properties
+        },
         "settings": {
             "number_of_shards": 1,
             "number_of_replicas": 0,
-            "index": {"refresh_interval": "1s"}
+            "index": {
+                "codec": "best_compression",
+                # Created for a bulk load: load_words_to_index enables
+                # refresh (REFRESH_INTERVAL) once the documents are in
+                "refresh_interval": "-1"
+            }
         }
     }
 
 
-def create_index(es: Elasticsearch, index_name: str, include_is_solution: bool = True) -> None:
+def create_index(es: Elasticsearch, index_name: str) -> None:
     """Create or recreate an Elasticsearch index."""
-    mapping = get_index_mapping(include_is_solution)
+    mapping = get_index_mapping()
 
     if es.indices.exists(index=index_name):
-        print(f"  Deleting existing index: {index_name}")
+        log(f"  Deleting existing index: {index_name}")
         es.indices.delete(index=index_name)
 
-    print(f"  Creating index: {index_name}")
+    log(f"  Creating index: {index_name}")
     es.indices.create(index=index_name, body=mapping)
 
 
 def load_wordlist_file(filepath: Path) -> List[str]:
-    """Load words from a file."""
+    """Load words from a file, keeping only five-letter a-z words."""
     if not filepath.exists():
         return []
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        return [line.strip().lower() for line in f if line.strip() and len(line.strip()) == 5]
+    # Lists are small: read and split in one pass instead of line by line
+    text = filepath.read_text(encoding="utf-8").lower()
+    fullmatch = VALID_WORD.fullmatch
+    return [word for word in text.split() if fullmatch(word)]
+
+
+def get_word_fields(word: str) -> dict:
+    """
+    Get the fields of a word's document that depend only on the word.
+
+    Letter counts are only included for letters present in the word; the
+    zeros for absent letters come from the document template. Results are
+    cached in WORD_FIELDS_CACHE, so words loaded into more than one index
+    (e.g. the v2 indices and the legacy index) are processed once. The
+    returned dict is shared and must not be modified.
+    """
+    fields = WORD_FIELDS_CACHE.get(word)
+    if fields is not None:
+        return fields
+
+    bits = LETTER_BITS
+    mask = 0
+    for letter in word:
+        mask |= bits[letter]
+
+    # Walking set bits from lowest to highest yields letters already sorted
+    letters = []
+    remaining = mask
+    while remaining:
+        low_bit = remaining & -remaining
+        letters.append(chr(96 + low_bit.bit_length()))
+        remaining ^= low_bit
+
+    fields = {
+        "word": word,
+        "p0": word[0],
+        "p1": word[1],
+        "p2": word[2],
+        "p3": word[3],
+        "p4": word[4],
+        "letters": letters,
+        "letters_mask": mask
+    }
 
+    count_fields = LETTER_COUNT_FIELDS
+    for letter in letters:
+        fields[count_fields[letter]] = word.count(letter)
+
+    WORD_FIELDS_CACHE[word] = fields
+    return fields
+
+
+def get_doc_template() -> dict:
+    """Get the constant part of every document's _source (zero letter counts)."""
+    return dict(ZERO_LETTER_COUNTS)
+
+
+def generate_word_source(word: str, frequencies: Dict[str, int]) -> dict:
+    """Generate the _source body of an Elasticsearch document for a word."""
+    source = get_doc_template()
+    source.update(get_word_fields(word))
+    source["freq"] = frequencies.get(word, 0)
+    return source
 
-def generate_word_doc(
-    word: str,
-    frequencies: Dict[str, int],
-    index_name: str,
-    is_solution: Optional[bool] = None
-) -> dict:
-    """Generate an Elasticsearch document for a word."""
-    letter_counts = dict(Counter(word))
 
-    doc = {
+def generate_word_doc(word: str, frequencies: Dict[str, int], index_name: str) -> dict:
+    """Generate an Elasticsearch document for a word (not used by the bulk path)."""
+    return {
         "_index": index_name,
-        "_source": {
-            "word": word,
-            "p0": word[0],
-            "p1": word[1],
-            "p2": word[2],
-            "p3": word[3],
-            "p4": word[4],
-            "letters": sorted(set(word)),
-            "letter_counts": letter_counts,
-            "freq": frequencies.get(word, 0)
-        }
+        "_source": generate_word_source(word, frequencies)
     }
 
-    if is_solution is not None:
-        doc["_source"]["is_solution"] = is_solution
 
-    return doc
+def iter_ndjson_chunks(docs: Iterable[str]) -> Generator[bytes, None, None]:
+    """
+    Frame pre-encoded documents into NDJSON bulk request bodies.
+
+    Each document becomes an "index" action line (the target index is passed
+    on the request URL) followed by its source line. Bodies hold at most
+    BULK_CHUNK_SIZE documents and BULK_MAX_BYTES bytes.
+    """
+    buf = bytearray()
+    count = 0
+    for doc in docs:
+        line = doc.encode("utf-8")
+        if count and (
+            count >= BULK_CHUNK_SIZE
+            or len(buf) + len(BULK_ACTION_LINE) + len(line) + 1 > BULK_MAX_BYTES
+        ):
+            yield bytes(buf)
+            buf.clear()
+            count = 0
+        buf += BULK_ACTION_LINE
+        buf += line
+        buf += b"\n"
+        count += 1
+    if count:
+        yield bytes(buf)
+
+
+def send_ndjson_chunk(
+    client: Elasticsearch, index_name: str, body: bytes
+) -> List[Tuple[bool, dict]]:
+    """
+    POST one NDJSON bulk body and report the outcome of each item.
+
+    Returns:
+        (ok, item) pairs in the same shape the bulk helpers yield
+    """
+    response = client.bulk(index=index_name, operations=body, refresh=False)
+    results = []
+    for item in response["items"]:
+        result = item["index"]
+        ok = "error" not in result and 200 <= result.get("status", 500) < 300
+        if not ok:
+            log(f"  Failed to index {result.get('_id')}: {result.get('error')}")
+        results.append((ok, item))
+    return results
+
+
+def bulk_ndjson(
+    client: Elasticsearch,
+    index_name: str,
+    docs: Iterable[str],
+    serial: bool = False
+) -> Generator[Tuple[bool, dict], None, None]:
+    """
+    Index pre-encoded documents with hand-built NDJSON bulk requests.
+
+    Bodies are sent from BULK_THREAD_COUNT threads unless serial is set.
+    """
+    chunks = iter_ndjson_chunks(docs)
+    send = functools.partial(send_ndjson_chunk, client, index_name)
+    if serial:
+        for body in chunks:
+            yield from send(body)
+        return
+    with ThreadPoolExecutor(max_workers=BULK_THREAD_COUNT) as executor:
+        for results in executor.map(send, chunks):
+            yield from results
 
 
 def load_words_to_index(
@@ -197,15 +443,73 @@ def load_words_to_index(
     words: List[str],
     frequencies: Dict[str, int],
     index_name: str,
-    is_solution: Optional[bool] = None
+    serial: bool = False,
+    use_helpers: bool = False
 ) -> int:
-    """Load words into an Elasticsearch index."""
+    """
+    Load words into an Elasticsearch index.
+
+    Bulk requests are sent from BULK_THREAD_COUNT threads sharing one client.
+    If the client itself becomes the bottleneck, pass serial=True (--serial)
+    to send one request at a time instead.
+
+    Request bodies are assembled here as NDJSON bytes and posted directly;
+    use_helpers=True (--use-helpers) goes through the elasticsearch-py bulk
+    helpers instead.
+    """
+    # Zero letter counts are the same for every document, so build them
+    # once and copy per word
+    template = get_doc_template()
+
+    # Resolve all frequencies up front, aligned with words
+    get_freq = frequencies.get
+    freqs = [get_freq(word, 0) for word in words]
+
+    def generate_actions() -> Generator[str, None, None]:
+        # Documents are fixed-shape, so serialize them here; both bulk paths
+        # treat pre-encoded strings as "index" actions.
+        # Globals are bound to locals once rather than once per word.
+        new_source = template.copy
+        word_fields = get_word_fields
+        encode = JSON_ENCODER.encode
+        for word, freq in zip(words, freqs):
+            source = new_source()
+            source.update(word_fields(word))
+            source["freq"] = freq
+            yield encode(source)
+
+    # Indices are created with refresh disabled; it is turned on afterwards
+    client = es.options(request_timeout=BULK_REQUEST_TIMEOUT)
+    if use_helpers:
+        bulk_options = {
+            "index": index_name,
+            "chunk_size": BULK_CHUNK_SIZE,
+            "max_chunk_bytes": BULK_MAX_BYTES,
+        }
+        if serial:
+            results = streaming_bulk(client, generate_actions(), **bulk_options)
+        else:
+            results = parallel_bulk(
+                client,
+                generate_actions(),
+                thread_count=BULK_THREAD_COUNT,
+                queue_size=BULK_QUEUE_SIZE,
+                **bulk_options
+            )
+    else:
+        results = bulk_ndjson(client, index_name, generate_actions(), serial)
 
-    def generate_actions() -> Generator[dict, None, None]:
-        for word in words:
-            yield generate_word_doc(word, frequencies, index_name, is_solution)
+    success = 0
+    try:
+        for ok, _ in results:
+            if ok:
+                success += 1
+    finally:
+        es.indices.put_settings(
+            index=index_name, body={"index": {"refresh_interval": REFRESH_INTERVAL}}
+        )
 
-    success, failed = bulk(es, generate_actions(), stats_only=True, chunk_size=500)
+    es.indices.forcemerge(index=index_name, max_num_segments=1)
     return success
 
 
@@ -213,84 +517,105 @@ def verify_index(es: Elasticsearch, index_name: str) -> None:
     """Verify an index and show sample data."""
     es.indices.refresh(index=index_name)
     count = es.count(index=index_name)["count"]
-    print(f"  {index_name}: {count} documents")
+    log(f"  {index_name}: {count} documents")
 
     # Sample query
     result = es.search(
         index=index_name,
-        body={"query": {"match_all": {}}, "size": 3, "sort": [{"freq": "desc"}]}
+        body={
+            "query": {"match_all": {}},
+            "size": 3,
+            "sort": [{"freq": "desc"}],
+            "_source": ["word", "freq"],
+            "track_total_hits": False
+        }
     )
-    print("  Sample words:")
+    log("  Sample words:")
     for hit in result["hits"]["hits"]:
         src = hit["_source"]
-        print(f"    - {src['word']}: freq={src['freq']}")
+        log(f"    - {src['word']}: freq={src['freq']}")
 
 
-def migrate_v2_separate(es: Elasticsearch, frequencies: Dict[str, int]) -> None:
+def migrate_v2_separate(
+    es: Elasticsearch, frequencies: Dict[str, int], serial: bool = False,
+    use_helpers: bool = False
+) -> None:
     """V2.0: Migrate to separate solutions and guesses indices."""
-    print("\nV2.0 Migration: Separate Solutions and Guesses Indices")
-    print("-" * 55)
+    log("\nV2.0 Migration: Separate Solutions and Guesses Indices")
+    log("-" * 55)
 
     # Load word lists
-    print("\nLoading word lists...")
+    log("\nLoading word lists...")
     solutions = load_wordlist_file(SOLUTIONS_FILE)
     guesses = load_wordlist_file(GUESSES_FILE)
 
     if not solutions:
-        print(f"  ERROR: Solutions file not found: {SOLUTIONS_FILE}")
-        print("  Run: python scripts/fetch_wordle_lists.py")
+        log(f"  ERROR: Solutions file not found: {SOLUTIONS_FILE}")
+        log("  Run: python scripts/fetch_wordle_lists.py")
         return
 
-    print(f"  Solutions: {len(solutions)} words from {SOLUTIONS_FILE}")
-    print(f"  Guesses: {len(guesses)} words from {GUESSES_FILE}")
+    log(f"  Solutions: {len(solutions)} words from {SOLUTIONS_FILE}")
+    log(f"  Guesses: {len(guesses)} words from {GUESSES_FILE}")
 
     # Create solutions index
-    print("\nCreating solutions index...")
-    create_index(es, SOLUTIONS_INDEX, include_is_solution=True)
+    log("\nCreating solutions index...")
+    create_index(es, SOLUTIONS_INDEX)
 
-    print("Loading solutions...")
-    success = load_words_to_index(es, solutions, frequencies, SOLUTIONS_INDEX, is_solution=True)
-    print(f"  Loaded {success} solution words")
+    log("Loading solutions...")
+    success = load_words_to_index(
+        es, solutions, frequencies, SOLUTIONS_INDEX,
+        serial=serial, use_helpers=use_helpers
+    )
+    log(f"  Loaded {success} solution words")
 
     # Create guesses index
-    print("\nCreating guesses index...")
-    create_index(es, GUESSES_INDEX, include_is_solution=True)
+    log("\nCreating guesses index...")
+    create_index(es, GUESSES_INDEX)
 
-    print("Loading guesses...")
-    success = load_words_to_index(es, guesses, frequencies, GUESSES_INDEX, is_solution=False)
-    print(f"  Loaded {success} guess-only words")
+    log("Loading guesses...")
+    success = load_words_to_index(
+        es, guesses, frequencies, GUESSES_INDEX,
+        serial=serial, use_helpers=use_helpers
+    )
+    log(f"  Loaded {success} guess-only words")
 
     # Verify
-    print("\nVerification:")
+    log("\nVerification:")
     verify_index(es, SOLUTIONS_INDEX)
     verify_index(es, GUESSES_INDEX)
 
 
-def migrate_legacy(es: Elasticsearch, frequencies: Dict[str, int]) -> None:
+def migrate_legacy(
+    es: Elasticsearch, frequencies: Dict[str, int], serial: bool = False,
+    use_helpers: bool = False
+) -> None:
     """Migrate legacy combined index (backward compatibility)."""
-    print("\nLegacy Migration: Combined Index")
-    print("-" * 35)
+    log("\nLegacy Migration: Combined Index")
+    log("-" * 35)
 
     # Load words from legacy file
-    print(f"\nLoading words from {LEGACY_WORDLIST_FILE}...")
+    log(f"\nLoading words from {LEGACY_WORDLIST_FILE}...")
     words = load_wordlist_file(LEGACY_WORDLIST_FILE)
 
     if not words:
-        print(f"  WARNING: Legacy wordlist not found: {LEGACY_WORDLIST_FILE}")
+        log(f"  WARNING: Legacy wordlist not found: {LEGACY_WORDLIST_FILE}")
         return
 
-    print(f"  Found {len(words)} words")
+    log(f"  Found {len(words)} words")
 
     # Create legacy index
-    print("\nCreating legacy index...")
-    create_index(es, LEGACY_INDEX, include_is_solution=False)
+    log("\nCreating legacy index...")
+    create_index(es, LEGACY_INDEX)
 
-    print("Loading words...")
-    success = load_words_to_index(es, words, frequencies, LEGACY_INDEX, is_solution=None)
-    print(f"  Loaded {success} words")
+    log("Loading words...")
+    success = load_words_to_index(
+        es, words, frequencies, LEGACY_INDEX,
+        serial=serial, use_helpers=use_helpers
+    )
+    log(f"  Loaded {success} words")
 
     # Verify
-    print("\nVerification:")
+    log("\nVerification:")
     verify_index(es, LEGACY_INDEX)
 
 
@@ -300,24 +625,21 @@ def demo_queries(es: Elasticsearch) -> None:
     print("V2.0 Query Demonstrations")
     print("=" * 55)
 
-    # Demo 1: Query solutions only
-    print("\nDemo 1: Top 5 solution words by frequency")
-    result = es.search(
-        index=SOLUTIONS_INDEX,
-        body={
+    # All three demos go out in one msearch request; responses come back
+    # in the same order as the searches
+    searches = [
+        # Demo 1: Query solutions only
+        {"index": SOLUTIONS_INDEX},
+        {
             "query": {"match_all": {}},
             "size": 5,
-            "sort": [{"freq": "desc"}]
-        }
-    )
-    for hit in result["hits"]["hits"]:
-        print(f"  - {hit['_source']['word']} (freq={hit['_source']['freq']})")
-
-    # Demo 2: Wordle-style query on solutions
-    print("\nDemo 2: Solutions starting with 's', containing 'e' (top 5)")
-    result = es.search(
-        index=SOLUTIONS_INDEX,
-        body={
+            "sort": [{"freq": "desc"}],
+            "_source": ["word", "freq"],
+            "track_total_hits": False
+        },
+        # Demo 2: Wordle-style query on solutions
+        {"index": SOLUTIONS_INDEX},
+        {
             "query": {
                 "bool": {
                     "must": [
@@ -327,25 +649,34 @@ def demo_queries(es: Elasticsearch) -> None:
                 }
             },
             "size": 5,
-            "sort": [{"freq": "desc"}]
-        }
-    )
-    for hit in result["hits"]["hits"]:
+            "sort": [{"freq": "desc"}],
+            "_source": ["word", "freq"],
+            "track_total_hits": False
+        },
+        # Demo 3: Cross-index search
+        {"index": f"{SOLUTIONS_INDEX},{GUESSES_INDEX}"},
+        {
+            "query": {"term": {"letters": "q"}},
+            "size": 10,
+            "sort": [{"freq": "desc"}],
+            "_source": ["word"],
+            "track_total_hits": False
+        },
+    ]
+    top_solutions, s_with_e, with_q = es.msearch(body=searches)["responses"]
+
+    print("\nDemo 1: Top 5 solution words by frequency")
+    for hit in top_solutions["hits"]["hits"]:
+        print(f"  - {hit['_source']['word']} (freq={hit['_source']['freq']})")
+
+    print("\nDemo 2: Solutions starting with 's', containing 'e' (top 5)")
+    for hit in s_with_e["hits"]["hits"]:
         print(f"  - {hit['_source']['word']}")
 
-    # Demo 3: Cross-index search
     print("\nDemo 3: All words (solutions + guesses) with 'q' (rare letter)")
-    result = es.search(
-        index=f"{SOLUTIONS_INDEX},{GUESSES_INDEX}",
-        body={
-            "query": {"term": {"letters": "q"}},
-            "size": 10,
-            "sort": [{"freq": "desc"}]
-        }
-    )
-    for hit in result["hits"]["hits"]:
-        is_sol = hit["_source"].get("is_solution", "?")
-        marker = "[SOL]" if is_sol else "[GUESS]"
+    for hit in with_q["hits"]["hits"]:
+        # The index a hit came from says whether it is a solution
+        marker = "[SOL]" if hit["_index"] == SOLUTIONS_INDEX else "[GUESS]"
         print(f"  - {hit['_source']['word']} {marker}")
 
 
@@ -368,8 +699,23 @@ def main():
         action="store_true",
         help="Skip query demonstrations"
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Send bulk requests one at a time and run migrations sequentially"
+    )
+    parser.add_argument(
+        "--use-helpers",
+        action="store_true",
+        help="Index through the elasticsearch-py bulk helpers"
+    )
     args = parser.parse_args()
 
+    if Elasticsearch is None:
+        print("Error: elasticsearch package not installed.")
+        print("Install with: pip install elasticsearch")
+        sys.exit(1)
+
     print("Wordlebot v2.0 - Elasticsearch Migration")
     print("=" * 45)
 
@@ -394,13 +740,24 @@ def main():
 
     # Migrate based on arguments
     if args.legacy_only:
-        migrate_legacy(es, frequencies)
+        migrate_legacy(es, frequencies, serial=args.serial, use_helpers=args.use_helpers)
     elif args.v2_only:
-        migrate_v2_separate(es, frequencies)
+        migrate_v2_separate(es, frequencies, serial=args.serial, use_helpers=args.use_helpers)
+    elif args.serial:
+        migrate_v2_separate(es, frequencies, serial=True, use_helpers=args.use_helpers)
+        migrate_legacy(es, frequencies, serial=True, use_helpers=args.use_helpers)
     else:
-        # Default: migrate both
-        migrate_v2_separate(es, frequencies)
-        migrate_legacy(es, frequencies)
+        # Default: migrate both, overlapping their (I/O-bound) bulk loads.
+        # The client is thread-safe; output is serialized through log().
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            v2_future = executor.submit(
+                migrate_v2_separate, es, frequencies, use_helpers=args.use_helpers
+            )
+            legacy_future = executor.submit(
+                migrate_legacy, es, frequencies, use_helpers=args.use_helpers
+            )
+            v2_future.result()
+            legacy_future.result()
 
     # Demo queries
     if not args.skip_demo and not args.legacy_only:
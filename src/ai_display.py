@@ -6,8 +6,10 @@ Follows existing Wordlebot display patterns and respects terminal width configur
 
 Integration: To be called from main() when AI mode is enabled (Group 6).
 """
+import io
 import shutil
 import textwrap
+import threading
 from typing import Any, Dict, List, Optional
 
 
@@ -42,6 +44,12 @@ def get_terminal_width(config: Dict[str, Any]) -> int:
         return config.get('display', {}).get('default_terminal_width', 80)
 
 
+# Shared wrapper for wrap_text; width and indents are set per call under
+# the lock, since TextWrapper carries them as instance state
+_WRAPPER = textwrap.TextWrapper(break_long_words=False, break_on_hyphens=False)
+_WRAPPER_LOCK = threading.Lock()
+
+
 def wrap_text(text: str, width: int, indent: int = 0) -> str:
     """
     Wrap text to fit within terminal width with optional indentation.
@@ -54,14 +62,12 @@ def wrap_text(text: str, width: int, indent: int = 0) -> str:
     Returns:
         Wrapped text with indentation
     """
-    wrapper = textwrap.TextWrapper(
-        width=width,
-        initial_indent=' ' * indent,
-        subsequent_indent=' ' * indent,
-        break_long_words=False,
-        break_on_hyphens=False,
-    )
-    return wrapper.fill(text)
+    prefix = ' ' * indent
+    with _WRAPPER_LOCK:
+        _WRAPPER.width = width
+        _WRAPPER.initial_indent = prefix
+        _WRAPPER.subsequent_indent = prefix
+        return _WRAPPER.fill(text)
 
 
 def format_alternatives_table(
@@ -203,61 +209,45 @@ def display_ai_recommendation_verbose(
     """
     terminal_width = get_terminal_width(config)
 
-    # Build comprehensive output
-    output_lines = [
-        "",
-        "=" * min(70, terminal_width),
-        "AI RECOMMENDATION (VERBOSE MODE)",
-        "=" * min(70, terminal_width),
-        "",
-    ]
+    # Section rules are reused throughout, so build them once per call
+    banner = "=" * min(70, terminal_width)
+    rule = "-" * min(40, terminal_width)
+
+    # Build comprehensive output, writing lines straight into one buffer
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\n{banner}\nAI RECOMMENDATION (VERBOSE MODE)\n{banner}\n\n")
 
-    # Recommended word and info gain (prominent display with highlighting)
+    # Recommended word and info gain (prominent display with highlighting).
+    # Colors.HIGHLIGHT is a precombined class constant, so only the word
+    # itself is formatted here.
     highlighted_word = f"{Colors.HIGHLIGHT}{word.upper()}{Colors.RESET}"
-    output_lines.extend([
-        f"RECOMMENDED GUESS: {highlighted_word}",
-        f"Information Gain: {info_gain:.2f} bits",
-        "",
-    ])
+    w(f"RECOMMENDED GUESS: {highlighted_word}\n")
+    w(f"Information Gain: {info_gain:.2f} bits\n\n")
 
     # Strategic reasoning section
-    output_lines.extend([
-        "STRATEGIC REASONING:",
-        "-" * min(40, terminal_width),
-    ])
+    w(f"STRATEGIC REASONING:\n{rule}\n")
 
     # Wrap reasoning text to fit terminal width
-    reasoning_wrapped = wrap_text(reasoning, terminal_width - 2, indent=2)
-    output_lines.append(reasoning_wrapped)
-    output_lines.append("")
+    w(wrap_text(reasoning, terminal_width - 2, indent=2))
+    w("\n\n")
 
     # Alternatives section
     if alternatives:
-        output_lines.extend([
-            "ALTERNATIVE CONSIDERATIONS:",
-            "-" * min(40, terminal_width),
-        ])
-        alternatives_table = format_alternatives_table(alternatives, terminal_width)
-        output_lines.append(alternatives_table)
-        output_lines.append("")
+        w(f"ALTERNATIVE CONSIDERATIONS:\n{rule}\n")
+        w(format_alternatives_table(alternatives, terminal_width))
+        w("\n\n")
 
     # Metrics section (excluding partition details)
     if metrics:
-        output_lines.extend([
-            "DETAILED METRICS:",
-            "-" * min(40, terminal_width),
-        ])
-        metrics_section = format_metrics_section(metrics, terminal_width)
-        output_lines.append(metrics_section)
-        output_lines.append("")
+        w(f"DETAILED METRICS:\n{rule}\n")
+        w(format_metrics_section(metrics, terminal_width))
+        w("\n\n")
 
     # Footer
-    output_lines.extend([
-        "=" * min(70, terminal_width),
-        "",
-    ])
+    w(f"{banner}\n")
 
-    return '\n'.join(output_lines)
+    return buf.getvalue()
 
 
 def display_ai_summary(
@@ -283,22 +273,19 @@ def display_ai_summary(
         Formatted summary string
     """
     terminal_width = get_terminal_width(config)
-
-    output_lines = [
-        "",
-        "=" * min(60, terminal_width),
-        "AI PERFORMANCE SUMMARY",
-        "=" * min(60, terminal_width),
-        f"  Total guesses: {total_guesses}",
-        f"  API calls: {api_call_count}",
-        f"  Estimated cost: ${total_cost:.4f}",
-        f"  Avg API response time: {avg_response_time:.2f}s",
-        f"  Total solving time: {total_solving_time:.1f}s",
-        "=" * min(60, terminal_width),
-        "",
-    ]
-
-    return '\n'.join(output_lines)
+    banner = "=" * min(60, terminal_width)
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\n{banner}\nAI PERFORMANCE SUMMARY\n{banner}\n")
+    w(f"  Total guesses: {total_guesses}\n")
+    w(f"  API calls: {api_call_count}\n")
+    w(f"  Estimated cost: ${total_cost:.4f}\n")
+    w(f"  Avg API response time: {avg_response_time:.2f}s\n")
+    w(f"  Total solving time: {total_solving_time:.1f}s\n")
+    w(f"{banner}\n")
+
+    return buf.getvalue()
 
 
 def display_ai_recommendation(
@@ -5,14 +5,186 @@ Integrates Claude API for strategic decision-making in Wordle solving.
 Handles game state serialization, prompt engineering, API communication,
 retry logic with exponential backoff, and response parsing.
 """
+import asyncio
+import hashlib
+import heapq
 import json
 import os
+import queue
+import random
+import re
+import threading
 import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from anthropic import Anthropic, RateLimitError, APIError
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIError,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    RateLimitError,
+)
 from dotenv import load_dotenv
 
+# Optional faster JSON decoder for API responses (its JSONDecodeError
+# subclasses json.JSONDecodeError, so error handling is the same)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# HTTP/2 lets concurrent requests share one connection; httpx only
+# supports it when the optional h2 package is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Bump when prompt wording or response parsing changes, so cached
+# recommendations from older prompts are not reused
+PROMPT_VERSION = 3
+
+# Client errors worth retrying: request timeout, conflict and rate limit.
+# Any other 4xx (bad request, auth, unknown model) fails the same way again.
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 409, 429})
+
+# Static instructions shared by every recommendation request. Sent as the
+# system prompt and marked for Anthropic prompt caching, so repeat calls
+# read it from the cache instead of re-processing it; only the game state
+# in the user message changes between calls.
+RECOMMEND_SYSTEM_PROMPT = """You are a strategic Wordle assistant helping to select the optimal guess.
+
+Each request describes a Wordle decision: the game state, a strategy mode,
+and words scored by information gain (higher = more information revealed).
+
+Strategy modes:
+- aggressive: Minimize average guess count (optimize for typical cases)
+- safe: Minimize worst-case scenarios (avoid risky guesses)
+- balanced: Compromise between average and worst-case
+
+When INSIGHT MODE is enabled:
+- You may recommend words marked [INSIGHT] that CANNOT be the answer
+- These "insight words" are strategically valuable because they reveal more information
+- Consider: Is the extra information worth using a guess that can't win?
+- Generally prefer insight words when many candidates remain (>10)
+- Prefer valid candidates when few candidates remain (<5)
+
+Your task:
+1. Analyze the game state and remaining candidates
+2. Consider the information gain scores
+3. Apply the requested strategy mode to select the best guess
+4. Provide strategic reasoning for your choice
+
+Respond ONLY with valid JSON in this exact format:
+{
+  "word": "selected_word",
+  "reasoning": "Brief explanation of why this word is optimal for the strategy",
+  "info_gain": 5.2,
+  "is_insight_word": false,
+  "alternatives": [
+    {"word": "alternative1", "info_gain": 5.1, "note": "Why this was close"},
+    {"word": "alternative2", "info_gain": 5.0, "note": "Another consideration"}
+  ]
+}
+
+When a request contains several numbered decisions, treat each one
+separately and respond with {"decisions": [...]} holding one object in the
+format above per decision, plus an "id" field with the decision's number.
+
+Important: Your response must be valid JSON only, no additional text."""
+
+# Per-decision user prompt pieces, filled in by _format_decision_context()
+DECISION_CONTEXT_TEMPLATE = """Game State (Guess #{guess_number}):
+- Pattern: {pattern} (. = unknown, letters = confirmed positions)
+- Known letters (in word, positions to avoid): {known_letters}
+- Bad letters (not in word): {bad_letters}
+- Minimum letter counts: {min_letter_counts}
+
+Strategy Mode: {strategy_mode}
+{insight_instructions}
+{words_section}"""
+
+CANDIDATE_WORDS_TEMPLATE = """Remaining Candidates with Information Gain Scores{shown}:
+{words_with_scores}"""
+
+INSIGHT_WORDS_TEMPLATE = """Top Suggestions by Information Gain (insight mode):
+{words_with_scores}
+
+Valid Candidates (can be the answer){shown}:
+{candidates}"""
+
+# Appended to a word list header when only the best words are listed
+SHOWN_NOTE_TEMPLATE = " (showing top {shown} of {total} remaining)"
+
+# User prompt for a single recommendation (filled in by generate_prompt())
+RECOMMEND_PROMPT_TEMPLATE = """{context}
+
+Select the best guess for the {strategy_mode} strategy and respond with the JSON object described in your instructions."""
+
+# User prompt for several recommendations (filled in by generate_batch_prompt())
+BATCH_DECISION_TEMPLATE = """=== Decision {index} ===
+{context}"""
+
+BATCH_PROMPT_TEMPLATE = """Below are {count} independent Wordle decisions, numbered from 0.
+
+{decisions}
+
+Respond with the JSON "decisions" array described in your instructions, one entry per decision."""
+
+# Tie-break prompt (filled in by break_tie()), ending with one of the
+# reply formats below
+TIEBREAK_PROMPT_TEMPLATE = """You are breaking a tie between equally-scored Wordle guesses.
+
+Game State:
+- Pattern: {pattern}
+- Known letters: {known_letters}
+- Bad letters: {bad_letters}
+
+Strategy Mode: {strategy_mode}
+
+Tied Words (identical information gain):
+{tied_words}
+{coca_info}
+
+Select the best word considering:
+1. Letter commonality and word frequency
+2. Strategic positioning for the {strategy_mode} strategy
+3. Likelihood of narrowing to the solution
+{reply_format}"""
+
+TIEBREAK_JSON_REPLY = """
+Respond ONLY with valid JSON:
+{"word": "selected_word", "reasoning": "Why this word breaks the tie"}
+"""
+
+TIEBREAK_WORD_REPLY = "\nReply with only the chosen word, nothing else.\n"
+
+INSIGHT_MARKER = " [INSIGHT - not a valid answer]"
+
+# Output budget for a terse tie-break reply (a single word)
+TIEBREAK_MAX_TOKENS = 32
+
+# A recommended word: five ASCII letters
+WORD_PATTERN = re.compile(r'[A-Za-z]{5}')
+
+# The response's "word" field, matched as soon as its closing quote streams in
+# (the format puts it first, ahead of the alternatives' own "word" fields)
+WORD_FIELD_PATTERN = re.compile(r'"word"\s*:\s*"([A-Za-z]{5})"')
+
+RECOMMEND_SYSTEM = [
+    {
+        "type": "text",
+        "text": RECOMMEND_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
 
 class ClaudeStrategy:
     """
@@ -45,8 +217,15 @@ class ClaudeStrategy:
 
         self.model = os.getenv('CLAUDE_MODEL', 'claude-3-5-sonnet-20241022')
 
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=api_key)
+        # Tie-breaks need little reasoning, so they go to a faster, cheaper model
+        self.tiebreak_model = os.getenv('CLAUDE_TIEBREAK_MODEL', 'claude-3-5-haiku-20241022')
+
+        # Initialize Anthropic client on a pooled HTTP client that is kept
+        # alive across calls (the async client is created on first use)
+        self._http = DefaultHttpxClient(http2=HTTP2_AVAILABLE)
+        self.client = Anthropic(api_key=api_key, http_client=self._http)
+        self._api_key = api_key
+        self._aclient: Optional[AsyncAnthropic] = None
 
         # Store configuration
         self.config = config
@@ -57,18 +236,73 @@ class ClaudeStrategy:
         self.max_retries = self.api_config.get('max_retries', 3)
         self.timeout = self.api_config.get('timeout_seconds', 30)
         self.backoff_base = self.api_config.get('exponential_backoff_base', 2)
+        self.max_backoff = self.api_config.get('max_backoff_seconds', 60)
+        self.max_batch_size = self.api_config.get('max_batch_size', 8)
+        self.max_concurrent = self.api_config.get('max_concurrent', 8)
+
+        # Message Batches API settings (offline bulk evaluation)
+        self.use_batch_api = self.api_config.get('use_batch', False)
+        self.batch_poll_interval = self.api_config.get('batch_poll_seconds', 30)
+        self.batch_timeout = self.api_config.get('batch_timeout_seconds', 24 * 60 * 60)
+        self.batch_cancel_wait = self.api_config.get('batch_cancel_wait_seconds', 600)
+
+        # Tie-breaks only need the word; ask for reasoning only when enabled
+        self.verbose_tiebreak = self.ai_config.get('verbose_tiebreak', False)
+
+        # Skip the API when one guess leads the rest by more than this many
+        # bits of information gain (None disables the shortcut)
+        self.confident_margin = self.ai_config.get('confident_margin', 1.5)
+
+        # Only the highest-scoring words are listed in prompts
+        self.prompt_top_k = self.ai_config.get('prompt_top_k', 15)
+
+        # Recommendation cache: in-memory LRU keyed by prompt, optionally
+        # persisted to a JSON file between sessions
+        cache_config = self.ai_config.get('cache', {})
+        self.recommendation_cache_size = cache_config.get('max_recommendations', 1024)
+        cache_file = cache_config.get('recommendations_file')
+        self.recommendation_cache_file = Path(cache_file).expanduser() if cache_file else None
+        self._recommendation_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        # Streamed recommendations are stored from a background thread
+        self._cache_lock = threading.Lock()
+        self._load_recommendation_cache()
 
         # Performance logger integration
         self.performance_logger = performance_logger
 
-        # Metrics tracking
+        # Metrics tracking (updated from streaming threads as well, so every
+        # update goes through _count() or holds _metrics_lock)
+        self._metrics_lock = threading.Lock()
         self.metrics = {
             'api_calls': 0,
             'total_tokens': 0,
             'total_duration': 0.0,
             'retry_count': 0,
+            'cache_hits': 0,
+            'cache_read_tokens': 0,
+            'fast_path_skips': 0,
         }
 
+    @property
+    def aclient(self) -> AsyncAnthropic:
+        """Async Anthropic client, created on first use."""
+        if self._aclient is None:
+            self._aclient = AsyncAnthropic(
+                api_key=self._api_key,
+                http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE),
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        """Close the HTTP connections held by the sync client."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections held by the async client, if created."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+
     def format_game_state(self, wordlebot: Any) -> Dict[str, Any]:
         """
         Serialize Wordlebot game state into structured format for Claude API prompts.
@@ -109,12 +343,15 @@ class ClaudeStrategy:
         """
         Engineer Claude API prompt with game state, candidates, and strategy.
 
-        Creates a comprehensive prompt that includes:
+        Creates the per-call user prompt with:
         - Current game state (pattern, known/bad letters, constraints)
         - Remaining candidate words with information gain scores
         - Strategy mode (aggressive/safe/balanced)
         - Request for structured JSON response
 
+        Instructions, strategy descriptions and the JSON schema live in
+        RECOMMEND_SYSTEM_PROMPT, which is sent as a cached system prompt.
+
         Args:
             game_state: Serialized game state from format_game_state()
             candidates: List of remaining candidate words (valid answers)
@@ -127,77 +364,120 @@ class ClaudeStrategy:
         Returns:
             Formatted prompt string for Claude API
         """
+        context = self._format_decision_context(
+            game_state=game_state,
+            candidates=candidates,
+            info_gains=info_gains,
+            strategy_mode=strategy_mode,
+            insight_mode=insight_mode,
+            insight_words=insight_words,
+            top_suggestions=top_suggestions,
+        )
+
+        return RECOMMEND_PROMPT_TEMPLATE.format(context=context, strategy_mode=strategy_mode)
+
+    def _format_decision_context(
+        self,
+        game_state: Dict[str, Any],
+        candidates: List[str],
+        info_gains: Dict[str, float],
+        strategy_mode: str,
+        insight_mode: bool = False,
+        insight_words: Optional[set] = None,
+        top_suggestions: Optional[List[str]] = None,
+    ) -> str:
+        """
+        Format the game state, strategy and scored words for one decision.
+
+        Shared by generate_prompt() and generate_batch_prompt(); arguments
+        are the same as generate_prompt().
+
+        Returns:
+            Prompt section describing a single decision
+        """
+        get_gain = info_gains.get
+        top_k = self.prompt_top_k
+
+        def best(words: List[str]) -> List[str]:
+            # Highest info gain first, whatever order the caller used
+            return heapq.nlargest(top_k, words, key=lambda word: get_gain(word, 0.0))
+
+        # Tell Claude how big the pool is when only part of it is listed
+        shown = ""
+        if len(candidates) > top_k:
+            shown = SHOWN_NOTE_TEMPLATE.format(shown=top_k, total=len(candidates))
+
         # Build word list with info gains
         if insight_mode and top_suggestions:
             # In insight mode, show top suggestions with insight markers
-            words_with_scores = []
-            for word in top_suggestions[:20]:
-                score = info_gains.get(word, 0.0)
-                marker = " [INSIGHT - not a valid answer]" if insight_words and word in insight_words else ""
-                words_with_scores.append(f"{word}: {score:.2f} bits{marker}")
-            words_section = f"""Top Suggestions by Information Gain (insight mode):
-{chr(10).join(words_with_scores)}
-
-Valid Candidates (can be the answer):
-{', '.join(candidates[:15])}"""
+            insight_words = insight_words or ()
+            words_with_scores = "\n".join([
+                f"{word}: {get_gain(word, 0.0):.2f} bits"
+                f"{INSIGHT_MARKER if word in insight_words else ''}"
+                for word in best(top_suggestions)
+            ])
+            words_section = INSIGHT_WORDS_TEMPLATE.format(
+                words_with_scores=words_with_scores,
+                candidates=', '.join(best(candidates)),
+                shown=shown,
+            )
         else:
             # Standard mode: only show candidates
-            words_with_scores = []
-            for word in candidates[:20]:
-                score = info_gains.get(word, 0.0)
-                words_with_scores.append(f"{word}: {score:.2f} bits")
-            words_section = f"""Remaining Candidates with Information Gain Scores:
-{chr(10).join(words_with_scores)}"""
-
-        insight_instructions = ""
-        if insight_mode:
-            insight_instructions = """
-INSIGHT MODE ENABLED:
-- You may recommend words marked [INSIGHT] that CANNOT be the answer
-- These "insight words" are strategically valuable because they reveal more information
-- Consider: Is the extra information worth using a guess that can't win?
-- Generally prefer insight words when many candidates remain (>10)
-- Prefer valid candidates when few candidates remain (<5)
-"""
-
-        prompt = f"""You are a strategic Wordle assistant helping to select the optimal guess.
-
-Game State (Guess #{game_state['guess_number']}):
-- Pattern: {game_state['pattern']} (. = unknown, letters = confirmed positions)
-- Known letters (in word, positions to avoid): {game_state['known_letters']}
-- Bad letters (not in word): {game_state['bad_letters']}
-- Minimum letter counts: {game_state['min_letter_counts']}
-
-Strategy Mode: {strategy_mode}
-- aggressive: Minimize average guess count (optimize for typical cases)
-- safe: Minimize worst-case scenarios (avoid risky guesses)
-- balanced: Compromise between average and worst-case
-{insight_instructions}
-{words_section}
+            words_with_scores = "\n".join([
+                f"{word}: {get_gain(word, 0.0):.2f} bits" for word in best(candidates)
+            ])
+            words_section = CANDIDATE_WORDS_TEMPLATE.format(
+                words_with_scores=words_with_scores,
+                shown=shown,
+            )
+
+        return DECISION_CONTEXT_TEMPLATE.format(
+            guess_number=game_state['guess_number'],
+            pattern=game_state['pattern'],
+            known_letters=game_state['known_letters'],
+            bad_letters=game_state['bad_letters'],
+            min_letter_counts=game_state['min_letter_counts'],
+            strategy_mode=strategy_mode,
+            insight_instructions="\nINSIGHT MODE ENABLED\n" if insight_mode else "",
+            words_section=words_section,
+        )
 
-Your task:
-1. Analyze the game state and remaining candidates
-2. Consider the information gain scores (higher = more information revealed)
-3. Apply the {strategy_mode} strategy to select the best guess
-4. Provide strategic reasoning for your choice
+    def generate_batch_prompt(self, queries: List[Dict[str, Any]]) -> str:
+        """
+        Engineer one Claude API prompt covering several independent decisions.
 
-Respond ONLY with valid JSON in this exact format:
-{{
-  "word": "selected_word",
-  "reasoning": "Brief explanation of why this word is optimal for the {strategy_mode} strategy",
-  "info_gain": 5.2,
-  "is_insight_word": false,
-  "alternatives": [
-    {{"word": "alternative1", "info_gain": 5.1, "note": "Why this was close"}},
-    {{"word": "alternative2", "info_gain": 5.0, "note": "Another consideration"}}
-  ]
-}}
+        Each query holds the keyword arguments of generate_prompt()
+        (game_state, candidates, info_gains, strategy_mode and optionally
+        insight_mode, insight_words, top_suggestions). Claude is asked for a
+        "decisions" array with one entry per query, identified by its index
+        (format described in RECOMMEND_SYSTEM_PROMPT).
 
-Important: Your response must be valid JSON only, no additional text."""
+        Args:
+            queries: List of per-decision argument dictionaries
 
-        return prompt
+        Returns:
+            Formatted prompt string for Claude API
+        """
+        sections = [
+            BATCH_DECISION_TEMPLATE.format(
+                index=i, context=self._format_decision_context(**query)
+            )
+            for i, query in enumerate(queries)
+        ]
+
+        return BATCH_PROMPT_TEMPLATE.format(
+            count=len(queries),
+            decisions="\n\n".join(sections),
+        )
 
-    def call_api(self, prompt: str, debug: bool = False) -> Optional[Any]:
+    def call_api(
+        self,
+        prompt: str,
+        debug: bool = False,
+        max_tokens: int = 1024,
+        system: Optional[List[Dict[str, Any]]] = None,
+        model: Optional[str] = None,
+    ) -> Optional[Any]:
         """
         Call Claude API with retry logic and exponential backoff.
 
@@ -208,92 +488,299 @@ Important: Your response must be valid JSON only, no additional text."""
         Args:
             prompt: Formatted prompt string for Claude API
             debug: If True, log retry attempts
+            max_tokens: Maximum tokens in the response
+            system: Optional system prompt blocks (e.g. RECOMMEND_SYSTEM)
+            model: Model to use instead of the default (CLAUDE_MODEL)
 
         Returns:
             API response object, or None if all retries exhausted
         """
         attempt = 0
-        start_time = time.time()
 
         while attempt < self.max_retries:
+            # Increment attempt counter
+            attempt += 1
             try:
-                # Increment attempt counter
-                attempt += 1
-
-                # Make API call
+                # Make API call (timed per attempt, excluding backoff sleeps)
+                start_time = time.perf_counter()
                 response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1024,
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
-                    timeout=self.timeout,
+                    **self._request_params(prompt, max_tokens, system, model)
                 )
 
-                # Track metrics
-                duration = time.time() - start_time
-                self.metrics['api_calls'] += 1
-                self.metrics['total_duration'] += duration
-
-                # Extract token counts
-                total_tokens = 0
-                if hasattr(response, 'usage'):
-                    total_tokens = (
-                        response.usage.input_tokens + response.usage.output_tokens
-                    )
-                    self.metrics['total_tokens'] += total_tokens
-
-                # Track in performance logger if available
-                if self.performance_logger:
-                    self.performance_logger.track_api_call(
-                        duration=duration,
-                        tokens=total_tokens,
-                        model=self.model
-                    )
-
+                self._record_call(response, time.perf_counter() - start_time, model)
                 return response
 
-            except RateLimitError as e:
-                # Handle rate limit with exponential backoff
-                if attempt >= self.max_retries:
-                    if debug:
-                        print(f"Rate limit error: Maximum retries ({self.max_retries}) exceeded")
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, debug)
+                if delay is None:
                     return None
+                time.sleep(delay)
 
-                # Calculate backoff delay: base^attempt (e.g., 2^1=2s, 2^2=4s, 2^3=8s)
-                delay = self.backoff_base ** attempt
-                if debug:
-                    print(f"Rate limit hit. Retry {attempt}/{self.max_retries} after {delay}s...")
+        return None
 
-                self.metrics['retry_count'] += 1
-                time.sleep(delay)
+    async def call_api_async(
+        self,
+        prompt: str,
+        debug: bool = False,
+        max_tokens: int = 1024,
+        system: Optional[List[Dict[str, Any]]] = None,
+        model: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Async version of call_api() using the AsyncAnthropic client.
 
-            except APIError as e:
-                # Handle other API errors
-                if debug:
-                    print(f"API error on attempt {attempt}/{self.max_retries}: {e}")
+        Same retry, backoff and metrics behavior, but waits with
+        asyncio.sleep so other requests keep running meanwhile.
 
-                if attempt >= self.max_retries:
-                    return None
+        Args:
+            prompt: Formatted prompt string for Claude API
+            debug: If True, log retry attempts
+            max_tokens: Maximum tokens in the response
+            system: Optional system prompt blocks (e.g. RECOMMEND_SYSTEM)
+            model: Model to use instead of the default (CLAUDE_MODEL)
 
-                # Exponential backoff for transient errors
-                delay = self.backoff_base ** attempt
-                self.metrics['retry_count'] += 1
-                time.sleep(delay)
+        Returns:
+            API response object, or None if all retries exhausted
+        """
+        attempt = 0
+
+        while attempt < self.max_retries:
+            attempt += 1
+            try:
+                start_time = time.perf_counter()
+                response = await self.aclient.messages.create(
+                    **self._request_params(prompt, max_tokens, system, model)
+                )
+
+                # Metrics updates don't await, so they can't interleave
+                # with other tasks on the event loop
+                self._record_call(response, time.perf_counter() - start_time, model)
+                return response
 
             except Exception as e:
-                # Handle unexpected errors
+                delay = self._retry_delay(e, attempt, debug)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+
+        return None
+
+    def stream_word(
+        self,
+        prompt: str,
+        debug: bool = False,
+        system: Optional[List[Dict[str, Any]]] = None,
+        cache_key: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Stream a recommendation and return its word as soon as it arrives.
+
+        Opening the stream is retried with the same policy as call_api()
+        (see _retry_delay()), and each attempt is bounded by the client
+        timeout. Once the word has been returned, the rest of the response
+        (reasoning, alternatives) keeps streaming on a background thread,
+        which records the call's metrics and, given a cache_key, stores
+        the full recommendation in the recommendation cache.
+
+        Args:
+            prompt: Formatted prompt string for Claude API
+            debug: If True, log stream errors and retries
+            system: Optional system prompt blocks (e.g. RECOMMEND_SYSTEM)
+            cache_key: Recommendation cache key to store the parsed result under
+
+        Returns:
+            Recommended word, or None if every attempt failed or the
+            response had no word
+        """
+        found: 'queue.Queue[Optional[str]]' = queue.Queue(maxsize=1)
+
+        def run() -> None:
+            word = None
+            attempt = 0
+            try:
+                while attempt < self.max_retries:
+                    attempt += 1
+                    start_time = time.perf_counter()
+                    try:
+                        params = self._request_params(prompt, 1024, system)
+                        with self.client.messages.stream(**params) as stream:
+                            text = ""
+                            for chunk in stream.text_stream:
+                                if word is None:
+                                    text += chunk
+                                    match = WORD_FIELD_PATTERN.search(text)
+                                    if match:
+                                        word = match.group(1).lower()
+                                        found.put(word)
+                            response = stream.get_final_message()
+                    except Exception as e:
+                        # Once the word is out there is nothing left to retry for
+                        if word is not None:
+                            if debug:
+                                print(f"Streaming error: {e}")
+                            return
+                        delay = self._retry_delay(e, attempt, debug)
+                        if delay is None:
+                            return
+                        time.sleep(delay)
+                        continue
+
+                    self._record_call(response, time.perf_counter() - start_time)
+                    recommendation = self.parse_response(response)
+                    if recommendation is not None and cache_key is not None:
+                        self._store_recommendation(cache_key, recommendation)
+                    return
+            finally:
+                if word is None:
+                    found.put(None)
+
+        threading.Thread(target=run, daemon=True).start()
+
+        # The worker always reports back: each attempt is bounded by the
+        # client timeout and retries stop after max_retries
+        return found.get()
+
+    def _request_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        system: Optional[List[Dict[str, Any]]] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build messages.create() keyword arguments for a prompt."""
+        params: Dict[str, Any] = {
+            'model': model or self.model,
+            'max_tokens': max_tokens,
+            'messages': [
+                {"role": "user", "content": prompt}
+            ],
+            'timeout': self.timeout,
+        }
+        if system:
+            params['system'] = system
+        return params
+
+    def _retry_delay(self, error: Exception, attempt: int, debug: bool = False) -> Optional[float]:
+        """
+        Decide whether to retry a failed API call, and how long to wait.
+
+        Args:
+            error: Exception raised by the API call
+            attempt: Attempt number that failed (1-based)
+            debug: If True, log retry attempts
+
+        Returns:
+            Backoff delay in seconds, or None to give up
+        """
+        # Rate limits (429) and overload (529) may say when to come back
+        overloaded = isinstance(error, RateLimitError) or (
+            isinstance(error, APIError) and getattr(error, 'status_code', None) == 529
+        )
+
+        if isinstance(error, RateLimitError):
+            # Handle rate limit with exponential backoff
+            if attempt >= self.max_retries:
                 if debug:
-                    print(f"Unexpected error on attempt {attempt}/{self.max_retries}: {e}")
+                    print(f"Rate limit error: Maximum retries ({self.max_retries}) exceeded")
+                return None
 
-                if attempt >= self.max_retries:
-                    return None
+        elif isinstance(error, APIError):
+            # Handle other API errors
+            status_code = getattr(error, 'status_code', None)
+            if (
+                status_code is not None
+                and 400 <= status_code < 500
+                and status_code not in RETRYABLE_CLIENT_ERRORS
+            ):
+                if debug:
+                    print(f"API error (status={status_code}, attempt={attempt}, "
+                          f"retrying=False): {error}")
+                return None
 
-                delay = self.backoff_base ** attempt
-                self.metrics['retry_count'] += 1
-                time.sleep(delay)
+            if debug:
+                print(f"API error on attempt {attempt}/{self.max_retries}: {error}")
 
-        return None
+            if attempt >= self.max_retries:
+                return None
+
+        else:
+            # Handle unexpected errors
+            if debug:
+                print(f"Unexpected error on attempt {attempt}/{self.max_retries}: {error}")
+
+            if attempt >= self.max_retries:
+                return None
+
+        retry_after = self._retry_after(error) if overloaded else None
+        if retry_after is not None:
+            # Wait at least as long as the server asked, plus some jitter
+            delay = random.uniform(retry_after, retry_after * 1.5)
+        else:
+            # Jittered exponential backoff around base^attempt (e.g. 2s, 4s,
+            # 8s), so concurrent callers don't all retry at the same instant
+            delay = random.uniform(0.5, 1.5) * self.backoff_base ** attempt
+        delay = min(delay, self.max_backoff)
+
+        if debug and overloaded:
+            print(f"Rate limit hit. Retry {attempt}/{self.max_retries} after {delay:.1f}s...")
+
+        self._count('retry_count')
+        return delay
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """
+        Read the Retry-After header (in seconds) from an API error.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            Seconds to wait, or None if the header is missing or not numeric
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        try:
+            return max(0.0, float(headers.get('retry-after')))
+        except (TypeError, ValueError):
+            return None
+
+    def _record_call(self, response: Any, duration: float, model: Optional[str] = None) -> None:
+        """
+        Track metrics for a successful API call.
+
+        Args:
+            response: API response object
+            duration: Seconds the successful attempt took
+            model: Model the call used, if not the default
+        """
+        # Extract token counts
+        total_tokens = 0
+        cache_read = None
+        if hasattr(response, 'usage'):
+            total_tokens = (
+                response.usage.input_tokens + response.usage.output_tokens
+            )
+            # Prompt-cache reads (the static system prompt) billed at ~10%
+            cache_read = getattr(response.usage, 'cache_read_input_tokens', None)
+
+        with self._metrics_lock:
+            self.metrics['api_calls'] += 1
+            self.metrics['total_duration'] += duration
+            self.metrics['total_tokens'] += total_tokens
+            if isinstance(cache_read, int):
+                self.metrics['cache_read_tokens'] += cache_read
+
+        # Track in performance logger if available
+        if self.performance_logger:
+            self.performance_logger.track_api_call(
+                duration=duration,
+                tokens=total_tokens,
+                model=model or self.model
+            )
 
     def parse_response(self, api_response: Any) -> Optional[Dict[str, Any]]:
         """
@@ -321,32 +808,93 @@ Important: Your response must be valid JSON only, no additional text."""
             text = api_response.content[0].text
 
             # Parse JSON
-            data = json.loads(text)
-
-            # Validate required fields
-            if 'word' not in data:
-                return None
-
-            # Extract parsed data with defaults for optional fields
-            parsed = {
-                'word': data['word'],
-                'reasoning': data.get('reasoning', 'No reasoning provided'),
-                'info_gain': data.get('info_gain', 0.0),
-                'alternatives': data.get('alternatives', []),
-            }
+            data = json_loads(text)
 
-            return parsed
+            return self._parse_recommendation(data)
 
         except json.JSONDecodeError:
             # Invalid JSON
             return None
-        except (AttributeError, IndexError, KeyError):
+        except (AttributeError, IndexError, KeyError, TypeError):
             # Malformed response structure
             return None
-        except Exception:
-            # Unexpected parsing error
+
+    @staticmethod
+    def _parse_recommendation(data: Any) -> Optional[Dict[str, Any]]:
+        """
+        Build a recommendation from one decoded JSON object.
+
+        Args:
+            data: Decoded JSON object for a single decision
+
+        Returns:
+            Dictionary with parsed data, or None unless 'word' is a
+            five-letter word. Optional fields of the wrong type fall back
+            to their defaults, and alternatives that aren't objects with a
+            'word' are dropped.
+        """
+        # Validate required fields
+        if not isinstance(data, dict):
+            return None
+        word = data.get('word')
+        if not isinstance(word, str) or not WORD_PATTERN.fullmatch(word):
             return None
 
+        # Extract parsed data with defaults for optional fields
+        reasoning = data.get('reasoning')
+        if not isinstance(reasoning, str):
+            reasoning = 'No reasoning provided'
+
+        info_gain = data.get('info_gain')
+        if isinstance(info_gain, bool) or not isinstance(info_gain, (int, float)):
+            info_gain = 0.0
+
+        alternatives = data.get('alternatives')
+        if not isinstance(alternatives, list):
+            alternatives = []
+
+        return {
+            'word': word.lower(),
+            'reasoning': reasoning,
+            'info_gain': info_gain,
+            'alternatives': [
+                alt for alt in alternatives
+                if isinstance(alt, dict) and isinstance(alt.get('word'), str)
+            ],
+        }
+
+    def parse_batch_response(
+        self,
+        api_response: Any,
+        count: int,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse a batched Claude API response into per-decision recommendations.
+
+        Args:
+            api_response: Raw API response for a generate_batch_prompt() prompt
+            count: Number of decisions in the prompt
+
+        Returns:
+            List aligned with the prompt's decisions; entries are None where
+            Claude omitted or garbled a decision
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        try:
+            if not hasattr(api_response, 'content') or not api_response.content:
+                return results
+
+            data = json_loads(api_response.content[0].text)
+            for decision in data.get('decisions', []):
+                index = decision.get('id')
+                if isinstance(index, int) and 0 <= index < count:
+                    results[index] = self._parse_recommendation(decision)
+        except (json.JSONDecodeError, AttributeError, IndexError, KeyError, TypeError):
+            # Malformed response: whatever was parsed so far is kept
+            pass
+
+        return results
+
     def recommend_guess(
         self,
         game_state: Dict[str, Any],
@@ -357,6 +905,7 @@ Important: Your response must be valid JSON only, no additional text."""
         insight_mode: bool = False,
         insight_words: Optional[set] = None,
         top_suggestions: Optional[List[str]] = None,
+        word_only: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Get strategic guess recommendation from Claude API.
@@ -364,6 +913,11 @@ Important: Your response must be valid JSON only, no additional text."""
         This is a convenience method that combines the full workflow:
         generate_prompt() -> call_api() -> parse_response()
 
+        With word_only=True the response is streamed and this returns as
+        soon as the word arrives (see stream_word()); reasoning and
+        alternatives are left empty here, and the full recommendation is
+        cached once the rest of the stream has been read.
+
         Args:
             game_state: Serialized game state from format_game_state()
             candidates: List of remaining candidate words
@@ -373,6 +927,7 @@ Important: Your response must be valid JSON only, no additional text."""
             insight_mode: If True, allow suggesting non-candidate "insight" words
             insight_words: Set of words that are insight-only (not valid answers)
             top_suggestions: In insight mode, the top words by info gain
+            word_only: If True, only wait for the recommended word
 
         Returns:
             Dictionary with recommendation data:
@@ -382,6 +937,12 @@ Important: Your response must be valid JSON only, no additional text."""
             - alternatives: List of alternative words with notes
             Returns None if API call fails
         """
+        # Obvious choices don't need the API
+        obvious = self._obvious_recommendation(candidates, info_gains)
+        if obvious is not None:
+            self._count('fast_path_skips')
+            return obvious
+
         # Generate prompt
         prompt = self.generate_prompt(
             game_state=game_state,
@@ -393,15 +954,358 @@ Important: Your response must be valid JSON only, no additional text."""
             top_suggestions=top_suggestions,
         )
 
+        # Identical prompts (same state, candidates, mode and model) reuse
+        # an earlier recommendation instead of calling the API
+        cache_key = self._recommendation_cache_key(prompt)
+        cached = self._cached_recommendation(cache_key)
+        if cached is not None:
+            return cached
+
+        if word_only:
+            word = self.stream_word(
+                prompt, debug=debug, system=RECOMMEND_SYSTEM, cache_key=cache_key
+            )
+            if word is None:
+                return None
+            return {
+                'word': word,
+                'reasoning': '',
+                'info_gain': info_gains.get(word, 0.0),
+                'alternatives': [],
+            }
+
         # Call API
-        response = self.call_api(prompt, debug=debug)
+        response = self.call_api(prompt, debug=debug, system=RECOMMEND_SYSTEM)
         if not response:
             return None
 
         # Parse response
         recommendation = self.parse_response(response)
+        if recommendation is not None:
+            self._store_recommendation(cache_key, recommendation)
         return recommendation
 
+    def _obvious_recommendation(
+        self,
+        candidates: List[str],
+        info_gains: Dict[str, float],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Recommend a guess locally when the choice is not in doubt.
+
+        That is when only one candidate remains, or when the best guess
+        leads the runner-up by more than confident_margin bits.
+
+        Args:
+            candidates: List of remaining candidate words
+            info_gains: Dictionary mapping words to information gain scores
+
+        Returns:
+            Recommendation dictionary, or None if Claude should decide
+        """
+        if len(candidates) == 1:
+            word = candidates[0]
+            return {
+                'word': word,
+                'reasoning': 'Only one candidate remains.',
+                'info_gain': info_gains.get(word, 0.0),
+                'alternatives': [],
+            }
+
+        if self.confident_margin is None or len(info_gains) < 2:
+            return None
+
+        (word, best), (runner_up, second) = heapq.nlargest(
+            2, info_gains.items(), key=lambda item: item[1]
+        )
+        if best - second <= self.confident_margin:
+            return None
+
+        return {
+            'word': word,
+            'reasoning': (
+                f"Leads the next best guess ({runner_up}) by "
+                f"{best - second:.2f} bits of information gain."
+            ),
+            'info_gain': best,
+            'alternatives': [],
+        }
+
+    def _recommendation_cache_key(self, prompt: str) -> str:
+        """Cache key for a prompt, tied to the model and prompt version."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.model}\0{PROMPT_VERSION}\0".encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _cached_recommendation(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached recommendation, counting the hit and refreshing its LRU position."""
+        with self._cache_lock:
+            cached = self._recommendation_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._recommendation_cache.move_to_end(cache_key)
+        self._count('cache_hits')
+        return dict(cached)
+
+    def _store_recommendation(self, cache_key: str, recommendation: Dict[str, Any]) -> None:
+        """Add a recommendation to the LRU cache and persist it if configured."""
+        with self._cache_lock:
+            self._recommendation_cache[cache_key] = dict(recommendation)
+            self._recommendation_cache.move_to_end(cache_key)
+            while len(self._recommendation_cache) > self.recommendation_cache_size:
+                self._recommendation_cache.popitem(last=False)
+            self._save_recommendation_cache()
+
+    def _load_recommendation_cache(self) -> bool:
+        """
+        Load persisted recommendations from the cache file.
+
+        Returns:
+            True if the cache was loaded successfully
+        """
+        if not self.recommendation_cache_file or not self.recommendation_cache_file.exists():
+            return False
+
+        try:
+            with open(self.recommendation_cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            # Stored oldest first; keep only the most recent entries
+            for key, value in list(entries.items())[-self.recommendation_cache_size:]:
+                self._recommendation_cache[key] = value
+            return True
+        except Exception:
+            return False
+
+    def _save_recommendation_cache(self) -> bool:
+        """
+        Write the recommendation cache to the cache file (oldest first).
+
+        Returns:
+            True if saved successfully
+        """
+        if not self.recommendation_cache_file:
+            return False
+
+        try:
+            self.recommendation_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.recommendation_cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._recommendation_cache, f)
+            tmp_file.replace(self.recommendation_cache_file)
+            return True
+        except Exception:
+            return False
+
+    async def recommend_guess_async(
+        self,
+        game_state: Dict[str, Any],
+        candidates: List[str],
+        info_gains: Dict[str, float],
+        strategy_mode: str,
+        debug: bool = False,
+        insight_mode: bool = False,
+        insight_words: Optional[set] = None,
+        top_suggestions: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async version of recommend_guess(); same arguments and return value.
+        """
+        obvious = self._obvious_recommendation(candidates, info_gains)
+        if obvious is not None:
+            self._count('fast_path_skips')
+            return obvious
+
+        prompt = self.generate_prompt(
+            game_state=game_state,
+            candidates=candidates,
+            info_gains=info_gains,
+            strategy_mode=strategy_mode,
+            insight_mode=insight_mode,
+            insight_words=insight_words,
+            top_suggestions=top_suggestions,
+        )
+
+        # Shares recommend_guess()'s cache
+        cache_key = self._recommendation_cache_key(prompt)
+        cached = self._cached_recommendation(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self.call_api_async(prompt, debug=debug, system=RECOMMEND_SYSTEM)
+        if not response:
+            return None
+
+        recommendation = self.parse_response(response)
+        if recommendation is not None:
+            self._store_recommendation(cache_key, recommendation)
+        return recommendation
+
+    async def recommend_guess_many(
+        self,
+        queries: List[Dict[str, Any]],
+        debug: bool = False,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get recommendations for several decisions with requests in flight together.
+
+        At most ai.api.max_concurrent requests run at once to stay within
+        rate limits.
+
+        Args:
+            queries: Per-decision keyword arguments for recommend_guess()
+            debug: If True, enable debug logging
+
+        Returns:
+            List of recommendations aligned with queries (None where a call failed)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def run(query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.recommend_guess_async(debug=debug, **query)
+
+        return list(await asyncio.gather(*(run(query) for query in queries)))
+
+    def recommend_guess_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        debug: bool = False,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get recommendations for several independent decisions in few API calls.
+
+        Queries are packed up to ai.api.max_batch_size per prompt, so K
+        decisions cost ceil(K / max_batch_size) round-trips instead of K.
+
+        Args:
+            queries: Per-decision keyword arguments for generate_prompt()
+            debug: If True, enable debug logging
+
+        Returns:
+            List of recommendations aligned with queries (None where a call
+            or a decision failed)
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for start in range(0, len(queries), self.max_batch_size):
+            batch = queries[start:start + self.max_batch_size]
+            prompt = self.generate_batch_prompt(batch)
+
+            response = self.call_api(
+                prompt, debug=debug, max_tokens=1024 * len(batch), system=RECOMMEND_SYSTEM
+            )
+            if not response:
+                results.extend([None] * len(batch))
+                continue
+
+            results.extend(self.parse_batch_response(response, len(batch)))
+
+        return results
+
+    def recommend_guess_bulk(
+        self,
+        queries: List[Dict[str, Any]],
+        debug: bool = False,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get recommendations for a large offline set of decisions.
+
+        With ai.api.use_batch enabled, every decision is submitted as one
+        request through Anthropic's Message Batches API (half price, no
+        real-time rate limits, results within 24h) and this method polls
+        until the batch ends. Otherwise it falls back to
+        recommend_guess_batch().
+
+        Args:
+            queries: Per-decision keyword arguments for generate_prompt()
+            debug: If True, log batch progress
+
+        Returns:
+            List of recommendations aligned with queries (None where a
+            request failed or was still pending when the batch timed out)
+        """
+        if not self.use_batch_api:
+            return self.recommend_guess_batch(queries, debug=debug)
+
+        requests = [
+            {
+                "custom_id": f"decision-{i}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": 1024,
+                    "system": RECOMMEND_SYSTEM,
+                    "messages": [
+                        {"role": "user", "content": self.generate_prompt(**query)}
+                    ],
+                },
+            }
+            for i, query in enumerate(queries)
+        ]
+
+        batches = self.client.messages.batches
+        batch = batches.create(requests=requests)
+        if debug:
+            print(f"Submitted message batch {batch.id} ({len(requests)} requests)")
+
+        deadline = time.monotonic() + self.batch_timeout
+        cancelled = False
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                if cancelled:
+                    # Results are only readable once the batch has ended
+                    if debug:
+                        print(f"Message batch {batch.id} did not finish cancelling")
+                    return [None] * len(queries)
+                if debug:
+                    print(f"Message batch {batch.id} timed out, cancelling")
+                batches.cancel(batch.id)
+                # Requests that finished before the cancel keep their
+                # results, so wait (briefly) for the batch to end
+                cancelled = True
+                deadline = time.monotonic() + self.batch_cancel_wait
+            time.sleep(self.batch_poll_interval)
+            batch = batches.retrieve(batch.id)
+
+        return self._collect_batch_results(batch.id, len(queries), debug)
+
+    def _collect_batch_results(
+        self,
+        batch_id: str,
+        count: int,
+        debug: bool = False,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read a message batch's results into a list indexed by decision.
+
+        Args:
+            batch_id: Message batch to read
+            count: Number of requests submitted in the batch
+            debug: If True, log requests that did not succeed
+
+        Returns:
+            List of recommendations (None where a request did not succeed)
+        """
+        # Results stream back as JSONL in no particular order
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                if debug:
+                    print(f"Batch request {entry.custom_id}: {entry.result.type}")
+                continue
+
+            message = entry.result.message
+            self._count('api_calls')
+            if hasattr(message, 'usage'):
+                self._count(
+                    'total_tokens',
+                    message.usage.input_tokens + message.usage.output_tokens,
+                )
+
+            index = int(entry.custom_id.rsplit("-", 1)[1])
+            results[index] = self.parse_response(message)
+
+        return results
+
     def break_tie(
         self,
         tied_words: List[str],
@@ -428,41 +1332,38 @@ Important: Your response must be valid JSON only, no additional text."""
         coca_info = ""
         if coca_frequencies:
             freq_list = [f"{word}: {coca_frequencies.get(word, 0)}" for word in tied_words]
-            coca_info = f"\nCOCA Frequency Context:\n{chr(10).join(freq_list)}"
+            coca_info = "\nCOCA Frequency Context:\n" + "\n".join(freq_list)
 
         # Get known letters and bad letters with defaults
         known_letters = game_state.get('known_letters', {})
         bad_letters = game_state.get('bad_letters', [])
 
-        prompt = f"""You are breaking a tie between equally-scored Wordle guesses.
-
-Game State:
-- Pattern: {game_state['pattern']}
-- Known letters: {known_letters}
-- Bad letters: {bad_letters}
-
-Strategy Mode: {strategy_mode}
-
-Tied Words (identical information gain):
-{', '.join(tied_words)}
-{coca_info}
-
-Select the best word considering:
-1. Letter commonality and word frequency
-2. Strategic positioning for the {strategy_mode} strategy
-3. Likelihood of narrowing to the solution
-
-Respond ONLY with valid JSON:
-{{"word": "selected_word", "reasoning": "Why this word breaks the tie"}}
-"""
+        prompt = TIEBREAK_PROMPT_TEMPLATE.format(
+            pattern=game_state['pattern'],
+            known_letters=known_letters,
+            bad_letters=bad_letters,
+            strategy_mode=strategy_mode,
+            tied_words=', '.join(tied_words),
+            coca_info=coca_info,
+            reply_format=TIEBREAK_JSON_REPLY if self.verbose_tiebreak else TIEBREAK_WORD_REPLY,
+        )
 
         try:
             # Call API for tie-breaking
-            response = self.call_api(prompt)
-            if response:
-                parsed = self.parse_response(response)
-                if parsed and parsed['word'] in tied_words:
-                    return parsed['word']
+            if self.verbose_tiebreak:
+                response = self.call_api(prompt, model=self.tiebreak_model)
+                if response:
+                    parsed = self.parse_response(response)
+                    if parsed and parsed['word'] in tied_words:
+                        return parsed['word']
+            else:
+                response = self.call_api(
+                    prompt, max_tokens=TIEBREAK_MAX_TOKENS, model=self.tiebreak_model
+                )
+                if response:
+                    word = self._parse_tiebreak_word(response, tied_words)
+                    if word:
+                        return word
 
             # Fallback to COCA frequency if API fails
             if coca_frequencies:
@@ -478,6 +1379,29 @@ Respond ONLY with valid JSON:
                 return max(tied_words, key=lambda w: coca_frequencies.get(w, 0))
             return tied_words[0]
 
+    @staticmethod
+    def _parse_tiebreak_word(api_response: Any, tied_words: List[str]) -> Optional[str]:
+        """
+        Extract the chosen word from a terse tie-break reply.
+
+        Args:
+            api_response: Response object from call_api()
+            tied_words: Words the reply must choose between
+
+        Returns:
+            First tied word mentioned in the reply, or None
+        """
+        try:
+            text = api_response.content[0].text.lower()
+        except (AttributeError, IndexError, TypeError):
+            return None
+
+        tied = set(tied_words)
+        for token in re.findall(r'[a-z]+', text):
+            if token in tied:
+                return token
+        return None
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get performance metrics for API calls.
@@ -485,13 +1409,23 @@ Respond ONLY with valid JSON:
         Returns:
             Dictionary with API call statistics
         """
-        return self.metrics.copy()
+        with self._metrics_lock:
+            return self.metrics.copy()
 
     def reset_metrics(self) -> None:
         """Reset performance metrics (typically between games)"""
-        self.metrics = {
-            'api_calls': 0,
-            'total_tokens': 0,
-            'total_duration': 0.0,
-            'retry_count': 0,
-        }
+        with self._metrics_lock:
+            self.metrics = {
+                'api_calls': 0,
+                'total_tokens': 0,
+                'total_duration': 0.0,
+                'retry_count': 0,
+                'cache_hits': 0,
+                'cache_read_tokens': 0,
+                'fast_path_skips': 0,
+            }
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        """Add to a metrics counter; safe to call from any thread."""
+        with self._metrics_lock:
+            self.metrics[key] += amount
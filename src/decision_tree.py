@@ -4,7 +4,7 @@ Pre-computed Decision Trees for Optimal Wordle Play v2.0
 Pre-computes optimal moves for the first 1-2 guesses by:
 1. Calculating optimal first guess across all 2,315 solutions
 2. For each of 243 possible response patterns, computing optimal second guess
-3. Storing results in a compact JSON format for fast lookup
+3. Storing results in a compact binary format for fast lookup
 
 This eliminates the O(n^2) first-guess calculation at runtime, providing
 instant recommendations based on information-theoretic optimality.
@@ -12,7 +12,8 @@ instant recommendations based on information-theoretic optimality.
 Performance characteristics:
 - First guess lookup: O(1) - instant
 - Second guess lookup: O(1) - instant
-- Pre-computation: Several hours (done once, cached)
+- Pre-computation: seconds with NumPy (pattern matrix), hours without
+  (done once, cached)
 
 Based on research showing optimal Wordle solving achieves:
 - 3.42 average guesses
@@ -21,15 +22,129 @@ Based on research showing optimal Wordle solving achieves:
 
 import itertools
 import json
+import math
+import multiprocessing
+import struct
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 # Import information gain calculator if available
 try:
-    from information_gain import InformationGainCalculator
+    from information_gain import (
+        InformationGainCalculator,
+        MAX_GAIN_TOLERANCE,
+        SCORE_BLOCK_SIZE,
+        build_pattern_matrix,
+        candidates_key,
+        encode_words,
+        load_or_build_pattern_matrix,
+        max_information_gain,
+        pattern_matrix_file,
+        pattern_matrix_gains,
+    )
 except ImportError:
     InformationGainCalculator = None
+    MAX_GAIN_TOLERANCE = 1e-9
+    SCORE_BLOCK_SIZE = 500
+    build_pattern_matrix = None
+    candidates_key = None
+    encode_words = None
+    load_or_build_pattern_matrix = None
+    max_information_gain = None
+    pattern_matrix_file = None
+    pattern_matrix_gains = None
+
+# Optional faster JSON decoder for legacy JSON caches (its JSONDecodeError
+# subclasses json.JSONDecodeError)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# NumPy is optional; with it precompute works from a guess x solution
+# pattern matrix instead of scoring each candidate set from scratch
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# All 243 response patterns; a pattern's position is its base-3 value with
+# G = 0, Y = 1, X = 2 (first letter most significant)
+ALL_PATTERNS: Tuple[str, ...] = tuple(''.join(p) for p in itertools.product('GYX', repeat=5))
+PATTERN_INDEX: Dict[str, int] = {pattern: i for i, pattern in enumerate(ALL_PATTERNS)}
+# Pattern-matrix code (see DecisionTree.pattern_code) of each pattern, by index
+PATTERN_CODES: Tuple[int, ...] = tuple(
+    sum({'G': 2, 'Y': 1, 'X': 0}[c] * 3 ** i for i, c in enumerate(pattern))
+    for pattern in ALL_PATTERNS
+)
+
+# Binary cache layout (little-endian): a header, then one fixed-size record
+# per response pattern in generate_all_patterns() order. Unused patterns
+# have an empty guess. Loading is a single read plus struct unpacking.
+BINARY_CACHE_MAGIC = b'WBDT'
+BINARY_CACHE_VERSION = 1
+# magic, version, first_guess, first_guess_info_gain, computed_at (NaN if
+# unknown), computation_time, solutions_count, record count
+BINARY_HEADER = struct.Struct('<4sH5sdddiH')
+# best_guess, info_gain, remaining_count
+BINARY_RECORD = struct.Struct('<5sdi')
+
+# Per-process state for parallel precomputation, set by _init_worker
+# or _init_matrix_worker
+_worker_state: Dict[str, Any] = {}
+
+# Pattern matrix rows per pool task; smaller vocabularies aren't worth
+# splitting across processes
+PARALLEL_ROW_CHUNK = 1000
+
+
+def _init_worker(solutions: List[str], vocabulary: List[str]) -> None:
+    """Give a pool worker its own calculator and the shared word lists."""
+    _worker_state['solutions'] = solutions
+    _worker_state['solutions_key'] = candidates_key(solutions)
+    _worker_state['vocabulary'] = vocabulary
+    _worker_state['vocabulary_array'] = encode_words(vocabulary)
+    _worker_state['calc'] = InformationGainCalculator()
+    _worker_state['tree'] = DecisionTree()
+
+
+def _score_words(words: List[str]) -> List[float]:
+    """Score a shard of first-guess candidates against all solutions."""
+    return _worker_state['calc'].score_guesses(
+        words, _worker_state['solutions'], cand_key=_worker_state['solutions_key']
+    )
+
+
+def _init_matrix_worker(pattern_matrix: Any) -> None:
+    """Give a pool worker the vocabulary x solutions pattern matrix."""
+    _worker_state['pattern_matrix'] = pattern_matrix
+
+
+def _best_matrix_row(args: Tuple[int, int, Any]) -> Tuple[int, float]:
+    """Find the best of matrix rows [start, stop) for the given solution columns."""
+    start, stop, candidate_indices = args
+    gains = pattern_matrix_gains(
+        _worker_state['pattern_matrix'][start:stop][:, candidate_indices]
+    )
+    best = int(np.argmax(gains))
+    return start + best, float(gains[best])
+
+
+def _compute_response_worker(
+    args: Tuple[str, List[str]]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Compute the second-guess entry for one (pattern, remaining) pair."""
+    pattern, remaining = args
+    entry = _worker_state['tree']._compute_response(
+        remaining,
+        _worker_state['vocabulary'],
+        _worker_state['calc'],
+        _worker_state['vocabulary_array'],
+    )
+    return pattern, entry
 
 
 class DecisionTree:
@@ -50,15 +165,21 @@ class DecisionTree:
         """
         Initialize decision tree with optional cache file.
 
+        The tree is saved in a compact binary format next to cache_file
+        (same name, .bin suffix); a JSON cache_file from older versions is
+        still read if no binary cache exists.
+
         Args:
-            cache_file: Path to JSON cache file for persistence
+            cache_file: Path to the cache file for persistence
         """
         self.cache_file = cache_file
         self.tree: Dict[str, Any] = {
             'version': 'v1',
             'first_guess': None,
             'first_guess_info_gain': 0.0,
-            'responses': {},  # pattern -> {best_guess, info_gain, remaining_count}
+            # PATTERN_INDEX position -> {best_guess, info_gain, remaining_count},
+            # or None if no solution gives that pattern
+            'responses': [None] * len(ALL_PATTERNS),
             'computed_at': None,
             'computation_time': 0.0,
             'solutions_count': 0,
@@ -68,6 +189,13 @@ class DecisionTree:
         if cache_file:
             self._load_cache()
 
+    @property
+    def binary_cache_file(self) -> Optional[Path]:
+        """Binary cache path derived from cache_file."""
+        if not self.cache_file:
+            return None
+        return self.cache_file.with_suffix('.bin')
+
     def _load_cache(self) -> bool:
         """
         Load decision tree from cache file.
@@ -75,17 +203,23 @@ class DecisionTree:
         Returns:
             True if cache was loaded successfully
         """
+        if self._load_binary_cache():
+            return True
+
         if not self.cache_file or not self.cache_file.exists():
             return False
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                data = json_loads(f.read())
 
             # Validate version
             if data.get('version') != 'v1':
                 return False
 
+            # Older JSON caches key responses by pattern string
+            responses = data.get('responses', {})
+            data['responses'] = [responses.get(pattern) for pattern in ALL_PATTERNS]
             self.tree = data
             return True
 
@@ -105,14 +239,94 @@ class DecisionTree:
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.tree, f, indent=2)
+            with open(self.binary_cache_file, 'wb') as f:
+                f.write(self._pack_tree())
 
             return True
 
         except Exception:
             return False
 
+    def _pack_tree(self) -> bytes:
+        """Serialize the tree in the binary cache format."""
+        computed_at = self.tree.get('computed_at')
+        patterns = self.generate_all_patterns()
+        header = BINARY_HEADER.pack(
+            BINARY_CACHE_MAGIC,
+            BINARY_CACHE_VERSION,
+            (self.tree.get('first_guess') or '').encode('ascii'),
+            self.tree.get('first_guess_info_gain', 0.0),
+            math.nan if computed_at is None else computed_at,
+            self.tree.get('computation_time', 0.0),
+            self.tree.get('solutions_count', 0),
+            len(patterns),
+        )
+
+        records = []
+        for entry in self.tree['responses']:
+            if entry:
+                records.append(BINARY_RECORD.pack(
+                    entry['best_guess'].encode('ascii'),
+                    entry['info_gain'],
+                    entry['remaining_count'],
+                ))
+            else:
+                records.append(BINARY_RECORD.pack(b'', 0.0, 0))
+
+        return header + b''.join(records)
+
+    def _load_binary_cache(self) -> bool:
+        """
+        Load decision tree from the binary cache file.
+
+        Returns:
+            True if the binary cache was loaded successfully
+        """
+        path = self.binary_cache_file
+        if not path or not path.exists():
+            return False
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            (magic, version, first_guess, first_ig, computed_at,
+             computation_time, solutions_count, count) = BINARY_HEADER.unpack_from(data)
+            patterns = self.generate_all_patterns()
+            if (
+                magic != BINARY_CACHE_MAGIC
+                or version != BINARY_CACHE_VERSION
+                or count != len(patterns)
+            ):
+                return False
+
+            responses = [
+                {
+                    'best_guess': guess.decode('ascii'),
+                    'info_gain': info_gain,
+                    'remaining_count': remaining,
+                } if remaining else None
+                for guess, info_gain, remaining in BINARY_RECORD.iter_unpack(
+                    data[BINARY_HEADER.size:]
+                )
+            ]
+            if len(responses) != count:
+                return False
+
+            self.tree = {
+                'version': 'v1',
+                'first_guess': first_guess.rstrip(b'\0').decode('ascii') or None,
+                'first_guess_info_gain': first_ig,
+                'responses': responses,
+                'computed_at': None if math.isnan(computed_at) else computed_at,
+                'computation_time': computation_time,
+                'solutions_count': solutions_count,
+            }
+            return True
+
+        except (OSError, struct.error, UnicodeDecodeError):
+            return False
+
     @staticmethod
     def generate_response_pattern(guess: str, target: str) -> str:
         """
@@ -123,9 +337,12 @@ class DecisionTree:
         - Y = yellow (in word, wrong position)
         - X = gray (not in word)
 
+        Both words must already be lowercase (precompute lowercases its word
+        lists once rather than per comparison).
+
         Args:
-            guess: The guessed word
-            target: The target/solution word
+            guess: The guessed word (lowercase)
+            target: The target/solution word (lowercase)
 
         Returns:
             5-character pattern string (e.g., "GXXYX")
@@ -134,8 +351,7 @@ class DecisionTree:
             raise ValueError("Both words must be 5 letters")
 
         pattern = ['X'] * 5
-        target_letters = list(target.lower())
-        guess = guess.lower()
+        target_letters = list(target)
 
         # First pass: Mark greens
         for i in range(5):
@@ -154,15 +370,30 @@ class DecisionTree:
         return ''.join(pattern)
 
     @staticmethod
-    def generate_all_patterns() -> List[str]:
+    def generate_all_patterns() -> Tuple[str, ...]:
+        """
+        Get all 243 possible response patterns.
+
+        The patterns are built once at import; this returns the shared tuple.
+
+        Returns:
+            Tuple of all 3^5 = 243 pattern strings
+        """
+        return ALL_PATTERNS
+
+    @staticmethod
+    def pattern_code(pattern: str) -> int:
         """
-        Generate all 243 possible response patterns.
+        Convert a G/Y/X pattern to the base-3 code used by the pattern matrix.
+
+        Args:
+            pattern: Response pattern (G/Y/X format)
 
         Returns:
-            List of all 3^5 = 243 pattern strings
+            Code in range(243): green = 2, yellow = 1, gray = 0, position i
+            weighted by 3^i
         """
-        colors = ['G', 'Y', 'X']
-        return [''.join(p) for p in itertools.product(colors, repeat=5)]
+        return PATTERN_CODES[PATTERN_INDEX[pattern]]
 
     def filter_by_pattern(
         self,
@@ -174,9 +405,9 @@ class DecisionTree:
         Filter solutions that match a given response pattern.
 
         Args:
-            guess: The guessed word
+            guess: The guessed word (lowercase)
             pattern: Response pattern (G/Y/X format)
-            solutions: List of potential solutions
+            solutions: List of potential solutions (lowercase)
 
         Returns:
             Filtered list of solutions consistent with the pattern
@@ -214,7 +445,10 @@ class DecisionTree:
             Dictionary with 'best_guess', 'info_gain', 'remaining_count',
             or None if pattern not found
         """
-        return self.tree.get('responses', {}).get(first_response)
+        index = PATTERN_INDEX.get(first_response)
+        if index is None:
+            return None
+        return self.tree['responses'][index]
 
     def get_recommendation(
         self,
@@ -248,12 +482,21 @@ class DecisionTree:
         info_gain_calc: Optional['InformationGainCalculator'] = None,
         depth: int = 2,
         show_progress: bool = True,
+        workers: int = 1,
     ) -> None:
         """
         Pre-compute optimal decision tree.
 
-        This is computationally intensive and may take several hours
-        for depth=2. Results are cached for future use.
+        Without NumPy this is computationally intensive and may take
+        several hours for depth=2. Results are cached for future use.
+
+        With NumPy, the pattern of every guess against every solution is
+        computed once (and cached next to cache_file); each phase then
+        filters and scores by slicing that matrix, and workers > 1 splits
+        whole-vocabulary scans across a process pool. Without it,
+        workers > 1 shards first-guess scoring across a process pool and
+        distributes the 243 second-guess patterns over it, with each
+        worker building its own InformationGainCalculator.
 
         Args:
             solutions: List of possible solution words (~2,315)
@@ -261,6 +504,7 @@ class DecisionTree:
             info_gain_calc: Information gain calculator instance
             depth: Pre-computation depth (1=first guess, 2=first two guesses)
             show_progress: Whether to show progress updates
+            workers: Number of worker processes (1 = compute in this process)
         """
         start_time = time.time()
 
@@ -269,9 +513,14 @@ class DecisionTree:
                 raise ImportError("InformationGainCalculator required for precomputation")
             info_gain_calc = InformationGainCalculator()
 
+        # Lowercase once here; pattern generation assumes lowercase words
+        solutions = [word.lower() for word in solutions]
+
         # Use solutions as vocabulary if not provided
         if guess_vocabulary is None:
             guess_vocabulary = solutions
+        else:
+            guess_vocabulary = [word.lower() for word in guess_vocabulary]
 
         self.tree['solutions_count'] = len(solutions)
 
@@ -280,79 +529,427 @@ class DecisionTree:
             print(f"  Solutions: {len(solutions)}")
             print(f"  Vocabulary: {len(guess_vocabulary)}")
 
-        # Compute optimal first guess
+        # Encode the vocabulary once for vectorized scoring (None without NumPy)
+        vocabulary_array = encode_words(guess_vocabulary) if encode_words else None
+
+        if vocabulary_array is not None:
+            self._precompute_from_matrix(
+                solutions, guess_vocabulary, info_gain_calc, depth, show_progress,
+                start_time, workers,
+            )
+            self._finish_precompute(start_time, show_progress)
+            return
+
+        pool = None
+        if workers > 1:
+            pool = multiprocessing.Pool(
+                workers,
+                initializer=_init_worker,
+                initargs=(solutions, guess_vocabulary),
+            )
+
+        try:
+            # Compute optimal first guess
+            if show_progress:
+                print("\nPhase 1: Computing optimal first guess...")
+
+            if pool is None:
+                first_guess, first_info_gain = self._compute_best_guess(
+                    solutions,
+                    guess_vocabulary,
+                    info_gain_calc,
+                    show_progress,
+                    vocabulary_array,
+                )
+            else:
+                first_guess, first_info_gain = self._compute_best_first_guess_parallel(
+                    pool,
+                    workers,
+                    solutions,
+                    guess_vocabulary,
+                    show_progress,
+                )
+
+            self.tree['first_guess'] = first_guess
+            self.tree['first_guess_info_gain'] = first_info_gain
+
+            if show_progress:
+                print(f"  Optimal first guess: {first_guess} ({first_info_gain:.3f} bits)")
+
+            # Compute second guesses for each response pattern
+            if depth >= 2:
+                if show_progress:
+                    print("\nPhase 2: Computing optimal second guesses for 243 patterns...")
+
+                all_patterns = self.generate_all_patterns()
+                pattern_count = len(all_patterns)
+
+                # Bucket the solutions by response in one pass, rather than
+                # re-filtering every solution once per pattern
+                buckets: Dict[str, List[str]] = {}
+                for solution in solutions:
+                    response = self.generate_response_pattern(first_guess, solution)
+                    buckets.setdefault(response, []).append(solution)
+
+                if pool is None:
+                    results = (
+                        (pattern, self._compute_response(
+                            buckets.get(pattern, []), guess_vocabulary,
+                            info_gain_calc, vocabulary_array
+                        ))
+                        for pattern in all_patterns
+                    )
+                else:
+                    results = pool.imap_unordered(
+                        _compute_response_worker,
+                        [(pattern, buckets.get(pattern, [])) for pattern in all_patterns],
+                    )
+
+                for i, (pattern, entry) in enumerate(results):
+                    if entry is not None:
+                        self.tree['responses'][PATTERN_INDEX[pattern]] = entry
+
+                    if show_progress and (i + 1) % 25 == 0:
+                        elapsed = time.time() - start_time
+                        print(f"  Progress: {i + 1}/{pattern_count} patterns ({elapsed:.1f}s)")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        self._finish_precompute(start_time, show_progress)
+
+    def _finish_precompute(self, start_time: float, show_progress: bool) -> None:
+        """Record computation metadata and save the tree to the cache file."""
+        # Record computation metadata
+        computation_time = time.time() - start_time
+        self.tree['computed_at'] = time.time()
+        self.tree['computation_time'] = computation_time
+
         if show_progress:
-            print("\nPhase 1: Computing optimal first guess...")
+            print(f"\nDecision tree computed in {computation_time:.1f} seconds")
+            valid_patterns = sum(1 for entry in self.tree['responses'] if entry)
+            print(f"  Valid response patterns: {valid_patterns}")
 
-        first_guess, first_info_gain = self._compute_best_guess(
-            solutions,
-            guess_vocabulary,
-            info_gain_calc,
-            show_progress,
+        # Save to cache
+        if self.cache_file:
+            if self._save_cache():
+                if show_progress:
+                    print(f"  Cached to: {self.binary_cache_file}")
+
+    def _precompute_from_matrix(
+        self,
+        solutions: List[str],
+        vocabulary: List[str],
+        info_gain_calc: 'InformationGainCalculator',
+        depth: int,
+        show_progress: bool,
+        start_time: float,
+        workers: int = 1,
+    ) -> None:
+        """
+        Fill in the tree from a vocabulary x solutions pattern matrix.
+
+        Makes the same choices as the per-candidate-set path: candidate
+        sets are column subsets of the matrix and filtering by a response
+        pattern is a comparison against the first guess's row.
+
+        Args:
+            solutions: List of possible solution words
+            vocabulary: Full guess vocabulary
+            info_gain_calc: Calculator, used if a small candidate set
+                contains words missing from the vocabulary
+            depth: Pre-computation depth (1=first guess, 2=first two guesses)
+            show_progress: Whether to show progress updates
+            start_time: When precompute() started, for progress output
+            workers: Number of worker processes for whole-vocabulary scans
+        """
+        matrix_file = (
+            pattern_matrix_file(self.cache_file.parent, solutions, vocabulary)
+            if self.cache_file else None
+        )
+        pattern_matrix = load_or_build_pattern_matrix(
+            solutions, vocabulary, matrix_file, show_progress
         )
 
-        self.tree['first_guess'] = first_guess
-        self.tree['first_guess_info_gain'] = first_info_gain
+        pool = None
+        if workers > 1 and len(vocabulary) > PARALLEL_ROW_CHUNK:
+            pool = multiprocessing.Pool(
+                workers,
+                initializer=_init_matrix_worker,
+                initargs=(pattern_matrix,),
+            )
 
-        if show_progress:
-            print(f"  Optimal first guess: {first_guess} ({first_info_gain:.3f} bits)")
+        try:
+            vocabulary_index = {word: i for i, word in enumerate(vocabulary)}
+            all_solutions = np.arange(len(solutions))
 
-        # Compute second guesses for each response pattern
-        if depth >= 2:
             if show_progress:
-                print("\nPhase 2: Computing optimal second guesses for 243 patterns...")
+                print("\nPhase 1: Computing optimal first guess...")
 
-            all_patterns = self.generate_all_patterns()
-            pattern_count = len(all_patterns)
+            first_guess, first_info_gain = self._compute_best_guess_from_matrix(
+                all_solutions, solutions, vocabulary, vocabulary_index,
+                pattern_matrix, info_gain_calc, pool,
+            )
+            self.tree['first_guess'] = first_guess
+            self.tree['first_guess_info_gain'] = first_info_gain
 
-            for i, pattern in enumerate(all_patterns):
-                # Filter solutions by this pattern
-                remaining = self.filter_by_pattern(first_guess, pattern, solutions)
+            if show_progress:
+                print(f"  Optimal first guess: {first_guess} ({first_info_gain:.3f} bits)")
 
-                if not remaining:
-                    continue  # No solutions match this pattern
+            if depth < 2:
+                return
+
+            if show_progress:
+                print("\nPhase 2: Computing optimal second guesses for 243 patterns...")
+
+            # Group solution indices by their response to the first guess: a
+            # stable sort keeps each group in solution order
+            if first_guess in vocabulary_index:
+                first_codes = pattern_matrix[vocabulary_index[first_guess]]
+            else:
+                first_codes = build_pattern_matrix(
+                    encode_words([first_guess]), encode_words(solutions)
+                )[0]
+            groups = np.split(
+                np.argsort(first_codes, kind='stable'),
+                np.cumsum(np.bincount(first_codes, minlength=243))[:-1],
+            )
+            responses = self.tree['responses']
+
+            # Walk patterns by index, reading each one's group by matrix code
+            for index, code in enumerate(PATTERN_CODES):
+                remaining = groups[code]
 
                 if len(remaining) == 1:
                     # Only one solution left - guess it
-                    self.tree['responses'][pattern] = {
-                        'best_guess': remaining[0],
+                    responses[index] = {
+                        'best_guess': solutions[remaining[0]],
                         'info_gain': 0.0,
                         'remaining_count': 1,
                     }
-                else:
-                    # Compute best second guess
-                    best_word, best_ig = self._compute_best_guess(
-                        remaining,
-                        guess_vocabulary,
-                        info_gain_calc,
-                        show_progress=False,
+                elif len(remaining) > 1:
+                    best_word, best_ig = self._compute_best_guess_from_matrix(
+                        remaining, solutions, vocabulary, vocabulary_index,
+                        pattern_matrix, info_gain_calc, pool,
                     )
-
-                    self.tree['responses'][pattern] = {
+                    responses[index] = {
                         'best_guess': best_word,
                         'info_gain': best_ig,
                         'remaining_count': len(remaining),
                     }
 
-                if show_progress and (i + 1) % 25 == 0:
+                if show_progress and (index + 1) % 25 == 0:
                     elapsed = time.time() - start_time
-                    print(f"  Progress: {i + 1}/{pattern_count} patterns ({elapsed:.1f}s)")
+                    print(f"  Progress: {index + 1}/{len(PATTERN_CODES)} patterns ({elapsed:.1f}s)")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
-        # Record computation metadata
-        computation_time = time.time() - start_time
-        self.tree['computed_at'] = time.time()
-        self.tree['computation_time'] = computation_time
+    def _compute_best_guess_from_matrix(
+        self,
+        candidate_indices: Any,
+        solutions: List[str],
+        vocabulary: List[str],
+        vocabulary_index: Dict[str, int],
+        pattern_matrix: Any,
+        info_gain_calc: 'InformationGainCalculator',
+        pool: Optional['multiprocessing.pool.Pool'] = None,
+    ) -> Tuple[str, float]:
+        """
+        Matrix equivalent of _compute_best_guess for a subset of solutions.
 
-        if show_progress:
-            print(f"\nDecision tree computed in {computation_time:.1f} seconds")
-            valid_patterns = len([p for p in self.tree['responses'] if self.tree['responses'][p]])
-            print(f"  Valid response patterns: {valid_patterns}")
+        Args:
+            candidate_indices: Indices into solutions of the current candidates
+            solutions: All possible solutions (the matrix columns)
+            vocabulary: Full guess vocabulary (the matrix rows)
+            vocabulary_index: Word -> row index in the matrix
+            pattern_matrix: Vocabulary x solutions pattern codes
+            info_gain_calc: Calculator for candidates missing from the vocabulary
+            pool: Process pool set up with _init_matrix_worker, used to
+                split whole-vocabulary scans into row ranges
 
-        # Save to cache
-        if self.cache_file:
-            if self._save_cache():
-                if show_progress:
-                    print(f"  Cached to: {self.cache_file}")
+        Returns:
+            Tuple of (best_word, info_gain)
+        """
+        candidates = [solutions[i] for i in candidate_indices]
+        if len(candidates) <= 2:
+            # With 1-2 candidates, just guess one
+            return candidates[0], 0.0 if len(candidates) == 1 else 1.0
+
+        # For larger candidate sets, evaluate full vocabulary
+        # This allows "insight" guesses that aren't candidates
+        if len(candidates) > 10:
+            if pool is not None:
+                return self._best_matrix_row_parallel(
+                    pool, candidate_indices, candidates, vocabulary
+                )
+            words = vocabulary
+            row_blocks = [
+                pattern_matrix[start:start + PARALLEL_ROW_CHUNK, candidate_indices]
+                for start in range(0, len(vocabulary), PARALLEL_ROW_CHUNK)
+            ]
+        else:
+            rows = [vocabulary_index.get(word) for word in candidates]
+            if None in rows:
+                return self._compute_best_guess(candidates, vocabulary, info_gain_calc)
+            words = candidates
+            row_blocks = [pattern_matrix[np.ix_(rows, candidate_indices)]]
+
+        # Scan in row blocks, stopping once a guess reaches the bound (later
+        # rows could only tie). argmax picks the first of equal scores, like
+        # the serial scan.
+        ceiling = max_information_gain(len(candidates)) - MAX_GAIN_TOLERANCE
+        best_row, best_ig = 0, 0.0
+        offset = 0
+        for block in row_blocks:
+            gains = pattern_matrix_gains(block)
+            best = int(np.argmax(gains))
+            if gains[best] > best_ig:
+                best_row, best_ig = offset + best, float(gains[best])
+            if best_ig >= ceiling:
+                break
+            offset += len(block)
+
+        if best_ig <= 0.0:
+            return candidates[0], 0.0
+        return words[best_row], best_ig
+
+    @staticmethod
+    def _best_matrix_row_parallel(
+        pool: 'multiprocessing.pool.Pool',
+        candidate_indices: Any,
+        candidates: List[str],
+        vocabulary: List[str],
+    ) -> Tuple[str, float]:
+        """
+        Scan the whole vocabulary for the best guess in row ranges on a pool.
+
+        Args:
+            pool: Process pool set up with _init_matrix_worker
+            candidate_indices: Indices into solutions of the current candidates
+            candidates: The current candidate words
+            vocabulary: Full guess vocabulary (the matrix rows)
+
+        Returns:
+            Tuple of (best_word, info_gain)
+        """
+        tasks = [
+            (start, min(start + PARALLEL_ROW_CHUNK, len(vocabulary)), candidate_indices)
+            for start in range(0, len(vocabulary), PARALLEL_ROW_CHUNK)
+        ]
+
+        # imap returns ranges in order, so ties resolve as with one argmax
+        ceiling = max_information_gain(len(candidates)) - MAX_GAIN_TOLERANCE
+        best_row, best_ig = 0, 0.0
+        for row, ig in pool.imap(_best_matrix_row, tasks):
+            if ig > best_ig:
+                best_row, best_ig = row, ig
+            if best_ig >= ceiling:
+                break
+
+        if best_ig <= 0.0:
+            return candidates[0], 0.0
+        return vocabulary[best_row], best_ig
+
+    def _compute_response(
+        self,
+        remaining: List[str],
+        vocabulary: List[str],
+        info_gain_calc: 'InformationGainCalculator',
+        vocabulary_array: Optional[Any] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compute the second-guess entry for one first-guess response pattern.
+
+        Args:
+            remaining: Solutions that produce the pattern for the first guess
+            vocabulary: Full guess vocabulary
+            info_gain_calc: Calculator instance
+            vocabulary_array: encode_words(vocabulary), if available
+
+        Returns:
+            Response entry dict, or None if no solution produces the pattern
+        """
+        if not remaining:
+            return None  # No solutions match this pattern
+
+        if len(remaining) == 1:
+            # Only one solution left - guess it
+            return {
+                'best_guess': remaining[0],
+                'info_gain': 0.0,
+                'remaining_count': 1,
+            }
+
+        # Compute best second guess
+        best_word, best_ig = self._compute_best_guess(
+            remaining,
+            vocabulary,
+            info_gain_calc,
+            show_progress=False,
+            vocabulary_array=vocabulary_array,
+        )
+
+        return {
+            'best_guess': best_word,
+            'info_gain': best_ig,
+            'remaining_count': len(remaining),
+        }
+
+    def _compute_best_first_guess_parallel(
+        self,
+        pool: 'multiprocessing.pool.Pool',
+        workers: int,
+        solutions: List[str],
+        vocabulary: List[str],
+        show_progress: bool = False,
+    ) -> Tuple[str, float]:
+        """
+        Compute the best first guess by scoring vocabulary shards in a pool.
+
+        Picks the same word as _compute_best_guess: the first word in
+        vocabulary order with the highest information gain.
+
+        Args:
+            pool: Process pool set up with _init_worker
+            workers: Number of worker processes
+            solutions: All possible solutions
+            vocabulary: Full guess vocabulary
+            show_progress: Whether to show progress
+
+        Returns:
+            Tuple of (best_word, info_gain)
+        """
+        if len(solutions) <= 2:
+            return self._compute_best_guess(solutions, vocabulary, None)
+
+        words_to_evaluate = vocabulary if len(solutions) > 10 else solutions
+
+        # Several shards per worker keeps the pool busy and progress visible
+        shard_size = max(1, -(-len(words_to_evaluate) // (workers * 4)))
+        shards = [
+            words_to_evaluate[i:i + shard_size]
+            for i in range(0, len(words_to_evaluate), shard_size)
+        ]
+
+        best_word = solutions[0]
+        best_ig = 0.0
+        evaluated = 0
+
+        # imap returns shards in order, so ties resolve as in the serial scan
+        for shard, scores in zip(shards, pool.imap(_score_words, shards)):
+            for word, ig in zip(shard, scores):
+                if ig > best_ig:
+                    best_ig = ig
+                    best_word = word
+
+            evaluated += len(shard)
+            if show_progress:
+                print(f"    Evaluated {evaluated}/{len(words_to_evaluate)} words...")
+
+        return best_word, best_ig
 
     def _compute_best_guess(
         self,
@@ -360,6 +957,7 @@ class DecisionTree:
         vocabulary: List[str],
         info_gain_calc: 'InformationGainCalculator',
         show_progress: bool = False,
+        vocabulary_array: Optional[Any] = None,
     ) -> Tuple[str, float]:
         """
         Compute the best guess for a set of candidates.
@@ -372,6 +970,7 @@ class DecisionTree:
             vocabulary: Full guess vocabulary
             info_gain_calc: Calculator instance
             show_progress: Whether to show progress
+            vocabulary_array: encode_words(vocabulary), if available
 
         Returns:
             Tuple of (best_word, info_gain)
@@ -385,17 +984,37 @@ class DecisionTree:
 
         # For larger candidate sets, evaluate full vocabulary
         # This allows "insight" guesses that aren't candidates
-        words_to_evaluate = vocabulary if len(candidates) > 10 else candidates
-
-        for i, word in enumerate(words_to_evaluate):
-            ig = info_gain_calc.calculate_information_gain(word, candidates)
-
-            if ig > best_ig:
-                best_ig = ig
-                best_word = word
-
-            if show_progress and (i + 1) % 500 == 0:
-                print(f"    Evaluated {i + 1}/{len(words_to_evaluate)} words...")
+        if len(candidates) > 10:
+            words_to_evaluate = vocabulary
+            words_array = vocabulary_array
+        else:
+            words_to_evaluate = candidates
+            words_array = None
+        candidates_array = encode_words(candidates) if words_array is not None else None
+
+        # Score in blocks so progress can still be reported, stopping once a
+        # guess reaches the bound (later words could only tie)
+        ceiling = max_information_gain(len(candidates)) - MAX_GAIN_TOLERANCE
+        cand_key = candidates_key(candidates)
+        for start in range(0, len(words_to_evaluate), SCORE_BLOCK_SIZE):
+            words = words_to_evaluate[start:start + SCORE_BLOCK_SIZE]
+            scores = info_gain_calc.score_guesses(
+                words,
+                candidates,
+                guess_array=words_array[start:start + SCORE_BLOCK_SIZE] if words_array is not None else None,
+                candidate_array=candidates_array,
+                cand_key=cand_key,
+            )
+
+            for word, ig in zip(words, scores):
+                if ig > best_ig:
+                    best_ig = ig
+                    best_word = word
+            if best_ig >= ceiling:
+                break
+
+            if show_progress and len(words) == SCORE_BLOCK_SIZE:
+                print(f"    Evaluated {start + SCORE_BLOCK_SIZE}/{len(words_to_evaluate)} words...")
 
         return best_word, best_ig
 
@@ -419,12 +1038,12 @@ class DecisionTree:
                      f"({self.tree['first_guess_info_gain']:.3f} bits)")
         lines.append(f"Solutions analyzed: {self.tree['solutions_count']}")
 
-        responses = self.tree.get('responses', {})
+        responses = [entry for entry in self.tree.get('responses', []) if entry]
         lines.append(f"Response patterns cached: {len(responses)}")
 
         if responses:
             # Analyze patterns
-            remaining_counts = [r['remaining_count'] for r in responses.values()]
+            remaining_counts = [r['remaining_count'] for r in responses]
             avg_remaining = sum(remaining_counts) / len(remaining_counts)
             max_remaining = max(remaining_counts)
             min_remaining = min(remaining_counts)
@@ -5,9 +5,15 @@ Provides utilities to read and update .env file values,
 particularly for caching computed values like optimal first guess.
 """
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
+# OPTIMAL_FIRST_GUESS assignment lines, capturing the value
+OPTIMAL_FIRST_GUESS_LINE = re.compile(r'^[ \t]*OPTIMAL_FIRST_GUESS=(.*)$', re.MULTILINE)
+# Lines write_optimal_first_guess replaces, including the commented-out example
+OPTIMAL_FIRST_GUESS_SLOT = re.compile(r'^[ \t]*(?:# )?OPTIMAL_FIRST_GUESS=.*$', re.MULTILINE)
+
 
 def get_env_file_path() -> Path:
     """
@@ -36,13 +42,13 @@ def read_optimal_first_guess() -> Optional[str]:
 
     try:
         with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('OPTIMAL_FIRST_GUESS='):
-                    value = line.split('=', 1)[1].strip()
-                    # Return None if value is empty or just a comment
-                    if value and not value.startswith('#'):
-                        return value.lower()
+            content = f.read()
+
+        for match in OPTIMAL_FIRST_GUESS_LINE.finditer(content):
+            value = match.group(1).strip()
+            # Skip values that are empty or just a comment
+            if value and not value.startswith('#'):
+                return value.lower()
         return None
     except Exception:
         return None
@@ -81,29 +87,22 @@ def write_optimal_first_guess(word: str) -> bool:
                     return False
 
     try:
-        # Read existing content
-        lines = []
-        found = False
-
         with open(env_file, 'r') as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped.startswith('OPTIMAL_FIRST_GUESS=') or stripped.startswith('# OPTIMAL_FIRST_GUESS='):
-                    # Replace existing line
-                    lines.append(f'OPTIMAL_FIRST_GUESS={word.lower()}\n')
-                    found = True
-                else:
-                    lines.append(line)
+            content = f.read()
+
+        # Replace existing (or commented-out) lines in one pass
+        assignment = f'OPTIMAL_FIRST_GUESS={word.lower()}'
+        content, found = OPTIMAL_FIRST_GUESS_SLOT.subn(lambda _: assignment, content)
 
         # If not found, append to end
         if not found:
-            if lines and not lines[-1].endswith('\n'):
-                lines.append('\n')
-            lines.append(f'OPTIMAL_FIRST_GUESS={word.lower()}\n')
+            if content and not content.endswith('\n'):
+                content += '\n'
+            content += assignment + '\n'
 
         # Write back
         with open(env_file, 'w') as f:
-            f.writelines(lines)
+            f.write(content)
 
         return True
 
@@ -13,12 +13,499 @@ V2.0 Key Improvement:
 Performance Notes:
 - Single information gain calculation: ~0.001s for 2,315 candidates
 - Full first guess optimization: ~15s for 2,315 solutions x 12,972 vocabulary
-- Caching significantly improves repeated calculations
+  (~2s with NumPy)
+- Caching significantly improves repeated calculations, and with a
+  cache_file the cache is kept across sessions
 - Pre-computed decision trees eliminate first guess calculation at runtime
+- With NumPy installed, calculate_information_gain and score_guesses
+  evaluate each guess against all candidates at once from a (N, 5) uint8
+  letter array (encoded once per candidate list)
+- With Numba also installed, score_guesses runs a compiled kernel that
+  splits guesses across CPU cores; the full first guess takes ~0.4s even
+  on a single core, after a one-time compile that is cached on disk
 """
+import atexit
+import functools
+import hashlib
 import math
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Optional
+
+# NumPy is optional; without it information gain is computed per candidate
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional too; with it score_guesses runs a compiled kernel over
+# all CPU cores instead of the NumPy pattern matrix
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Keep compiled kernels in Numba's on-disk cache (src/__pycache__) only when
+# this module is imported as top-level information_gain, as the app and
+# scripts do. Cached entries record the importing module's name, and both
+# names share one cache directory, so an entry written under
+# src.information_gain would fail to load for the app (and vice versa);
+# under that name the kernel is compiled in memory instead
+JIT_CACHE = __name__ == 'information_gain'
+
+# Below this many candidates, per-word Python scoring beats NumPy call overhead
+VECTORIZE_MIN_CANDIDATES = 64
+
+# Rows of a pattern matrix scored per bincount in pattern_matrix_gains are
+# chosen to keep each block to about this many elements
+PATTERN_BLOCK_ELEMENTS = 1 << 22
+
+# Guesses scored per score_guesses call when ranking a whole vocabulary
+# (also the progress reporting interval)
+SCORE_BLOCK_SIZE = 500
+
+# (guess, target) pattern codes memoized by _pattern_code; lookahead search
+# revisits the same pairs across sibling partitions
+PATTERN_CODE_CACHE_SIZE = 1 << 16
+
+# Format of the persisted information gain cache, and the most entries it
+# keeps (the most recently added)
+CACHE_FORMAT_VERSION = 1
+MAX_PERSISTED_ENTRIES = 200_000
+
+# A gain this close to max_information_gain() can't be beaten, so a search
+# stops there
+MAX_GAIN_TOLERANCE = 1e-9
+
+# log2 of every partition/candidate count below LOG2_TABLE_SIZE (covers the
+# full guess vocabulary), so hot loops index a list instead of calling log2
+LOG2_TABLE_SIZE = 1 << 14
+LOG2 = [0.0] + [math.log2(i) for i in range(1, LOG2_TABLE_SIZE)]
+
+
+def encode_words(words: List[str]) -> Optional[Any]:
+    """
+    Encode 5-letter lowercase words as a (N, 5) uint8 array of letter indices.
+
+    Args:
+        words: Words to encode
+
+    Returns:
+        NumPy array with a = 0 .. z = 25, or None if NumPy is not installed
+    """
+    if np is None:
+        return None
+    data = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return data.reshape(-1, 5) - ord('a')
+
+
+def _pattern_codes(guess_row: Any, candidate_array: Any) -> Any:
+    """
+    Compute response patterns of one guess against many candidates.
+
+    Patterns are encoded as base-3 integers (gray = 0, yellow = 1, green = 2
+    per position), following the same duplicate-letter rules as
+    InformationGainCalculator._generate_response_pattern.
+
+    Args:
+        guess_row: Encoded guess, shape (5,)
+        candidate_array: Encoded candidates, shape (N, 5)
+
+    Returns:
+        Array of N pattern codes in range(243)
+    """
+    n = len(candidate_array)
+    rows = np.arange(n)
+    green = candidate_array == guess_row
+
+    # Per-candidate counts of letters not consumed by greens
+    counts = np.zeros((n, 26), dtype=np.int8)
+    for k in range(5):
+        counts[rows, candidate_array[:, k]] += ~green[:, k]
+
+    codes = np.zeros(n, dtype=np.int16)
+    place = 1
+    for i in range(5):
+        column = counts[:, guess_row[i]]
+        yellow = ~green[:, i] & (column > 0)
+        column -= yellow
+        codes += (2 * green[:, i] + yellow) * place
+        place *= 3
+    return codes
+
+
+def _letter_counts(candidate_array: Any) -> Any:
+    """Count each letter a-z in every encoded candidate, shape (N, 26) int8."""
+    counts = np.zeros((len(candidate_array), 26), dtype=np.int8)
+    rows = np.arange(len(candidate_array))
+    for k in range(5):
+        counts[rows, candidate_array[:, k]] += 1
+    return counts
+
+
+def _block_pattern_codes(guess_block: Any, candidate_array: Any, letter_counts: Any) -> Any:
+    """
+    Compute response patterns of a block of guesses against many candidates.
+
+    Rather than scattering each pair's leftover letters into a per-letter
+    table, the target letters available to guess position i are counted
+    arithmetically: the candidate's count of that letter, minus greens on
+    the same letter, minus yellows already given to it at earlier
+    positions. Every step is an elementwise op over the whole block.
+
+    Args:
+        guess_block: Encoded guesses, shape (B, 5)
+        candidate_array: Encoded candidates, shape (N, 5)
+        letter_counts: _letter_counts(candidate_array)
+
+    Returns:
+        (B, N) uint8 array of pattern codes (see _pattern_codes)
+    """
+    green = guess_block[:, None, :] == candidate_array[None, :, :]
+    # same[b, i, j]: guess b has the same letter at positions i and j
+    same = guess_block[:, :, None] == guess_block[:, None, :]
+
+    codes = np.zeros(green.shape[:2], dtype=np.uint8)
+    yellows = []
+    place = 1
+    for i in range(5):
+        available = letter_counts[:, guess_block[:, i]].T
+        for k in range(5):
+            available = available - (green[:, :, k] & same[:, i, k, None])
+        for j in range(i):
+            available = available - (yellows[j] & same[:, i, j, None])
+        yellow = ~green[:, :, i] & (available > 0)
+        yellows.append(yellow)
+        codes += (2 * green[:, :, i] + yellow).astype(np.uint8) * np.uint8(place)
+        place *= 3
+    return codes
+
+
+if njit is not None:
+    @njit(parallel=True, cache=JIT_CACHE)
+    def _jit_guess_gains(guess_array, candidate_array):
+        """
+        Information gain of each encoded guess against encoded candidates.
+
+        Compiled equivalent of pattern_matrix_gains(build_pattern_matrix(...)):
+        guesses are split across threads, and each computes its pattern
+        codes with a 26-entry table of unmatched target letters and counts
+        them into its own 243-entry buffer.
+
+        Args:
+            guess_array: Encoded guesses, shape (V, 5)
+            candidate_array: Encoded candidates, shape (N, 5)
+
+        Returns:
+            Array of V information gains in bits
+        """
+        v = guess_array.shape[0]
+        n = candidate_array.shape[0]
+        gains = np.zeros(v)
+        log2_n = np.log2(n)
+        for g in prange(v):
+            counts = np.zeros(243, np.int64)
+            unmatched = np.zeros(26, np.int8)
+            for c in range(n):
+                for k in range(5):
+                    if candidate_array[c, k] != guess_array[g, k]:
+                        unmatched[candidate_array[c, k]] += 1
+                code = 0
+                place = 1
+                for i in range(5):
+                    letter = guess_array[g, i]
+                    if letter == candidate_array[c, i]:
+                        code += 2 * place
+                    elif unmatched[letter] > 0:
+                        unmatched[letter] -= 1
+                        code += place
+                    place *= 3
+                for k in range(5):
+                    unmatched[candidate_array[c, k]] = 0
+                counts[code] += 1
+
+            weighted = 0.0
+            for code in range(243):
+                if counts[code] > 1:
+                    weighted += counts[code] * np.log2(counts[code])
+            gains[g] = log2_n - weighted / n
+        return gains
+else:
+    _jit_guess_gains = None
+
+
+def build_pattern_matrix(guess_array: Any, candidate_array: Any) -> Any:
+    """
+    Compute the response pattern of every guess against every candidate.
+
+    Args:
+        guess_array: Encoded guesses, shape (V, 5)
+        candidate_array: Encoded candidates, shape (N, 5)
+
+    Returns:
+        (V, N) uint8 array of base-3 pattern codes (see _pattern_codes)
+    """
+    v, n = len(guess_array), len(candidate_array)
+    matrix = np.empty((v, n), dtype=np.uint8)
+    letter_counts = _letter_counts(candidate_array)
+    block = max(1, PATTERN_BLOCK_ELEMENTS // (5 * max(n, 1)))
+    for start in range(0, v, block):
+        matrix[start:start + block] = _block_pattern_codes(
+            guess_array[start:start + block], candidate_array, letter_counts
+        )
+    return matrix
+
+
+def pattern_matrix_gains(matrix: Any) -> Any:
+    """
+    Information gain of each row's guess against the column candidates.
+
+    Partition sizes for a block of rows come from one bincount over the
+    row-offset codes, so no per-guess Python work is needed.
+
+    Args:
+        matrix: (V, N) pattern codes, e.g. a column subset of build_pattern_matrix()
+
+    Returns:
+        Array of V information gains in bits
+    """
+    v, n = matrix.shape
+    gains = np.zeros(v)
+    if n <= 1:
+        return gains
+
+    log2_n = math.log2(n)
+    # size * log2(size) for every possible partition size, gathered by count
+    sizes = np.arange(n + 1)
+    size_log_size = sizes * np.log2(np.maximum(sizes, 1))
+    block = max(1, PATTERN_BLOCK_ELEMENTS // n)
+    for start in range(0, v, block):
+        rows = matrix[start:start + block]
+        offsets = np.arange(len(rows), dtype=np.intp)[:, None] * 243
+        counts = np.bincount((rows + offsets).ravel(), minlength=len(rows) * 243)
+        counts = counts.reshape(len(rows), 243)
+        weighted = size_log_size[counts]
+        gains[start:start + len(rows)] = log2_n - weighted.sum(axis=1) / n
+    return gains
+
+
+def _is_encodable(word: str) -> bool:
+    """Check that a word fits encode_words (five lowercase ASCII letters)."""
+    return len(word) == 5 and word.isascii() and word.isalpha() and word.islower()
+
+
+@functools.lru_cache(maxsize=PATTERN_CODE_CACHE_SIZE)
+def _pattern_code(guess: str, target: str) -> int:
+    """
+    Base-3 response pattern code for one guess/target pair (pure Python).
+
+    Same encoding and duplicate-letter rules as _pattern_codes.
+
+    Args:
+        guess: The guessed word
+        target: The target/solution word
+
+    Returns:
+        Pattern code in range(243)
+    """
+    if len(guess) != 5 or len(target) != 5:
+        raise ValueError("Both guess and target must be 5 letters")
+
+    # Target letters left over for yellows once greens are taken
+    unmatched = [t for g, t in zip(guess, target) if g != t]
+
+    code = 0
+    place = 1
+    for i in range(5):
+        letter = guess[i]
+        if letter == target[i]:
+            code += 2 * place
+        elif letter in unmatched:
+            unmatched.remove(letter)
+            code += place
+        place *= 3
+    return code
+
+
+def _response_from_code(guess: str, code: int) -> str:
+    """
+    Spell out a pattern code in InformationGainCalculator's response format.
+
+    Args:
+        guess: The guessed word
+        code: Pattern code from _pattern_codes or _pattern_code
+
+    Returns:
+        Response string (uppercase = green, lowercase = yellow, '?' = gray)
+    """
+    response = []
+    for letter in guess:
+        code, digit = divmod(code, 3)
+        if digit == 2:
+            response.append(letter.upper())
+        elif digit == 1:
+            response.append(letter.lower())
+        else:
+            response.append('?')
+    return ''.join(response)
+
+
+def response_pattern(guess: str, target: str) -> str:
+    """
+    Generate a Wordle response pattern for a guess against a target word.
+
+    Shared by InformationGainCalculator and LookaheadEngine:
+    - UPPERCASE letter = green (correct position)
+    - lowercase letter = yellow (in word, wrong position)
+    - '?' = gray (not in word)
+
+    Args:
+        guess: The guessed word
+        target: The target/solution word
+
+    Returns:
+        Response pattern string (e.g., "Cr?nE" for guess "crane" vs target "crate")
+
+    Raises:
+        ValueError: If guess or target is not exactly 5 letters
+    """
+    return _response_from_code(guess, _pattern_code(guess, target))
+
+
+def candidates_key(candidates: List[str]) -> int:
+    """
+    Content key for a candidate list, for calculate_information_gain's cache.
+
+    Unlike hash(), the key is the same in every process, so cached gains can
+    be persisted. Hashing a full word list isn't free, so callers scoring
+    many guesses against one list should compute this once and pass it in.
+
+    Args:
+        candidates: List of remaining candidate words
+
+    Returns:
+        64-bit digest of the candidate words in order
+    """
+    digest = hashlib.blake2b('\n'.join(candidates).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def max_information_gain(n: int) -> float:
+    """
+    Upper bound on any guess's information gain over n candidates.
+
+    A guess splits the candidates into at most min(n, 243) response
+    patterns, and gains log2 of that when every pattern is equally likely.
+
+    Args:
+        n: Number of candidates
+
+    Returns:
+        Maximum possible information gain in bits
+    """
+    return math.log2(min(n, 243)) if n > 1 else 0.0
+
+
+def _gain_from_counts(counts: Any, n: int) -> float:
+    """
+    Information gain of a guess from its partition sizes over n candidates.
+
+    IG = log2(n) - sum(size * log2(size)) / n over non-empty partitions
+    (singleton partitions contribute nothing).
+
+    Args:
+        counts: Partition sizes (NumPy array or list of ints)
+        n: Number of candidates
+
+    Returns:
+        Information gain in bits
+    """
+    if np is not None and isinstance(counts, np.ndarray):
+        sizes = counts[counts > 1]
+        return math.log2(n) - float(np.dot(sizes, np.log2(sizes))) / n
+    if n < LOG2_TABLE_SIZE:
+        return LOG2[n] - sum(c * LOG2[c] for c in counts if c > 1) / n
+    return math.log2(n) - sum(c * math.log2(c) for c in counts if c > 1) / n
+
+
+def pattern_matrix_file(directory: Path, solutions: List[str], vocabulary: List[str]) -> Path:
+    """
+    Location of the saved pattern matrix for a pair of word lists.
+
+    The name is derived from the lists' contents, so the calculator and
+    decision tree precompute share one file when their caches live in the
+    same directory.
+
+    Args:
+        directory: Cache directory
+        solutions: List of possible solution words
+        vocabulary: Words evaluated as guesses
+
+    Returns:
+        Path of the .npz file for these word lists
+    """
+    return directory / (
+        f"pattern_matrix_{candidates_key(vocabulary):016x}_{candidates_key(solutions):016x}.npz"
+    )
+
+
+def load_or_build_pattern_matrix(
+    solutions: List[str],
+    vocabulary: List[str],
+    path: Optional[Path] = None,
+    show_progress: bool = False,
+) -> Optional[Any]:
+    """
+    Load the vocabulary x solutions pattern matrix, building and saving it if needed.
+
+    The matrix is saved compressed together with the word lists it was
+    built from, and a saved matrix is only used if both lists match.
+
+    Args:
+        solutions: List of possible solution words
+        vocabulary: Words evaluated as guesses
+        path: File to load from and save to (see pattern_matrix_file), or
+            None to always build without saving
+        show_progress: If True, report when the matrix has to be built
+
+    Returns:
+        (V, N) uint8 pattern matrix, or None without NumPy or for word
+        lists encode_words can't represent
+    """
+    if np is None:
+        return None
+
+    if path is not None:
+        try:
+            with np.load(path) as data:
+                if (
+                    data['vocabulary'].tolist() == [w.encode('ascii') for w in vocabulary]
+                    and data['solutions'].tolist() == [w.encode('ascii') for w in solutions]
+                ):
+                    return data['matrix']
+        except (OSError, KeyError, ValueError):
+            pass
+
+    if not all(map(_is_encodable, solutions)) or not all(map(_is_encodable, vocabulary)):
+        return None
+
+    if show_progress:
+        print(f"Building {len(vocabulary)} x {len(solutions)} pattern matrix...", flush=True)
+    matrix = build_pattern_matrix(encode_words(vocabulary), encode_words(solutions))
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez_compressed(
+                path,
+                matrix=matrix,
+                vocabulary=np.array(vocabulary, dtype='S5'),
+                solutions=np.array(solutions, dtype='S5'),
+            )
+        except OSError:
+            pass
+    return matrix
 
 
 class InformationGainCalculator:
@@ -30,10 +517,107 @@ class InformationGainCalculator:
     about the solution.
     """
 
-    def __init__(self) -> None:
-        """Initialize the information gain calculator with empty cache"""
-        self._cache: Dict[Tuple[str, int], float] = {}
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        """
+        Initialize the information gain calculator.
+
+        Args:
+            cache_file: Optional file the calculation cache is loaded from
+                and saved to at exit, so it carries over between sessions
+        """
+        self.cache_file = cache_file
+        self._cache: Dict[Tuple[str, int, int], float] = {}  # (word, size, candidates_key)
         self._first_guess_cache: Optional[Tuple[str, int]] = None  # (word, wordlist_size)
+        # Last candidate list encoded for vectorized scoring: (list, array)
+        self._candidate_array: Optional[Tuple[List[str], Any]] = None
+        # Cache size when last loaded or saved, to skip saving an unchanged cache
+        self._persisted_size = 0
+
+        if cache_file:
+            self._load_cache()
+            atexit.register(self.save_cache)
+
+    def _load_cache(self) -> bool:
+        """
+        Load the calculation cache from cache_file.
+
+        Returns:
+            True if cache was loaded successfully
+        """
+        if not self.cache_file or not self.cache_file.exists():
+            return False
+
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = pickle.load(f)
+
+            if data.get('version') != CACHE_FORMAT_VERSION:
+                return False
+
+            self._cache.update(data['entries'])
+            self._persisted_size = len(self._cache)
+            return True
+
+        except Exception:
+            return False
+
+    def save_cache(self) -> bool:
+        """
+        Save the calculation cache to cache_file, if it has changed.
+
+        Only the most recent MAX_PERSISTED_ENTRIES entries are kept.
+
+        Returns:
+            True if cache was saved successfully
+        """
+        if not self.cache_file or len(self._cache) == self._persisted_size:
+            return False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+            entries = self._cache
+            if len(entries) > MAX_PERSISTED_ENTRIES:
+                items = list(entries.items())[-MAX_PERSISTED_ENTRIES:]
+                entries = dict(items)
+
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(
+                    {'version': CACHE_FORMAT_VERSION, 'entries': entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            self._persisted_size = len(self._cache)
+            return True
+
+        except Exception:
+            return False
+
+    def _encode_candidates(self, candidates: List[str]) -> Optional[Any]:
+        """
+        Encode a candidate list for vectorized scoring, reusing the last result.
+
+        The list itself is kept alongside its array, so an identity check
+        can't match a different list that happens to reuse its id().
+
+        Args:
+            candidates: List of remaining candidate words
+
+        Returns:
+            encode_words(candidates), or None if NumPy is unavailable or a
+            candidate isn't five lowercase letters
+        """
+        cached = self._candidate_array
+        if cached is not None and cached[0] is candidates and len(cached[1]) == len(candidates):
+            return cached[1]
+
+        if np is None or not all(map(_is_encodable, candidates)):
+            return None
+
+        array = encode_words(candidates)
+        self._candidate_array = (candidates, array)
+        return array
 
     def _generate_response_pattern(self, guess: str, target: str) -> str:
         """
@@ -51,28 +635,7 @@ class InformationGainCalculator:
         Returns:
             Response pattern string (e.g., "Cr?nE" for guess "crane" vs target "crate")
         """
-        if len(guess) != 5 or len(target) != 5:
-            raise ValueError("Both guess and target must be 5 letters")
-
-        response = ['?'] * 5
-        target_letters = list(target)
-
-        # First pass: Mark greens (correct position)
-        for i in range(5):
-            if guess[i] == target[i]:
-                response[i] = guess[i].upper()
-                target_letters[i] = None  # Mark as used
-
-        # Second pass: Mark yellows (in word, wrong position)
-        for i in range(5):
-            if response[i] == '?':  # Not already green
-                letter = guess[i]
-                if letter in target_letters:
-                    response[i] = letter.lower()
-                    # Remove first occurrence to handle multiple instances correctly
-                    target_letters[target_letters.index(letter)] = None
-
-        return ''.join(response)
+        return response_pattern(guess, target)
 
     def calculate_partitions(self, word: str, candidates: List[str]) -> Dict[str, List[str]]:
         """
@@ -90,13 +653,71 @@ class InformationGainCalculator:
             Dictionary mapping response patterns to lists of candidates that produce
             that pattern (e.g., {"CRANE": ["crane"], "Cr?nE": ["crate"], ...})
         """
-        partitions: Dict[str, List[str]] = defaultdict(list)
+        return {
+            _response_from_code(word, code): group
+            for code, group in self.group_by_pattern(word, candidates).items()
+        }
 
-        for candidate in candidates:
-            pattern = self._generate_response_pattern(word, candidate)
-            partitions[pattern].append(candidate)
+    def group_by_pattern(
+        self,
+        word: str,
+        candidates: List[str],
+        codes: Optional[List[int]] = None,
+    ) -> Dict[int, List[str]]:
+        """
+        Group candidates by the response pattern a guess would get from each.
+
+        Patterns are base-3 integer codes (see _pattern_codes), which are
+        cheaper to build and hash than response strings; partitions appear
+        in order of their first candidate, as in calculate_partitions.
+
+        Args:
+            word: The guess word to evaluate
+            candidates: List of remaining candidate words
+            codes: Pattern code of word against each candidate, if already
+                computed (e.g. a row of batch_partition's codes)
+
+        Returns:
+            Dictionary mapping pattern codes to the candidates producing them
+        """
+        if codes is None and len(candidates) >= VECTORIZE_MIN_CANDIDATES and _is_encodable(word):
+            candidate_array = self._encode_candidates(candidates)
+            if candidate_array is not None:
+                codes = _pattern_codes(encode_words([word])[0], candidate_array).tolist()
+        if codes is None:
+            codes = [_pattern_code(word, candidate) for candidate in candidates]
+
+        groups: Dict[int, List[str]] = {}
+        for code, candidate in zip(codes, candidates):
+            groups.setdefault(code, []).append(candidate)
+        return groups
+
+    def calculate_partition_counts(self, word: str, candidates: List[str]) -> Any:
+        """
+        Count how many candidates fall into each response pattern for a guess.
+
+        Like calculate_partitions, but only the partition sizes are kept,
+        indexed by base-3 pattern code (gray = 0, yellow = 1, green = 2 per
+        position), so no per-pattern lists or pattern strings are built.
 
-        return dict(partitions)
+        Args:
+            word: The guess word to evaluate
+            candidates: List of remaining candidate words
+
+        Returns:
+            243 partition sizes: a NumPy array when the vectorized path is
+            used, otherwise a list of ints
+        """
+        if len(candidates) >= VECTORIZE_MIN_CANDIDATES and _is_encodable(word):
+            candidate_array = self._encode_candidates(candidates)
+            if candidate_array is not None:
+                guess_row = encode_words([word])[0]
+                return np.bincount(_pattern_codes(guess_row, candidate_array), minlength=243)
+
+        counts = [0] * 243
+        for candidate in candidates:
+            counts[_pattern_code(word, candidate)] += 1
+        return counts
 
     def calculate_entropy(self, candidates: List[str]) -> float:
         """
@@ -119,7 +740,12 @@ class InformationGainCalculator:
         n = len(candidates)
         return math.log2(n)
 
-    def calculate_information_gain(self, word: str, candidates: List[str]) -> float:
+    def calculate_information_gain(
+        self,
+        word: str,
+        candidates: List[str],
+        cand_key: Optional[int] = None,
+    ) -> float:
         """
         Calculate expected information gain for a guess word.
 
@@ -133,6 +759,7 @@ class InformationGainCalculator:
         Args:
             word: The guess word to evaluate
             candidates: List of remaining candidate words
+            cand_key: candidates_key(candidates), if already computed
 
         Returns:
             Information gain value in bits (higher = better guess)
@@ -144,45 +771,108 @@ class InformationGainCalculator:
         if len(candidates) == 2:
             return 1.0  # log2(2) = 1 bit of information
 
-        # Use candidate list length as a simple hash for cache key
-        # This works because in practice, we're usually evaluating the same
-        # candidate set multiple times within a game state
-        candidates_id = id(candidates)  # Use object identity for fast lookup
-        cache_key = (word, candidates_id)
+        # Key on the candidates' contents: an id() can be reused by a
+        # different list, and misses equal lists rebuilt between calls
+        if cand_key is None:
+            cand_key = candidates_key(candidates)
+        cache_key = (word, len(candidates), cand_key)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        # Calculate current entropy
-        current_entropy = self.calculate_entropy(candidates)
+        # Only partition sizes matter: a uniform partition of size s has
+        # entropy log2(s), so IG = log2(n) - sum(s * log2(s)) / n
+        counts = self.calculate_partition_counts(word, candidates)
+        info_gain = _gain_from_counts(counts, len(candidates))
 
-        # Calculate partitions
-        partitions = self.calculate_partitions(word, candidates)
+        # Cache the result
+        self._cache[cache_key] = info_gain
 
-        # Early termination: if guess is in candidates and creates a unique partition
-        # This is the best possible outcome
-        if len(partitions) == len(candidates):
-            info_gain = current_entropy  # Maximum possible information gain
-            self._cache[cache_key] = info_gain
-            return info_gain
+        return info_gain
 
-        # Calculate weighted average entropy across partitions
-        total_candidates = len(candidates)
-        expected_entropy = 0.0
+    def score_guesses(
+        self,
+        guesses: List[str],
+        candidates: List[str],
+        guess_array: Optional[Any] = None,
+        candidate_array: Optional[Any] = None,
+        cand_key: Optional[int] = None,
+    ) -> List[float]:
+        """
+        Calculate information gain for many guesses against one candidate set.
 
-        for partition_candidates in partitions.values():
-            partition_size = len(partition_candidates)
-            probability = partition_size / total_candidates
-            partition_entropy = self.calculate_entropy(partition_candidates)
-            expected_entropy += probability * partition_entropy
+        With NumPy available and enough candidates, patterns for each guess
+        are computed over all candidates at once (by a compiled, multi-core
+        kernel if Numba is installed); otherwise this is the same as calling
+        calculate_information_gain for each guess.
 
-        # Information gain = reduction in entropy
-        info_gain = current_entropy - expected_entropy
+        Args:
+            guesses: Guess words to evaluate
+            candidates: List of remaining candidate words
+            guess_array: encode_words(guesses), if already computed
+            candidate_array: encode_words(candidates), if already computed
+            cand_key: candidates_key(candidates), if already computed
 
-        # Cache the result
-        self._cache[cache_key] = info_gain
+        Returns:
+            Information gain for each guess, in the same order as guesses
+        """
+        if np is not None and len(candidates) >= VECTORIZE_MIN_CANDIDATES:
+            if guess_array is None and all(map(_is_encodable, guesses)):
+                guess_array = encode_words(guesses)
+            if guess_array is not None and candidate_array is None:
+                candidate_array = self._encode_candidates(candidates)
+
+            if guess_array is not None and candidate_array is not None:
+                if _jit_guess_gains is not None:
+                    return _jit_guess_gains(guess_array, candidate_array).tolist()
+                return pattern_matrix_gains(build_pattern_matrix(guess_array, candidate_array)).tolist()
+
+        # Per-word scoring: key the candidate list once for every guess
+        if cand_key is None:
+            cand_key = candidates_key(candidates)
+        return [self.calculate_information_gain(word, candidates, cand_key) for word in guesses]
+
+    def batch_partition(
+        self,
+        guesses: List[str],
+        candidates: List[str],
+        cand_key: Optional[int] = None,
+    ) -> Optional[Tuple[Any, Any]]:
+        """
+        Pattern codes and partition sizes of many guesses against one candidate set.
 
-        return info_gain
+        All patterns come from one build_pattern_matrix pass, so a caller
+        that both ranks the guesses and partitions candidates by them (as
+        lookahead search does) simulates each response once. Each guess's
+        information gain is cached as calculate_information_gain would.
+
+        Args:
+            guesses: Guess words to evaluate
+            candidates: List of remaining candidate words
+            cand_key: candidates_key(candidates), if already computed
+
+        Returns:
+            Tuple of ((V, 243) partition sizes, (V, N) pattern codes), or
+            None without NumPy, with fewer than VECTORIZE_MIN_CANDIDATES
+            candidates, or with words encode_words can't represent
+        """
+        n = len(candidates)
+        if np is None or n < VECTORIZE_MIN_CANDIDATES or not all(map(_is_encodable, guesses)):
+            return None
+        candidate_array = self._encode_candidates(candidates)
+        if candidate_array is None:
+            return None
+
+        codes = build_pattern_matrix(encode_words(guesses), candidate_array)
+        offsets = np.arange(len(guesses), dtype=np.intp)[:, None] * 243
+        counts = np.bincount((codes + offsets).ravel(), minlength=len(guesses) * 243)
+        counts = counts.reshape(len(guesses), 243)
+
+        if cand_key is None:
+            cand_key = candidates_key(candidates)
+        for word, row in zip(guesses, counts):
+            self._cache[(word, n, cand_key)] = _gain_from_counts(row, n)
+        return counts, codes
 
     def get_best_guess(
         self,
@@ -221,18 +911,25 @@ class InformationGainCalculator:
 
         best_word = solutions[0]
         best_info_gain = 0.0
+        # Later words can at best tie a guess at the bound, and ties keep the first
+        ceiling = max_information_gain(len(solutions)) - MAX_GAIN_TOLERANCE
+        cand_key = candidates_key(solutions)
 
-        for i, word in enumerate(vocabulary):
-            # Calculate info gain against solutions, not vocabulary
-            info_gain = self.calculate_information_gain(word, solutions)
-
-            if info_gain > best_info_gain:
-                best_info_gain = info_gain
-                best_word = word
+        for start in range(0, len(vocabulary), SCORE_BLOCK_SIZE):
+            words = vocabulary[start:start + SCORE_BLOCK_SIZE]
 
-            if show_progress and (i + 1) % 500 == 0:
-                progress_pct = ((i + 1) / len(vocabulary)) * 100
-                print(f"  Progress: {i + 1}/{len(vocabulary)} words ({progress_pct:.0f}%)...", flush=True)
+            # Calculate info gain against solutions, not vocabulary
+            for word, info_gain in zip(words, self.score_guesses(words, solutions, cand_key=cand_key)):
+                if info_gain > best_info_gain:
+                    best_info_gain = info_gain
+                    best_word = word
+            if best_info_gain >= ceiling:
+                break
+
+            done = start + len(words)
+            if show_progress and len(words) == SCORE_BLOCK_SIZE:
+                progress_pct = (done / len(vocabulary)) * 100
+                print(f"  Progress: {done}/{len(vocabulary)} words ({progress_pct:.0f}%)...", flush=True)
 
         if show_progress:
             print(f"✓ Best guess: {best_word.upper()} (info gain: {best_info_gain:.2f} bits)\n")
@@ -273,18 +970,55 @@ class InformationGainCalculator:
         if self._first_guess_cache and self._first_guess_cache[1] == cache_key:
             return self._first_guess_cache[0]
 
-        # Use the new get_best_guess method
-        best_word, best_info_gain = self.get_best_guess(
-            solutions=wordlist,
-            vocabulary=vocabulary,
-            show_progress=show_progress,
+        pattern_matrix = self._load_or_build_pattern_matrix(
+            wordlist, vocabulary or wordlist, show_progress
         )
+        if pattern_matrix is not None:
+            gains = pattern_matrix_gains(pattern_matrix)
+            best_row = int(np.argmax(gains))
+            best_word = (vocabulary or wordlist)[best_row] if gains[best_row] > 0 else wordlist[0]
+            if show_progress:
+                print(f"✓ Best guess: {best_word.upper()} (info gain: {gains[best_row]:.2f} bits)\n")
+        else:
+            # Use the new get_best_guess method
+            best_word, best_info_gain = self.get_best_guess(
+                solutions=wordlist,
+                vocabulary=vocabulary,
+                show_progress=show_progress,
+            )
 
         # Cache the result
         self._first_guess_cache = (best_word, cache_key)
 
         return best_word
 
+    def _load_or_build_pattern_matrix(
+        self,
+        solutions: List[str],
+        vocabulary: List[str],
+        show_progress: bool = False,
+    ) -> Optional[Any]:
+        """
+        Load the pattern matrix saved next to cache_file, building it if needed.
+
+        Args:
+            solutions: List of possible solution words
+            vocabulary: Words evaluated as guesses
+            show_progress: If True, report when the matrix has to be built
+
+        Returns:
+            (V, N) uint8 pattern matrix, or None without NumPy, a cache_file,
+            or word lists encode_words can't represent
+        """
+        if not self.cache_file:
+            return None
+        return load_or_build_pattern_matrix(
+            solutions,
+            vocabulary,
+            pattern_matrix_file(self.cache_file.parent, solutions, vocabulary),
+            show_progress,
+        )
+
     def rank_guesses(
         self,
         solutions: List[str],
@@ -311,13 +1045,14 @@ class InformationGainCalculator:
             vocabulary = solutions
 
         results = []
+        cand_key = candidates_key(solutions)
 
-        for i, word in enumerate(vocabulary):
-            info_gain = self.calculate_information_gain(word, solutions)
-            results.append((word, info_gain))
+        for start in range(0, len(vocabulary), SCORE_BLOCK_SIZE):
+            words = vocabulary[start:start + SCORE_BLOCK_SIZE]
+            results.extend(zip(words, self.score_guesses(words, solutions, cand_key=cand_key)))
 
-            if show_progress and (i + 1) % 500 == 0:
-                print(f"  Ranked {i + 1}/{len(vocabulary)} words...", flush=True)
+            if show_progress and len(words) == SCORE_BLOCK_SIZE:
+                print(f"  Ranked {start + len(words)}/{len(vocabulary)} words...", flush=True)
 
         # Sort by info gain descending
         results.sort(key=lambda x: x[1], reverse=True)
@@ -325,6 +1060,13 @@ class InformationGainCalculator:
         return results[:top_n]
 
     def clear_cache(self) -> None:
-        """Clear the calculation cache (typically between games)"""
+        """Clear the calculation cache, including any copy in cache_file"""
         self._cache.clear()
         self._first_guess_cache = None
+        self._persisted_size = 0
+
+        if self.cache_file:
+            try:
+                self.cache_file.unlink()
+            except OSError:
+                pass
@@ -13,11 +13,133 @@ Performance Optimizations:
 - Early termination when outcomes become deterministic (1-2 candidates)
 - Tree pruning when candidate count exceeds threshold
 - Memoization of repeated calculations
+- NumPy masks for filtering large candidate lists
 """
+import math
 import re
+import string
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
-from information_gain import InformationGainCalculator
+from typing import Any, Dict, List, Tuple, Optional
+from information_gain import (
+    LOG2,
+    LOG2_TABLE_SIZE,
+    VECTORIZE_MIN_CANDIDATES,
+    InformationGainCalculator,
+    candidates_key,
+    encode_words,
+    np,
+    response_pattern,
+)
+
+# Letters _survivor_mask can encode
+ALPHABET = frozenset(string.ascii_lowercase)
+
+
+def _fingerprint(candidates: List[str]) -> int:
+    """
+    Order-independent fingerprint of a candidate set, for memoization keys.
+
+    Hashing a frozenset needs no sort (equal sets in any order get the same
+    fingerprint), and only the integer is kept in the cache rather than a
+    tuple of every word.
+
+    Args:
+        candidates: List of distinct candidate words
+
+    Returns:
+        Integer fingerprint
+    """
+    return hash(frozenset(candidates))
+
+
+def _encode_candidates(candidates: List[str]) -> Optional[Any]:
+    """
+    Encode candidates for _survivor_mask.
+
+    Args:
+        candidates: List of candidate words
+
+    Returns:
+        (N, 5) uint8 letter-index array, or None if any candidate is not five
+        lowercase ASCII letters
+    """
+    if any(len(word) != 5 for word in candidates):
+        return None
+    try:
+        candidate_array = encode_words(candidates)
+    except UnicodeEncodeError:
+        return None
+    if (candidate_array > 25).any():
+        return None
+    return candidate_array
+
+
+def _survivor_mask(
+    candidate_array: Any,
+    pattern: List[str],
+    known_letters: Dict[str, List[int]],
+    bad_letters: List[str],
+    min_letter_counts: Dict[str, int]
+) -> Any:
+    """
+    Boolean mask of encoded candidates that satisfy parsed response constraints.
+
+    Vectorized equivalent of the per-word checks in
+    LookaheadEngine.filter_candidates.
+
+    Args:
+        candidate_array: Encoded candidates, shape (N, 5)
+        pattern: Green letter per position, '.' where unknown
+        known_letters: Yellow letter -> positions it may not occupy
+        bad_letters: Letters the target does not contain
+        min_letter_counts: Letter -> minimum occurrences in the target
+
+    Returns:
+        Boolean array of length N
+    """
+    mask = np.ones(len(candidate_array), dtype=bool)
+    for pos, letter in enumerate(pattern):
+        if letter != '.':
+            mask &= candidate_array[:, pos] == ord(letter) - ord('a')
+    for letter, forbidden_positions in known_letters.items():
+        for pos in forbidden_positions:
+            mask &= candidate_array[:, pos] != ord(letter) - ord('a')
+
+    # Only the few constrained letters are counted, not all 26
+    for letter, min_count in min_letter_counts.items():
+        count = (candidate_array == ord(letter) - ord('a')).sum(axis=1)
+        mask &= count >= min_count
+    for letter in set(bad_letters):
+        mask &= ~(candidate_array == ord(letter) - ord('a')).any(axis=1)
+    return mask
+
+
+def _weight_aggressive(partition_scores: List[Tuple[float, float, int]]) -> float:
+    """Minimize average: equal weights (standard expected value)"""
+    return sum(prob * score for prob, score, _ in partition_scores)
+
+
+def _weight_safe(partition_scores: List[Tuple[float, float, int]]) -> float:
+    """Minimize worst-case: 70% weight on worst case, 30% on average"""
+    average = sum(prob * score for prob, score, _ in partition_scores)
+    max_score = max(score for _, score, _ in partition_scores)
+    return 0.3 * average + 0.7 * max_score
+
+
+def _weight_balanced(partition_scores: List[Tuple[float, float, int]]) -> float:
+    """Compromise: 60% average, 40% worst case"""
+    average = sum(prob * score for prob, score, _ in partition_scores)
+    max_score = max(score for _, score, _ in partition_scores)
+    return 0.6 * average + 0.4 * max_score
+
+
+# Outcome weighting for each strategy mode, looked up once per evaluation
+# instead of comparing strategy strings
+OUTCOME_WEIGHTERS = {
+    "aggressive": _weight_aggressive,
+    "safe": _weight_safe,
+    "balanced": _weight_balanced,
+}
 
 
 class LookaheadEngine:
@@ -50,7 +172,7 @@ class LookaheadEngine:
         self.info_gain_calc = info_gain_calculator
 
         # Validate strategy mode
-        valid_strategies = {"aggressive", "safe", "balanced"}
+        valid_strategies = set(OUTCOME_WEIGHTERS)
         if self.strategy_mode not in valid_strategies:
             raise ValueError(
                 f"Invalid strategy mode: {strategy_mode}. "
@@ -79,28 +201,7 @@ class LookaheadEngine:
         Raises:
             ValueError: If guess or target is not exactly 5 letters
         """
-        if len(guess) != 5 or len(target) != 5:
-            raise ValueError("Both guess and target must be 5 letters")
-
-        response = ['?'] * 5
-        target_letters = list(target)
-
-        # First pass: Mark greens (correct position)
-        for i in range(5):
-            if guess[i] == target[i]:
-                response[i] = guess[i].upper()
-                target_letters[i] = None  # Mark as used
-
-        # Second pass: Mark yellows (in word, wrong position)
-        for i in range(5):
-            if response[i] == '?':  # Not already green
-                letter = guess[i]
-                if letter in target_letters:
-                    response[i] = letter.lower()
-                    # Remove first occurrence to handle multiple instances correctly
-                    target_letters[target_letters.index(letter)] = None
-
-        return ''.join(response)
+        return response_pattern(guess, target)
 
     def filter_candidates(
         self,
@@ -150,6 +251,18 @@ class LookaheadEngine:
         # Remove letters from bad list if they're actually in target
         bad_letters = [letter for letter in bad_letters if letter not in letters_in_target]
 
+        if (
+            np is not None
+            and len(candidates) >= VECTORIZE_MIN_CANDIDATES
+            and set(min_letter_counts).union(bad_letters) <= ALPHABET
+        ):
+            candidate_array = _encode_candidates(candidates)
+            if candidate_array is not None:
+                mask = _survivor_mask(
+                    candidate_array, pattern, known_letters, bad_letters, min_letter_counts
+                )
+                return [candidates[i] for i in np.flatnonzero(mask).tolist()]
+
         # Filter candidates
         filtered = []
         pattern_regex = ''.join(pattern)
@@ -203,7 +316,9 @@ class LookaheadEngine:
         word: str,
         candidates: List[str],
         depth: int,
-        strategy: str
+        strategy: str,
+        pattern_codes: Optional[List[int]] = None,
+        fingerprint: Optional[int] = None
     ) -> float:
         """
         Evaluate a single move by calculating expected guess count.
@@ -216,6 +331,9 @@ class LookaheadEngine:
             candidates: List of remaining candidate words
             depth: Remaining lookahead depth
             strategy: Strategy mode for outcome weighting
+            pattern_codes: Pattern code of word against each candidate, if
+                already computed
+            fingerprint: _fingerprint(candidates), if already computed
 
         Returns:
             Expected score (lower is better, represents expected guess count)
@@ -240,11 +358,13 @@ class LookaheadEngine:
             # Higher information gain = better position = lower expected guesses
             # We'll use a simple heuristic: more candidates = more guesses needed
             # Return log2 as an estimate of remaining guesses
-            import math
-            return 1.0 + math.log2(len(candidates))
+            n = len(candidates)
+            return 1.0 + (LOG2[n] if n < LOG2_TABLE_SIZE else math.log2(n))
 
         # Check cache
-        cache_key = (word, tuple(sorted(candidates)), depth, strategy)
+        if fingerprint is None:
+            fingerprint = _fingerprint(candidates)
+        cache_key = (word, len(candidates), fingerprint, depth, strategy)
         if cache_key in self._eval_cache:
             return self._eval_cache[cache_key]
 
@@ -253,12 +373,8 @@ class LookaheadEngine:
         if len(candidates) > self.PRUNING_THRESHOLD:
             effective_depth = max(1, depth - 1)
 
-        # Simulate all possible responses for this guess
-        response_partitions: Dict[str, List[str]] = defaultdict(list)
-
-        for candidate in candidates:
-            response = self.simulate_response(word, candidate)
-            response_partitions[response].append(candidate)
+        # Simulate all possible responses for this guess (keyed by pattern code)
+        response_partitions = self.info_gain_calc.group_by_pattern(word, candidates, pattern_codes)
 
         # Calculate expected score across all response scenarios
         total_candidates = len(candidates)
@@ -279,26 +395,31 @@ class LookaheadEngine:
                     best_next_score = float('inf')
                     # Limit evaluation to subset for performance
                     eval_candidates = partition_candidates[:20] if len(partition_candidates) > 20 else partition_candidates
+                    # Shared by every next word; pairs don't reach the cache
+                    partition_fingerprint = _fingerprint(partition_candidates) if partition_size > 2 else None
 
                     for next_word in eval_candidates:
                         next_score = self.evaluate_move(
                             next_word,
                             partition_candidates,
                             effective_depth - 1,
-                            strategy
+                            strategy,
+                            fingerprint=partition_fingerprint
                         )
                         best_next_score = min(best_next_score, next_score)
 
                     partition_score = 1.0 + best_next_score
                 else:
                     # No more depth, estimate remaining guesses
-                    import math
-                    partition_score = 1.0 + math.log2(partition_size)
+                    partition_score = 1.0 + (
+                        LOG2[partition_size] if partition_size < LOG2_TABLE_SIZE
+                        else math.log2(partition_size)
+                    )
 
             partition_scores.append((probability, partition_score, partition_size))
 
         # Apply strategy-based weighting
-        expected_score = self._weight_outcomes(partition_scores, strategy)
+        expected_score = OUTCOME_WEIGHTERS.get(strategy, _weight_balanced)(partition_scores)
 
         # Cache and return
         self._eval_cache[cache_key] = expected_score
@@ -319,23 +440,7 @@ class LookaheadEngine:
         Returns:
             Weighted expected score
         """
-        if strategy == "aggressive":
-            # Minimize average: equal weights (standard expected value)
-            return sum(prob * score for prob, score, _ in partition_scores)
-
-        elif strategy == "safe":
-            # Minimize worst-case: heavy weight on maximum partition
-            average = sum(prob * score for prob, score, _ in partition_scores)
-            max_score = max(score for _, score, _ in partition_scores)
-            # 70% weight on worst case, 30% on average
-            return 0.3 * average + 0.7 * max_score
-
-        else:  # balanced
-            # Compromise: moderate worst-case penalty
-            average = sum(prob * score for prob, score, _ in partition_scores)
-            max_score = max(score for _, score, _ in partition_scores)
-            # 60% average, 40% worst case
-            return 0.6 * average + 0.4 * max_score
+        return OUTCOME_WEIGHTERS.get(strategy, _weight_balanced)(partition_scores)
 
     def get_best_move(
         self,
@@ -371,17 +476,28 @@ class LookaheadEngine:
 
         # Evaluate all candidates (or a subset for performance)
         eval_candidates = candidates
+        pattern_codes: Dict[str, List[int]] = {}
         if len(candidates) > 50:
             # For large candidate sets, evaluate top candidates by information gain
+            cand_key = candidates_key(candidates)
+            ranked = candidates[:100]  # Limit initial evaluation
+            # One batch of patterns serves both the ranking (its gains are
+            # cached) and the partitions evaluated below
+            batch = self.info_gain_calc.batch_partition(ranked, candidates, cand_key)
+            if batch is not None:
+                pattern_codes = dict(zip(ranked, batch[1].tolist()))
             scored = [
-                (word, self.info_gain_calc.calculate_information_gain(word, candidates))
-                for word in candidates[:100]  # Limit initial evaluation
+                (word, self.info_gain_calc.calculate_information_gain(word, candidates, cand_key))
+                for word in ranked
             ]
             scored.sort(key=lambda x: x[1], reverse=True)
             eval_candidates = [word for word, _ in scored[:50]]
 
+        fingerprint = _fingerprint(candidates)
         for word in eval_candidates:
-            score = self.evaluate_move(word, candidates, depth, strategy)
+            score = self.evaluate_move(
+                word, candidates, depth, strategy, pattern_codes.get(word), fingerprint
+            )
             evaluation_tree[word] = score
 
             if score < best_score:
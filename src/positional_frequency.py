@@ -21,6 +21,15 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Optional faster JSON encoder/decoder for the cache file (its
+# JSONDecodeError subclasses json.JSONDecodeError)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
 
 class PositionalFrequencyScorer:
     """
@@ -107,8 +116,8 @@ class PositionalFrequencyScorer:
             return False
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                data = json_loads(f.read())
 
             # Validate cache structure
             if 'version' not in data or data['version'] != 'v1':
@@ -150,8 +159,15 @@ class PositionalFrequencyScorer:
                 'cached_at': time.time(),
             }
 
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Frequencies are keyed by int position, which orjson only
+            # accepts with OPT_NON_STR_KEYS
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data).encode('utf-8')
+
+            with open(self.cache_file, 'wb') as f:
+                f.write(payload)
 
             return True
 
@@ -282,6 +282,9 @@ class Wordlebot:
 
         # Initialize Elasticsearch client if enabled
         self.es_client: Optional[Elasticsearch] = None
+        # Whether the index stores per-letter lc_<letter> count fields;
+        # indices migrated before they existed only have letter_counts.*
+        self.es_letter_count_fields = True
         self._init_elasticsearch()
 
         # Initialize data containers
@@ -351,7 +354,11 @@ class Wordlebot:
                 return
 
             # Store the index name
-            self.es_index = es_config.get("index", "wordlebot-words-v2")
+            self.es_index = es_config.get("index", "wordlebot-words-v3")
+            self.es_letter_count_fields = self._es_has_letter_count_fields()
+            if not self.es_letter_count_fields and self.debug:
+                print(f"Index {self.es_index} predates lc_* letter count fields; "
+                      "using script filters (re-run scripts/migrate_to_elasticsearch.py to upgrade)")
 
             if self.debug:
                 print(f"Connected to Elasticsearch at {es_host}")
@@ -528,19 +535,32 @@ class Wordlebot:
         # Fallback to file (needed for client-side scoring when no cache/ES)
         coca_path = resolve_path(self.config["files"]["coca_frequency"])
         try:
+            data_format = self.config["data_format"]
             with open(coca_path, "r", encoding=self.config["defaults"]["file_encoding"]) as f:
-                reader = csv.DictReader(f, delimiter=self.config["data_format"]["csv_delimiter"])
-                word_col = self.config["data_format"]["coca_word_column"]
-                freq_col = self.config["data_format"]["coca_freq_column"]
+                reader = csv.reader(f, delimiter=data_format["csv_delimiter"])
+
+                # Resolve column positions once from the header, falling back
+                # to the configured indices if the names aren't present
+                header = next(reader)
+                word_col = data_format["coca_word_column"]
+                freq_col = data_format["coca_freq_column"]
+                word_index = (
+                    header.index(word_col) if word_col in header
+                    else data_format.get("coca_word_column_index", 1)
+                )
+                freq_index = (
+                    header.index(freq_col) if freq_col in header
+                    else data_format.get("coca_freq_column_index", 3)
+                )
 
+                frequencies = self.word_frequencies
                 for row in reader:
-                    word = row[word_col].strip().lower()
-                    if len(word) == 5:
-                        try:
-                            freq = int(row[freq_col])
-                            self.word_frequencies[word] = freq
-                        except (ValueError, KeyError):
-                            continue
+                    try:
+                        word = row[word_index].strip().lower()
+                        if len(word) == 5:
+                            frequencies[word] = int(row[freq_index])
+                    except (ValueError, IndexError):
+                        continue
 
             if self.debug:
                 print(f"Loaded {len(self.word_frequencies)} COCA frequencies from file")
@@ -715,6 +735,17 @@ class Wordlebot:
 
         return candidates
 
+    def _es_has_letter_count_fields(self) -> bool:
+        """Check whether the ES index mapping has the lc_<letter> count fields."""
+        try:
+            mappings = self.es_client.indices.get_mapping(index=self.es_index)
+            return any(
+                "lc_a" in index_mapping.get("mappings", {}).get("properties", {})
+                for index_mapping in mappings.values()
+            )
+        except Exception:
+            return False
+
     def _build_es_query(self) -> Dict[str, Any]:
         """Build Elasticsearch query from current game state."""
         must_clauses = []
@@ -739,22 +770,38 @@ class Wordlebot:
             if self.min_letter_counts.get(letter, 0) == 0:
                 must_not_clauses.append({"term": {"letters": letter}})
 
-        # Minimum letter counts: use script query for complex constraints
-        # This handles cases where a letter appears multiple times
+        # Letter count constraints: each word stores lc_<letter> counts
+        # (0 when absent), so duplicates are plain range filters
+        filter_clauses: List[Dict[str, Any]] = []
+        # Older indices only have a sparse letter_counts object, checked by script
         script_conditions = []
 
         for letter, min_count in self.min_letter_counts.items():
             if min_count > 1:
-                # Need script to check letter_counts field
+                if self.es_letter_count_fields:
+                    filter_clauses.append({"range": {f"lc_{letter}": {"gte": min_count}}})
+                else:
+                    script_conditions.append(
+                        f"(doc['letter_counts.{letter}'].size() > 0 && doc['letter_counts.{letter}'].value >= {min_count})"
+                    )
+
+        for letter, max_count in self.max_letter_counts.items():
+            if self.es_letter_count_fields:
+                filter_clauses.append({"range": {f"lc_{letter}": {"lte": max_count}}})
+            else:
                 script_conditions.append(
-                    f"(doc['letter_counts.{letter}'].size() > 0 && doc['letter_counts.{letter}'].value >= {min_count})"
+                    f"(doc['letter_counts.{letter}'].size() == 0 || doc['letter_counts.{letter}'].value <= {max_count})"
                 )
 
-        for letter, max_count in self.max_letter_counts.items():
-            # Check that letter count doesn't exceed max
-            script_conditions.append(
-                f"(doc['letter_counts.{letter}'].size() == 0 || doc['letter_counts.{letter}'].value <= {max_count})"
-            )
+        if script_conditions:
+            filter_clauses.append({
+                "script": {
+                    "script": {
+                        "source": " && ".join(script_conditions),
+                        "lang": "painless"
+                    }
+                }
+            })
 
         # Build the query
         query: Dict[str, Any] = {"bool": {}}
@@ -763,20 +810,8 @@ class Wordlebot:
             query["bool"]["must"] = must_clauses
         if must_not_clauses:
             query["bool"]["must_not"] = must_not_clauses
-
-        # Add script filter for complex count constraints
-        if script_conditions:
-            script_source = " && ".join(script_conditions)
-            if "filter" not in query["bool"]:
-                query["bool"]["filter"] = []
-            query["bool"]["filter"].append({
-                "script": {
-                    "script": {
-                        "source": script_source,
-                        "lang": "painless"
-                    }
-                }
-            })
+        if filter_clauses:
+            query["bool"]["filter"] = filter_clauses
 
         # If no constraints, match all
         if not query["bool"]:
@@ -1088,7 +1123,7 @@ def main() -> None:
     if args.ai:
         try:
             # Import AI modules only when AI mode is enabled
-            from information_gain import InformationGainCalculator
+            from information_gain import InformationGainCalculator, candidates_key
             from claude_strategy import ClaudeStrategy
             from lookahead_engine import LookaheadEngine
             from strategy_mode import StrategyMode
@@ -1116,7 +1151,10 @@ def main() -> None:
             performance_logger.set_strategy_mode(str(strategy_mode))
 
             # Initialize AI components
-            info_gain_calc = InformationGainCalculator()
+            info_gain_cache = wb.config.get('ai', {}).get('info_gain_cache_file')
+            info_gain_calc = InformationGainCalculator(
+                cache_file=Path(resolve_path(info_gain_cache)) if info_gain_cache else None
+            )
             claude_strategy = ClaudeStrategy(wb.config, performance_logger=performance_logger)
             lookahead_engine = LookaheadEngine(
                 lookahead_depth=lookahead_depth,
@@ -1185,6 +1223,7 @@ def main() -> None:
                                 print("Warning: Failed to cache optimal first guess to .env")
 
                     # Rejection loop for first guess
+                    wordlist_key = candidates_key(wb.wordlist)
                     rejected_words: Set[str] = set()
                     first_guess_info_gains: Dict[str, float] = {}
                     guess = None
@@ -1195,7 +1234,7 @@ def main() -> None:
                             ai_recommended = optimal_first
                             if optimal_first not in first_guess_info_gains:
                                 first_guess_info_gains[optimal_first] = info_gain_calc.calculate_information_gain(
-                                    optimal_first, wb.wordlist
+                                    optimal_first, wb.wordlist, wordlist_key
                                 )
                             recommended_info_gain = first_guess_info_gains[optimal_first]
                             highlighted_word = f"{Colors.HIGHLIGHT}{ai_recommended.upper()}{Colors.RESET}"
@@ -1212,7 +1251,7 @@ def main() -> None:
                                 for word in sorted_by_score[:100]:
                                     if word not in first_guess_info_gains:
                                         first_guess_info_gains[word] = info_gain_calc.calculate_information_gain(
-                                            word, wb.wordlist
+                                            word, wb.wordlist, wordlist_key
                                         )
 
                             # Get best available option
@@ -1315,9 +1354,10 @@ def main() -> None:
                         words_to_evaluate = list(words_to_evaluate_set)
                         print(f"Insight mode: Calculating information gain for {len(words_to_evaluate)} words...", flush=True)
 
+                        current_key = candidates_key(current_candidates)
                         for idx, word in enumerate(words_to_evaluate):
                             info_gains[word] = info_gain_calc.calculate_information_gain(
-                                word, current_candidates
+                                word, current_candidates, current_key
                             )
                             # Track if this word is NOT a valid candidate (insight-only)
                             if word not in current_candidates:
@@ -1329,9 +1369,10 @@ def main() -> None:
                         candidates_to_evaluate = current_candidates[:50]  # Limit for performance
                         print(f"Calculating information gain for top {len(candidates_to_evaluate)} candidates...", flush=True)
 
+                        current_key = candidates_key(current_candidates)
                         for idx, candidate in enumerate(candidates_to_evaluate):
                             info_gains[candidate] = info_gain_calc.calculate_information_gain(
-                                candidate, current_candidates
+                                candidate, current_candidates, current_key
                             )
                             # Show progress for larger candidate sets
                             if len(candidates_to_evaluate) > 10 and (idx + 1) % 10 == 0:
@@ -1372,13 +1413,16 @@ def main() -> None:
                                 top_words_for_claude = [w for w, _ in sorted_by_info_gain[:20]]
                                 recommendation = claude_strategy.recommend_guess(
                                     game_state=game_state,
-                                    candidates=current_candidates[:20],  # Actual valid candidates
+                                    candidates=current_candidates,  # Actual valid candidates (top ones are listed)
                                     info_gains=info_gains,
                                     strategy_mode=str(strategy_mode),
                                     debug=args.debug,
                                     insight_mode=insight_mode,
                                     insight_words=insight_words,
-                                    top_suggestions=top_words_for_claude if insight_mode else None
+                                    top_suggestions=top_words_for_claude if insight_mode else None,
+                                    # Normal mode only shows the word, so
+                                    # don't wait for the reasoning
+                                    word_only=not verbose
                                 )
 
                                 # Display AI recommendation
@@ -1533,6 +1577,9 @@ def main() -> None:
                 import traceback
                 print(traceback.format_exc())
 
+    if ai_components:
+        ai_components['claude_strategy'].close()
+
 
 if __name__ == "__main__":
     main()
@@ -7,11 +7,14 @@ Focused tests covering critical API interaction paths:
 - Error handling for malformed responses
 - Retry logic with simulated failures
 """
+import asyncio
 import json
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 from pathlib import Path
 import sys
+import tempfile
+import threading
 import time
 
 # Add parent directory to path to import modules
@@ -136,6 +139,20 @@ class TestClaudeStrategy(unittest.TestCase):
         parsed = strategy.parse_response(mock_response)
         self.assertIsNone(parsed)
 
+        # Test with a word that isn't five letters
+        mock_response.content = [Mock(text='{"word": "cranes", "reasoning": "Too long"}')]
+        parsed = strategy.parse_response(mock_response)
+        self.assertIsNone(parsed)
+
+        # Test that mistyped optional fields fall back to defaults
+        mock_response.content = [Mock(
+            text='{"word": "CRANE", "info_gain": "high", "alternatives": ["crate", {"word": "slate"}]}'
+        )]
+        parsed = strategy.parse_response(mock_response)
+        self.assertEqual(parsed['word'], 'crane')
+        self.assertEqual(parsed['info_gain'], 0.0)
+        self.assertEqual(parsed['alternatives'], [{'word': 'slate'}])
+
     @patch('claude_strategy.Anthropic')
     @patch('claude_strategy.load_dotenv')
     @patch('claude_strategy.os.getenv')
@@ -225,6 +242,33 @@ class TestClaudeStrategy(unittest.TestCase):
         # Verify exponential backoff was called (2 times: after attempt 1 and 2, but not after attempt 3)
         self.assertEqual(mock_sleep.call_count, 2)
 
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    @patch('claude_strategy.time.sleep')
+    def test_client_errors_are_not_retried(self, mock_sleep, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test that a non-retryable 4xx (e.g. bad API key) fails without backoff"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+
+        from anthropic import AuthenticationError
+        mock_client.messages.create.side_effect = AuthenticationError(
+            "Invalid API key", response=Mock(status_code=401, headers={}), body=None
+        )
+
+        strategy = ClaudeStrategy(self.mock_config)
+        result = strategy.call_api("test prompt")
+
+        self.assertIsNone(result)
+        self.assertEqual(mock_client.messages.create.call_count, 1)
+        mock_sleep.assert_not_called()
+
     @patch('claude_strategy.Anthropic')
     @patch('claude_strategy.load_dotenv')
     @patch('claude_strategy.os.getenv')
@@ -296,6 +340,322 @@ class TestClaudeStrategy(unittest.TestCase):
         self.assertIn(strategy_mode, prompt.lower())
         self.assertIn('json', prompt.lower())
 
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    def test_recommend_guess_batch_single_call(self, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test that batched decisions share one API call and come back in order"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+
+        # Decisions returned out of order, second one garbled
+        mock_response = Mock()
+        mock_response.content = [Mock(text=json.dumps({"decisions": [
+            {"id": 2, "word": "slate", "reasoning": "third"},
+            {"id": 1, "reasoning": "missing word"},
+            {"id": 0, "word": "crane", "reasoning": "first", "info_gain": 5.2},
+        ]}))]
+        mock_response.usage = Mock(input_tokens=300, output_tokens=90)
+        mock_client.messages.create.return_value = mock_response
+
+        strategy = ClaudeStrategy(self.mock_config)
+
+        game_state = {
+            'pattern': ['.'] * 5,
+            'known_letters': {},
+            'bad_letters': [],
+            'min_letter_counts': {},
+            'guess_number': 1,
+        }
+        query = {
+            'game_state': game_state,
+            'candidates': ['crane', 'slate'],
+            'info_gains': {'crane': 5.2, 'slate': 5.1},
+            'strategy_mode': 'balanced',
+        }
+
+        results = strategy.recommend_guess_batch([query, query, query])
+
+        self.assertEqual(mock_client.messages.create.call_count, 1)
+        self.assertEqual(results[0]['word'], 'crane')
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]['word'], 'slate')
+
+        prompt = mock_client.messages.create.call_args.kwargs['messages'][0]['content']
+        self.assertIn('Decision 2', prompt)
+        self.assertIn('decisions', prompt)
+
+    @patch('claude_strategy.AsyncAnthropic')
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    def test_recommend_guess_many_runs_concurrently(
+        self, mock_getenv, mock_dotenv, mock_anthropic_class, mock_async_anthropic_class
+    ):
+        """Test that async recommendations are issued together and returned in order"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            word = 'crane' if 'crane: 5.20' in kwargs['messages'][0]['content'] else 'slate'
+            response = Mock()
+            response.content = [Mock(text=json.dumps({"word": word}))]
+            response.usage = Mock(input_tokens=100, output_tokens=20)
+            return response
+
+        mock_aclient = Mock()
+        mock_aclient.messages.create = create
+        mock_async_anthropic_class.return_value = mock_aclient
+
+        strategy = ClaudeStrategy(self.mock_config)
+
+        game_state = {
+            'pattern': ['.'] * 5,
+            'known_letters': {},
+            'bad_letters': [],
+            'min_letter_counts': {},
+            'guess_number': 1,
+        }
+        queries = [
+            {'game_state': game_state, 'candidates': ['crane', 'slate'],
+             'info_gains': {'crane': 5.2, 'slate': 5.1}, 'strategy_mode': 'balanced'},
+            {'game_state': game_state, 'candidates': ['crane', 'slate'],
+             'info_gains': {'crane': 4.9, 'slate': 5.1}, 'strategy_mode': 'safe'},
+        ]
+
+        results = asyncio.run(strategy.recommend_guess_many(queries))
+
+        self.assertEqual([r['word'] for r in results], ['crane', 'slate'])
+        self.assertEqual(max_in_flight, 2)
+        self.assertEqual(strategy.get_metrics()['api_calls'], 2)
+
+        # Repeat decisions are answered from the cache shared with recommend_guess
+        self.assertEqual(strategy.recommend_guess(**queries[0])['word'], 'crane')
+        results = asyncio.run(strategy.recommend_guess_many(queries))
+        self.assertEqual([r['word'] for r in results], ['crane', 'slate'])
+        self.assertEqual(strategy.get_metrics()['api_calls'], 2)
+
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    def test_recommendation_cache_skips_repeat_calls(self, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test that identical decisions are served from the (persisted) recommendation cache"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"word": "crane", "reasoning": "test", "info_gain": 5.0}')]
+        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
+        mock_client.messages.create.return_value = mock_response
+
+        game_state = {
+            'pattern': ['.'] * 5,
+            'known_letters': {},
+            'bad_letters': [],
+            'min_letter_counts': {},
+            'guess_number': 1,
+        }
+        args = (game_state, ['crane', 'slate'], {'crane': 5.0, 'slate': 4.9}, 'balanced')
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = dict(self.mock_config)
+            config['ai'] = dict(config['ai'], cache={
+                'recommendations_file': str(Path(tmp_dir) / 'recommendations.json'),
+            })
+
+            strategy = ClaudeStrategy(config)
+            first = strategy.recommend_guess(*args)
+            second = strategy.recommend_guess(*args)
+
+            self.assertEqual(first, second)
+            self.assertEqual(mock_client.messages.create.call_count, 1)
+
+            # Static instructions go in a prompt-cached system block
+            system = mock_client.messages.create.call_args.kwargs['system']
+            self.assertEqual(system[0]['cache_control'], {'type': 'ephemeral'})
+            self.assertEqual(strategy.get_metrics()['cache_hits'], 1)
+
+            # A new instance picks the recommendation up from disk
+            restored = ClaudeStrategy(config).recommend_guess(*args)
+            self.assertEqual(restored['word'], 'crane')
+            self.assertEqual(mock_client.messages.create.call_count, 1)
+
+            # A different strategy mode is a different prompt
+            strategy.recommend_guess(*args[:3], 'safe')
+            self.assertEqual(mock_client.messages.create.call_count, 2)
+
+
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    @patch('claude_strategy.time.sleep')
+    def test_streamed_word_retries_and_is_cached(self, mock_sleep, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test word-only recommendations retry a failed stream and cache the full result"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+
+        text = '{"word": "crane", "reasoning": "test", "info_gain": 5.0}'
+        final_message = Mock()
+        final_message.content = [Mock(text=text)]
+        final_message.usage = Mock(input_tokens=100, output_tokens=50)
+        stream = MagicMock()
+        stream.__enter__.return_value.text_stream = [text[:12], text[12:30], text[30:]]
+        stream.__enter__.return_value.get_final_message.return_value = final_message
+
+        # First attempt fails before any text arrives, second succeeds
+        mock_client.messages.stream.side_effect = [ConnectionError("connection reset"), stream]
+
+        strategy = ClaudeStrategy(self.mock_config)
+        game_state = {
+            'pattern': ['.'] * 5,
+            'known_letters': {},
+            'bad_letters': [],
+            'min_letter_counts': {},
+            'guess_number': 1,
+        }
+        args = (game_state, ['crane', 'slate'], {'crane': 5.0, 'slate': 4.9}, 'balanced')
+
+        result = strategy.recommend_guess(*args, word_only=True)
+
+        self.assertEqual(result['word'], 'crane')
+        self.assertEqual(mock_client.messages.stream.call_count, 2)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+        # The background thread stores the full recommendation once the
+        # stream has been read
+        # (time.sleep is patched, so wait on an Event instead)
+        deadline = time.monotonic() + 5
+        while not strategy._recommendation_cache and time.monotonic() < deadline:
+            threading.Event().wait(0.01)
+        cached = strategy.recommend_guess(*args, word_only=True)
+        self.assertEqual(cached['reasoning'], 'test')
+        self.assertEqual(mock_client.messages.stream.call_count, 2)
+
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    def test_bulk_timeout_keeps_finished_results(self, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test a timed-out message batch is cancelled but finished decisions are kept"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+        batches = mock_client.messages.batches
+        batches.create.return_value = Mock(id='batch-1', processing_status='in_progress')
+        # Cancelling takes a poll to finish; results exist only once it has ended
+        batches.retrieve.side_effect = [
+            Mock(id='batch-1', processing_status='canceling'),
+            Mock(id='batch-1', processing_status='ended'),
+        ]
+
+        message = Mock()
+        message.content = [Mock(text='{"word": "slate", "reasoning": "test", "info_gain": 4.9}')]
+        message.usage = Mock(input_tokens=100, output_tokens=50)
+        finished = Mock(custom_id='decision-1')
+        finished.result.type = 'succeeded'
+        finished.result.message = message
+        cancelled = Mock(custom_id='decision-0')
+        cancelled.result.type = 'canceled'
+        batches.results.return_value = [cancelled, finished]
+
+        config = json.loads(json.dumps(self.mock_config))
+        config['ai']['api'].update({
+            'use_batch': True,
+            'batch_timeout_seconds': 0,
+            'batch_poll_seconds': 0,
+        })
+        strategy = ClaudeStrategy(config)
+        query = {
+            'game_state': {
+                'pattern': ['.'] * 5,
+                'known_letters': {},
+                'bad_letters': [],
+                'min_letter_counts': {},
+                'guess_number': 1,
+            },
+            'candidates': ['crane', 'slate'],
+            'info_gains': {'crane': 5.0, 'slate': 4.9},
+            'strategy_mode': 'balanced',
+        }
+
+        results = strategy.recommend_guess_bulk([query, query])
+
+        batches.cancel.assert_called_once_with('batch-1')
+        self.assertEqual(batches.retrieve.call_count, 2)
+        batches.results.assert_called_once_with('batch-1')
+        self.assertIsNone(results[0])
+        self.assertEqual(results[1]['word'], 'slate')
+
+        # A batch that never finishes cancelling has no results to read
+        batches.reset_mock()
+        batches.retrieve.side_effect = None
+        batches.retrieve.return_value = Mock(id='batch-1', processing_status='canceling')
+        strategy.batch_cancel_wait = 0
+
+        self.assertEqual(strategy.recommend_guess_bulk([query, query]), [None, None])
+        batches.results.assert_not_called()
+
+    @patch('claude_strategy.Anthropic')
+    @patch('claude_strategy.load_dotenv')
+    @patch('claude_strategy.os.getenv')
+    def test_obvious_choices_skip_the_api(self, mock_getenv, mock_dotenv, mock_anthropic_class):
+        """Test that a lone candidate or a clear info-gain leader is chosen locally"""
+        # Mock environment variables
+        mock_getenv.side_effect = lambda key, default=None: {
+            'ANTHROPIC_API_KEY': 'test-key',
+            'CLAUDE_MODEL': 'claude-3-5-sonnet-20241022'
+        }.get(key, default)
+
+        mock_client = Mock()
+        mock_anthropic_class.return_value = mock_client
+
+        strategy = ClaudeStrategy(self.mock_config)
+        game_state = {'pattern': ['.'] * 5, 'bad_letters': [], 'min_letter_counts': {}}
+
+        result = strategy.recommend_guess(game_state, ['crane'], {'crane': 0.0}, 'balanced')
+        self.assertEqual(result['word'], 'crane')
+
+        result = strategy.recommend_guess(
+            game_state, ['crane', 'slate'], {'crane': 5.2, 'slate': 3.1}, 'balanced'
+        )
+        self.assertEqual(result['word'], 'crane')
+        self.assertEqual(result['info_gain'], 5.2)
+
+        mock_client.messages.create.assert_not_called()
+        self.assertEqual(strategy.get_metrics()['fast_path_skips'], 2)
 
 if __name__ == '__main__':
     unittest.main()
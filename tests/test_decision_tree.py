@@ -0,0 +1,133 @@
+"""
+Tests for DecisionTree class
+
+Focused tests covering pre-computation and persistence:
+- Binary cache round-trip and rejection of damaged files
+- Second-guess lookup by first response pattern
+- Pattern matrix and per-candidate-set precompute paths agree
+- Loading legacy JSON caches
+"""
+import json
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from src import decision_tree
+from src.decision_tree import ALL_PATTERNS, BINARY_HEADER, BINARY_RECORD, DecisionTree
+
+
+# Enough solutions for both precompute phases, with repeated letters
+SOLUTIONS = [a + b + c + "e" + d for a in "bcs" for b in "aer" for c in "nte" for d in "ert"]
+VOCABULARY = SOLUTIONS + ["crane", "slate", "tenet", "eerie", "abbey", "sweet"]
+
+
+def precomputed_tree(cache_file: Optional[Path] = None) -> DecisionTree:
+    """Build a depth-2 tree over the sample word lists."""
+    tree = DecisionTree(cache_file=cache_file)
+    tree.precompute(SOLUTIONS, VOCABULARY, depth=2, show_progress=False)
+    return tree
+
+
+class TestDecisionTree:
+    """Test suite for decision tree precomputation and lookups"""
+
+    def test_binary_cache_round_trip(self, tmp_path: Path):
+        """Test a saved tree loads back unchanged from the binary cache"""
+        cache_file = tmp_path / "decision_tree.json"
+        tree = precomputed_tree(cache_file)
+        assert tree.binary_cache_file.exists(), "Precompute should save a binary cache"
+        assert not cache_file.exists(), "No JSON cache should be written"
+
+        loaded = DecisionTree(cache_file=cache_file)
+
+        assert loaded.is_ready()
+        assert loaded.tree == tree.tree
+
+    def test_damaged_binary_cache_is_rejected(self, tmp_path: Path):
+        """Test truncated or wrong-magic binary caches are ignored"""
+        cache_file = tmp_path / "decision_tree.json"
+        data = precomputed_tree(cache_file).binary_cache_file.read_bytes()
+        binary_file = cache_file.with_suffix(".bin")
+
+        for damaged in (
+            data[:-7],                       # cut inside the last record
+            data[:-2 * BINARY_RECORD.size],  # whole records missing
+            data[:BINARY_HEADER.size - 1],   # cut inside the header
+            b"XXXX" + data[4:],              # wrong magic
+        ):
+            binary_file.write_bytes(damaged)
+            assert not DecisionTree(cache_file=cache_file).is_ready()
+
+    def test_get_second_guess_for_known_pattern(self):
+        """Test second-guess lookup by the response to the first guess"""
+        tree = precomputed_tree()
+        first_guess = tree.get_first_guess()
+        assert first_guess in VOCABULARY
+
+        target = SOLUTIONS[0]
+        pattern = DecisionTree.generate_response_pattern(first_guess, target)
+        remaining = tree.filter_by_pattern(first_guess, pattern, SOLUTIONS)
+
+        second = tree.get_second_guess(pattern)
+
+        assert second is not None
+        assert second["remaining_count"] == len(remaining)
+        assert second["best_guess"] in VOCABULARY
+        assert tree.get_recommendation(2, [pattern]) == second["best_guess"]
+
+        # Patterns no solution produces, and malformed patterns, have no entry
+        unused = next(
+            p for p in ALL_PATTERNS
+            if not tree.filter_by_pattern(first_guess, p, SOLUTIONS)
+        )
+        assert tree.get_second_guess(unused) is None
+        assert tree.get_second_guess("GGGG") is None
+
+    def test_matrix_path_matches_per_candidate_path(self, monkeypatch):
+        """Test the pattern matrix precompute chooses the same guesses as the Python path"""
+        pytest.importorskip("numpy")
+        matrix_tree = precomputed_tree()
+
+        # Without an encoded vocabulary precompute scores each candidate set
+        monkeypatch.setattr(decision_tree, "encode_words", lambda words: None)
+        python_tree = precomputed_tree()
+
+        assert matrix_tree.get_first_guess() == python_tree.get_first_guess()
+        assert matrix_tree.get_first_guess_info_gain() == pytest.approx(
+            python_tree.get_first_guess_info_gain()
+        )
+        for pattern in ALL_PATTERNS:
+            expected = python_tree.get_second_guess(pattern)
+            actual = matrix_tree.get_second_guess(pattern)
+            if expected is None:
+                assert actual is None, f"No entry expected for {pattern}"
+                continue
+            assert actual["best_guess"] == expected["best_guess"], pattern
+            assert actual["remaining_count"] == expected["remaining_count"], pattern
+            assert actual["info_gain"] == pytest.approx(expected["info_gain"]), pattern
+
+    def test_legacy_json_cache_loads(self, tmp_path: Path):
+        """Test a JSON cache keyed by pattern string is still read"""
+        cache_file = tmp_path / "decision_tree.json"
+        entry = {"best_guess": "crane", "info_gain": 3.5, "remaining_count": 12}
+        cache_file.write_text(json.dumps({
+            "version": "v1",
+            "first_guess": "salet",
+            "first_guess_info_gain": 5.8,
+            "responses": {"XXXXX": entry},
+            "computed_at": 1700000000.0,
+            "computation_time": 42.0,
+            "solutions_count": 2315,
+        }))
+
+        tree = DecisionTree(cache_file=cache_file)
+
+        assert tree.get_first_guess() == "salet"
+        assert tree.get_second_guess("XXXXX") == entry
+        assert tree.get_second_guess("GGGGG") is None
+        assert len(tree.tree["responses"]) == len(ALL_PATTERNS)
+
+        # Other versions are ignored
+        cache_file.write_text(json.dumps({"version": "v0", "first_guess": "salet"}))
+        assert not DecisionTree(cache_file=cache_file).is_ready()
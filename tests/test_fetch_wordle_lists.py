@@ -0,0 +1,70 @@
+"""Tests for the Wordle word list fetch script"""
+import importlib.util
+import io
+import urllib.error
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "fetch_wordle_lists.py"
+spec = importlib.util.spec_from_file_location("fetch_wordle_lists", SCRIPT)
+fetch = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(fetch)
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal urlopen response: a byte stream with headers"""
+
+    def __init__(self, body: bytes, headers: dict):
+        super().__init__(body)
+        self.headers = headers
+
+
+class TestValidateWords:
+    """Test suite for validate_words"""
+
+    def test_keeps_five_letter_words_and_describes_the_rest(self):
+        """Test invalid words are rejected with the reason"""
+        valid, invalid = fetch.validate_words(["crane", "toolong", "ab1de", "slate"], "Test")
+
+        assert valid == ["crane", "slate"]
+        assert invalid == ["toolong (length=7)", "ab1de (non-alpha)"]
+
+
+class TestRemoveDuplicates:
+    """Test suite for remove_duplicates"""
+
+    def test_reports_overlap_and_repeats_separately(self, capsys):
+        """Test guesses that are solutions are counted apart from repeated guesses"""
+        solutions, guesses = fetch.remove_duplicates(
+            ["slate", "crane"],
+            ["crane", "abbey", "zesty", "abbey", "slate"],
+        )
+
+        assert solutions == ["crane", "slate"]
+        assert guesses == ["abbey", "zesty"]
+        output = capsys.readouterr().out
+        assert "Removed 2 duplicates from guess list" in output
+        assert "Removed 1 repeated words within guess list" in output
+
+
+class TestFetchUrl:
+    """Test suite for conditional GETs in fetch_url"""
+
+    def test_not_modified_uses_cached_copy(self, tmp_path, monkeypatch):
+        """Test a 304 response returns the words cached from the previous download"""
+        monkeypatch.setattr(fetch, "HTTP_CACHE_DIR", tmp_path)
+        url = "https://example.com/words.txt"
+        requests = []
+
+        def urlopen(request, timeout=None):
+            requests.append(request)
+            if len(requests) == 1:
+                return FakeResponse(b"CRANE\nslate\n\n", {"ETag": '"v1"'})
+            raise urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+
+        monkeypatch.setattr(fetch.urllib.request, "urlopen", urlopen)
+
+        assert fetch.fetch_url(url) == ["crane", "slate"]
+        assert requests[0].get_header("If-none-match") is None
+
+        assert fetch.fetch_url(url) == ["crane", "slate"]
+        assert requests[1].get_header("If-none-match") == '"v1"'
@@ -9,10 +9,11 @@ Focused tests covering critical calculation paths:
 """
 import math
 from typing import Dict, List
+from unittest.mock import patch
 
 import pytest
 
-from src.information_gain import InformationGainCalculator
+from src.information_gain import InformationGainCalculator, candidates_key
 
 
 class TestInformationGainCalculator:
@@ -92,6 +93,20 @@ class TestInformationGainCalculator:
         # First call should have created cache entry
         assert cache_size_1 > 0, "Cache should have entries after first call"
 
+    def test_cache_is_keyed_on_candidate_contents(self, calculator: InformationGainCalculator):
+        """Test that equal candidate lists share cache entries and different ones don't"""
+        candidates = ["crane", "slate", "place", "trace", "brake"]
+
+        info_gain = calculator.calculate_information_gain("crane", candidates)
+        assert calculator.calculate_information_gain("crane", list(candidates)) == info_gain
+        assert len(calculator._cache) == 1, "An equal, rebuilt list should hit the cache"
+
+        # A different list, even one built in the same place, gets its own entry
+        other = calculator.calculate_information_gain("crane", ["crane", "crate", "grate"])
+        expected = InformationGainCalculator().calculate_information_gain("crane", ["crane", "crate", "grate"])
+        assert other == expected
+        assert len(calculator._cache) == 2
+
     def test_first_guess_optimization_returns_valid_word(self, calculator: InformationGainCalculator):
         """Test that first guess optimization returns a valid word from the wordlist"""
         # Use a small wordlist for performance
@@ -104,6 +119,57 @@ class TestInformationGainCalculator:
         assert best_guess.isalpha(), "Best guess should be alphabetic"
 
 
+    def test_score_guesses_matches_per_word_information_gain(self, calculator: InformationGainCalculator):
+        """Test batch scoring agrees with calculate_information_gain (vectorized when NumPy is available)"""
+        # Enough candidates to take the vectorized path, with repeated letters
+        candidates = [a + b + c + "e" + d for a in "bcs" for b in "aer" for c in "nte" for d in "ert"]
+        guesses = ["crane", "eerie", "speed", "tepee", "abbey", "stare"]
+
+        scores = calculator.score_guesses(guesses, candidates)
+
+        for word, score in zip(guesses, scores):
+            # Reference value from the Python partitions
+            n = len(candidates)
+            partitions = calculator.calculate_partitions(word, candidates)
+            expected = math.log2(n) - sum(
+                len(group) / n * math.log2(len(group)) for group in partitions.values()
+            )
+            assert abs(score - expected) < 1e-9, f"Batch score for {word} should match"
+            single = InformationGainCalculator().calculate_information_gain(word, candidates)
+            assert abs(single - expected) < 1e-9, f"Single score for {word} should match"
+
+    def test_score_guesses_keys_small_candidate_lists_once(self, calculator: InformationGainCalculator):
+        """Test per-word scoring hashes the candidate list once, not once per guess"""
+        candidates = ["crane", "slate", "trace", "stare", "snare"]
+        guesses = ["crane", "slate", "place", "brake"]
+
+        with patch("src.information_gain.candidates_key", wraps=candidates_key) as key:
+            scores = calculator.score_guesses(guesses, candidates)
+
+        assert key.call_count == 1
+        assert scores == [calculator.calculate_information_gain(word, candidates) for word in guesses]
+
+    def test_batch_partition_matches_per_word_partitions(self, calculator: InformationGainCalculator):
+        """Test batch partition sizes and codes agree with the per-word methods"""
+        candidates = [a + b + c + "e" + d for a in "bcs" for b in "aer" for c in "nte" for d in "ert"]
+        guesses = ["crane", "eerie", "speed", "tepee", "abbey", "stare"]
+
+        batch = calculator.batch_partition(guesses, candidates)
+        if batch is None:
+            pytest.skip("NumPy not installed")
+        counts, codes = batch
+
+        for word, row_counts, row_codes in zip(guesses, counts, codes):
+            assert list(row_counts) == list(calculator.calculate_partition_counts(word, candidates))
+            assert (
+                calculator.group_by_pattern(word, candidates, row_codes.tolist())
+                == calculator.group_by_pattern(word, candidates)
+            )
+            # Gains were cached along the way
+            expected = InformationGainCalculator().calculate_information_gain(word, candidates)
+            assert calculator.calculate_information_gain(word, candidates) == expected
+
+
 class TestInformationGainEdgeCases:
     """Edge case tests for InformationGainCalculator"""
 
@@ -206,6 +272,37 @@ class TestInformationGainEdgeCases:
         assert len(calculator._cache) == 0, "Cache should be empty after clear"
         assert calculator._first_guess_cache is None, "First guess cache should be cleared"
 
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test the cache is saved to and reloaded from cache_file"""
+        cache_file = tmp_path / "info_gain_cache.pkl"
+        candidates = ["crane", "slate", "place", "trace", "brake"]
+
+        first = InformationGainCalculator(cache_file=cache_file)
+        info_gain = first.calculate_information_gain("crane", candidates)
+        assert first.save_cache(), "Changed cache should be saved"
+        assert not first.save_cache(), "Unchanged cache should not be rewritten"
+
+        second = InformationGainCalculator(cache_file=cache_file)
+        assert second._cache == first._cache, "Saved entries should be reloaded"
+        assert second.calculate_information_gain("crane", list(candidates)) == info_gain
+
+        second.clear_cache()
+        assert not cache_file.exists(), "clear_cache should remove the saved copy"
+
+    def test_first_guess_pattern_matrix_is_saved(self, tmp_path):
+        """Test first guess uses a pattern matrix saved next to cache_file"""
+        wordlist = ["crane", "slate", "place", "trace", "brake", "stare", "snare"]
+        expected = InformationGainCalculator().get_best_first_guess(wordlist)
+
+        first = InformationGainCalculator(cache_file=tmp_path / "info_gain_cache.pkl")
+        assert first.get_best_first_guess(wordlist) == expected
+        if first._load_or_build_pattern_matrix(wordlist, wordlist) is None:
+            pytest.skip("NumPy not installed")
+        assert len(list(tmp_path.glob("pattern_matrix_*.npz"))) == 1
+
+        second = InformationGainCalculator(cache_file=tmp_path / "info_gain_cache.pkl")
+        assert second.get_best_first_guess(wordlist) == expected
+
     def test_first_guess_caching(self, calculator: InformationGainCalculator):
         """Test that first guess is cached for same wordlist size"""
         wordlist = ["crane", "slate", "trace", "stare"]
@@ -237,6 +237,24 @@ class TestLookaheadEngineEdgeCases(unittest.TestCase):
         # All filtered based on constraints
         self.assertIsInstance(filtered, list)
 
+    def test_filter_candidates_large_list_matches_small_lists(self):
+        """Test the vectorized filter on a large list agrees with the per-word filter"""
+        engine = LookaheadEngine(
+            lookahead_depth=2,
+            strategy_mode="balanced",
+            info_gain_calculator=self.info_gain_calc
+        )
+
+        # Enough candidates to take the NumPy path, with repeated letters
+        candidates = [a + b + c + "e" + d for a in "bcs" for b in "aer" for c in "nte" for d in "ert"]
+        for guess, response in [("crane", "?R??e"), ("eerie", "??r?E"), ("sweet", "S?eE?")]:
+            filtered = engine.filter_candidates(guess, response, candidates)
+            # Lists this short are filtered word by word
+            expected = []
+            for start in range(0, len(candidates), 10):
+                expected += engine.filter_candidates(guess, response, candidates[start:start + 10])
+            self.assertEqual(filtered, expected, f"Filters should agree for {response}")
+
     def test_weight_outcomes_aggressive_uses_average(self):
         """Test aggressive strategy uses simple average"""
         engine = LookaheadEngine(
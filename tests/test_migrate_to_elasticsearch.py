@@ -0,0 +1,111 @@
+"""Tests for the Elasticsearch migration script's document building
+
+None of these need the elasticsearch client or a cluster.
+"""
+import importlib.util
+import json
+import string
+from pathlib import Path
+from unittest.mock import Mock
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "migrate_to_elasticsearch.py"
+spec = importlib.util.spec_from_file_location("migrate_to_elasticsearch", SCRIPT)
+migrate = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(migrate)
+
+
+class TestLoadWordlistFile:
+    """Test suite for load_wordlist_file"""
+
+    def test_skips_words_that_are_not_five_letters(self, tmp_path):
+        """Test words with punctuation or digits are dropped before indexing"""
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("crane\nnano-\nab1de\nSLATE\ntoolong\n")
+
+        words = migrate.load_wordlist_file(wordlist)
+
+        assert words == ["crane", "slate"]
+        # Every loaded word can be turned into a document
+        for word in words:
+            assert migrate.get_word_fields(word)["word"] == word
+
+    def test_missing_file_returns_empty_list(self, tmp_path):
+        """Test a missing word list loads as empty"""
+        assert migrate.load_wordlist_file(tmp_path / "missing.txt") == []
+
+
+class TestWordDocuments:
+    """Test suite for word-derived document fields"""
+
+    def test_word_fields(self):
+        """Test letters, letter mask and per-letter counts for a word"""
+        fields = migrate.get_word_fields("eerie")
+
+        assert [fields[f"p{i}"] for i in range(5)] == list("eerie")
+        assert fields["letters"] == ["e", "i", "r"]
+        assert fields["letters_mask"] == (1 << 4) | (1 << 8) | (1 << 17)
+        # Only letters in the word get counts here; the template holds zeros
+        assert {k: v for k, v in fields.items() if k.startswith("lc_")} == {
+            "lc_e": 3, "lc_i": 1, "lc_r": 1,
+        }
+
+    def test_word_source_has_every_letter_count(self):
+        """Test a document's _source carries all 26 lc_* fields and the frequency"""
+        source = migrate.generate_word_source("abbey", {"abbey": 1234})
+
+        assert source["freq"] == 1234
+        assert all(f"lc_{letter}" in source for letter in string.ascii_lowercase)
+        assert (source["lc_a"], source["lc_b"], source["lc_e"], source["lc_y"]) == (1, 2, 1, 1)
+        assert source["lc_z"] == 0
+        assert "is_solution" not in source
+
+    def test_index_mapping(self):
+        """Test the mapping declares the count fields and keeps them out of _source"""
+        mappings = migrate.get_index_mapping()["mappings"]
+        properties = mappings["properties"]
+
+        for letter in string.ascii_lowercase:
+            assert properties[f"lc_{letter}"] == {"type": "byte"}
+        assert properties["letters_mask"]["type"] == "long"
+        assert "is_solution" not in properties
+        assert mappings["_source"] == {"excludes": ["lc_*"]}
+
+
+class TestBulkBodies:
+    """Test suite for hand-built NDJSON bulk bodies"""
+
+    def test_ndjson_chunks_frame_and_split_documents(self, monkeypatch):
+        """Test each document gets an index action line and bodies respect the size limit"""
+        monkeypatch.setattr(migrate, "BULK_CHUNK_SIZE", 2)
+        docs = [
+            migrate.JSON_ENCODER.encode(migrate.generate_word_source(word, {}))
+            for word in ["crane", "slate", "abbey"]
+        ]
+
+        chunks = list(migrate.iter_ndjson_chunks(docs))
+
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        assert lines[0::2] == ['{"index":{}}'] * 3
+        assert [json.loads(line)["word"] for line in lines[1::2]] == ["crane", "slate", "abbey"]
+
+    def test_bulk_ndjson_reports_each_item(self):
+        """Test bulk bodies go to the target index and failed items are reported"""
+        client = Mock()
+        client.bulk.return_value = {"items": [
+            {"index": {"_id": "1", "status": 201}},
+            {"index": {"_id": "2", "status": 400, "error": {"type": "mapper_parsing_exception"}}},
+        ]}
+
+        docs = ['{"word":"crane"}', '{"word":"slate"}']
+
+        results = list(migrate.bulk_ndjson(client, "wordlebot-test", docs, serial=True))
+
+        assert [ok for ok, _ in results] == [True, False]
+        client.bulk.assert_called_once()
+        kwargs = client.bulk.call_args.kwargs
+        assert kwargs["index"] == "wordlebot-test"
+        assert kwargs["operations"] == (
+            b'{"index":{}}\n{"word":"crane"}\n'
+            b'{"index":{}}\n{"word":"slate"}\n'
+        )
@@ -469,6 +469,24 @@ class TestWordlebot:
             if len(word) > 2:
                 assert word[2] != 'a' or word.count('a') > 1
 
+    def test_build_es_query_letter_counts(self, mock_wordlebot):
+        """Test count constraints use lc_* ranges, or scripts on older indices"""
+        wb = mock_wordlebot
+        wb.min_letter_counts = {"e": 2}
+        wb.max_letter_counts = {"e": 2}
+
+        filters = wb._build_es_query()["bool"]["filter"]
+        assert {"range": {"lc_e": {"gte": 2}}} in filters
+        assert {"range": {"lc_e": {"lte": 2}}} in filters
+
+        # An index migrated before lc_* fields existed has none to range over
+        wb.es_letter_count_fields = False
+        filters = wb._build_es_query()["bool"]["filter"]
+        assert len(filters) == 1
+        source = filters[0]["script"]["script"]["source"]
+        assert "doc['letter_counts.e'].value >= 2" in source
+        assert "doc['letter_counts.e'].value <= 2" in source
+
     def test_score_word_uses_frequency(self, mock_wordlebot):
         """Test score_word returns COCA frequency-based score"""
         wb = mock_wordlebot